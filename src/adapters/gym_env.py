@@ -0,0 +1,375 @@
+# src/adapters/gym_env.py
+"""
+Векторное Gym-подобное окружение: K игр шагают в lockstep поверх BatchEngine.
+
+API в духе VecEnv:
+    env = TurnshockVecEnv(num_envs=64, cfg=GeneratorConfig(Path("configs")))
+    obs = env.reset()
+    obs, rewards, dones, infos = env.step(actions)
+
+Наблюдения — словарь заранее выделенных NumPy-массивов (перезаписываются
+на каждом шаге; сохраняйте копию, если нужно):
+  - "planes"       (K, N_PLANES, S, S) float32: препятствия, зона регена,
+                   свои/чужие юниты, доля HP, доля AP и по плоскости на
+                   каждый EffectType (сумма value на клетке юнита)
+  - "units"        (K, U, N_UNIT_FEATURES) float32: признаки слотов юнитов
+  - "ability_mask" (K, U, A) bool: какие способности слота можно начать сейчас
+
+Действия — int-тензор (K, U, 2): [индекс способности в profile.abilities
+(-1 — ничего не менять), клетка цели x * S + y]. Если в клетке стоит юнит,
+интент привязывается к нему (цель «едет» за юнитом), иначе — к клетке;
+способности по клетке (TargetType.POINT) всегда бьют в клетку.
+Управляется только команда team; соперник — скриптовый агент.
+S — сторона доски: берётся из первой игры, у всех сценариев потока она
+должна быть одинаковой (иначе ValueError).
+
+Законченные игры (победа или max_ticks) сразу заменяются новыми из
+generate_games; итог лежит в infos[g] ("winner", "truncated",
+"terminal_observation").
+
+Шаг целиком на массивах: действия разбираются в Orders BatchEngine без
+ActiveAction, наблюдения и награды читаются прямо из столбцов движка, а
+соперник NearestEnemyAgent посчитан векторно (nearest_enemy_orders).
+Объекты GameState нужны только новым играм: законченные за шаг игры
+заменяются пачкой (BatchEngine.reset_games). Другие соперники работают
+через act_batch по объектам (engine.states) и заметно медленнее.
+Замер — tools/bench_gym_env.py.
+
+Требует numpy (extra "fast").
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from agents.base import StateView
+from agents.scripted import NearestEnemyAgent
+from application.game_generator import GeneratorConfig, generate_games
+from application.services.simulation_runner import DEFAULT_MAX_TICKS, AgentFactory, game_seed
+from domain.constants import TeamId
+from domain.core.rng import GameRng
+from domain.core.state import GameState
+from domain.engine.vectorized import NO_ABILITY, NO_UNIT, TEAM_CODES, BatchEngine, Orders
+from domain.enums import EffectType, TargetType
+
+DEFAULT_MAX_UNITS = 16
+DEFAULT_MAX_ABILITIES = 8
+
+# плоскости наблюдения
+PLANE_OBSTACLE = 0
+PLANE_REGEN = 1
+PLANE_ALLY = 2
+PLANE_ENEMY = 3
+PLANE_HP = 4
+PLANE_AP = 5
+PLANE_EFFECTS = 6
+EFFECT_TYPES = tuple(EffectType)
+N_PLANES = PLANE_EFFECTS + len(EFFECT_TYPES)
+
+# признаки слота: alive, mine, x, y, hp, ap + суммы эффектов
+N_UNIT_FEATURES = 6 + len(EFFECT_TYPES)
+
+NO_OP = -1
+
+# награда: доля снятого врагу HP минус доля потерянного своего, ± за исход
+WIN_REWARD = 1.0
+
+# код EffectType → номер плоскости / признака эффекта
+_EFFECT_COLUMN = np.zeros(max(t.value for t in EFFECT_TYPES) + 1, dtype=np.int64)
+_EFFECT_COLUMN[[t.value for t in EFFECT_TYPES]] = np.arange(len(EFFECT_TYPES))
+
+
+def nearest_enemy_orders(
+    engine: BatchEngine,
+    team_code: int,
+    strongest: np.ndarray,
+    orders: Orders,
+) -> None:
+    """
+    NearestEnemyAgent на столбцах BatchEngine: каждый живой юнит команды
+    team_code без текущего действия бьёт ближайшего (дистанция, id) живого
+    врага своей strongest[g, u] (id способности в engine.abilities,
+    NO_ABILITY — атаковать нечем). Пишет в orders только эти слоты.
+    """
+    alive = engine.present & (engine.hp > 0) & engine.running[:, None]
+    ours = engine.team == team_code
+    idle = alive & ours & (engine.act_ability == NO_ABILITY) & (strongest != NO_ABILITY)
+    gs = np.flatnonzero(idle.any(axis=1))
+    if not gs.size:
+        return
+    x, y = engine.pos_x[gs], engine.pos_y[gs]
+    dist = np.maximum(np.abs(x[:, :, None] - x[:, None, :]), np.abs(y[:, :, None] - y[:, None, :]))
+    enemy = (alive & ~ours)[gs]
+    U = engine.n_units
+    key = np.where(enemy[:, None, :], dist * (U + 1) + engine.id_rank[gs][:, None, :], np.iinfo(np.int32).max)
+    target = key.argmin(axis=-1)
+    gi, si = np.nonzero(idle[gs] & enemy.any(axis=1)[:, None])
+    g, tj = gs[gi], target[gi, si]
+    orders.ability[g, si] = strongest[g, si]
+    orders.target_x[g, si] = engine.pos_x[g, tj]
+    orders.target_y[g, si] = engine.pos_y[g, tj]
+    orders.target_slot[g, si] = tj
+
+
+# агент-соперник → его векторная версия (точный тип: у подклассов своё поведение)
+ArrayOpponent = Callable[[BatchEngine, int, np.ndarray, Orders], None]
+ARRAY_OPPONENTS: Dict[type, ArrayOpponent] = {NearestEnemyAgent: nearest_enemy_orders}
+
+
+class TurnshockVecEnv:
+    """K игр в lockstep; см. описание модуля."""
+
+    def __init__(
+        self,
+        num_envs: int,
+        cfg: GeneratorConfig,
+        team: TeamId = "A",
+        opponent: AgentFactory = NearestEnemyAgent,
+        max_ticks: int = DEFAULT_MAX_TICKS,
+        max_units: int = DEFAULT_MAX_UNITS,
+        max_abilities: int = DEFAULT_MAX_ABILITIES,
+        seed: int = 0,
+    ) -> None:
+        if not cfg.loop:
+            raise ValueError("TurnshockVecEnv needs an endless game stream (cfg.loop=True)")
+        self.num_envs = num_envs
+        self.team = team
+        self.max_ticks = max_ticks
+        self.max_units = max_units
+        self.max_abilities = max_abilities
+
+        self._games: Iterator[GameState] = generate_games(cfg, count=-1)
+        self._seed = seed
+        self._played = 0
+        self.board_size = 0
+
+        self.opponent_team: TeamId = next(t for t in TEAM_CODES if t != team)
+        self.opponent = opponent(self.opponent_team)
+        self._array_opponent: Optional[ArrayOpponent] = ARRAY_OPPONENTS.get(type(self.opponent))
+        self._team_code = TEAM_CODES[team]
+
+        games = [self._next_game() for _ in range(num_envs)]
+        K, U, A, S = num_envs, max_units, max_abilities, self.board_size
+        self.engine = BatchEngine(games, n_units=U)
+
+        # статичные за игру столбцы (плоскости карты — прямо в obs["planes"])
+        self._mine = np.zeros((K, U), dtype=bool)
+        # id способностей профиля в engine.abilities (NO_ABILITY — нет такой)
+        self._ability_ids = np.full((K, U, A), NO_ABILITY, dtype=np.int32)
+        self._cost = np.zeros((K, U, A), dtype=np.int32)
+        # способность бьёт по клетке (TargetType.POINT), а не по юниту на ней
+        self._point = np.zeros((K, U, A), dtype=bool)
+        # самая сильная атака соперника (strongest_attack) — для nearest_enemy_orders
+        self._strongest = np.full((K, U), NO_ABILITY, dtype=np.int32)
+        self._start_tick = np.zeros(K, dtype=np.int64)
+        self._hp_frac = np.zeros((K, 2), dtype=np.float32)
+
+        # буферы наблюдения и шага
+        self.obs: Dict[str, np.ndarray] = {
+            "planes": np.zeros((K, N_PLANES, S, S), dtype=np.float32),
+            "units": np.zeros((K, U, N_UNIT_FEATURES), dtype=np.float32),
+            "ability_mask": np.zeros((K, U, A), dtype=bool),
+        }
+        self.rewards = np.zeros(K, dtype=np.float32)
+        self.dones = np.zeros(K, dtype=bool)
+        self._orders = Orders.empty(K, U)
+
+        self._load_static(np.arange(K))
+        self._fill()
+
+    @property
+    def has_ability(self) -> np.ndarray:
+        """(K, U, A) bool: у слота есть способность с этим индексом."""
+        return self._ability_ids != NO_ABILITY
+
+    # ─── public API ─────────────────────────────────────────────────
+
+    def reset(self) -> Dict[str, np.ndarray]:
+        """Все K игр заменяются новыми."""
+        self._reset_games(np.arange(self.num_envs))
+        self._fill()
+        return self.obs
+
+    def step(self, actions: np.ndarray) -> tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """Один тик во всех K играх; законченные игры сразу перезапускаются."""
+        orders = self._decode(np.asarray(actions))
+        self._opponent_orders(orders)
+
+        _, finished = self.engine.step(orders)
+        ticks = self.engine.tick - self._start_tick
+        truncated = ~finished & (ticks >= self.max_ticks)
+        dones = finished | truncated
+
+        hp_frac = self._team_hp()
+        self.rewards[:] = (self._hp_frac[:, 1] - hp_frac[:, 1]) - (self._hp_frac[:, 0] - hp_frac[:, 0])
+        self._hp_frac[:] = hp_frac
+        won = finished & (hp_frac[:, 1] == 0) & (hp_frac[:, 0] > 0)
+        lost = finished & (hp_frac[:, 0] == 0)
+        self.rewards += WIN_REWARD * won - WIN_REWARD * lost
+        self.dones[:] = dones
+
+        infos: List[Dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        done_idx = np.flatnonzero(dones)
+        if done_idx.size:
+            self._fill(done_idx)
+            for g in done_idx.tolist():
+                infos[g] = {
+                    "winner": self.team if won[g] else (self.opponent_team if lost[g] else None),
+                    "truncated": bool(truncated[g]),
+                    "ticks": int(ticks[g]),
+                    "terminal_observation": {k: v[g].copy() for k, v in self.obs.items()},
+                }
+            self._reset_games(done_idx)
+        self._fill()
+        return self.obs, self.rewards, self.dones, infos
+
+    # ─── games ──────────────────────────────────────────────────────
+
+    def _next_game(self) -> GameState:
+        state = next(self._games)
+        if not self.board_size:
+            self.board_size = state.board.size
+        elif state.board.size != self.board_size:
+            raise ValueError(f"game board is {state.board.size} cells wide, env uses {self.board_size}")
+        state.rng = GameRng(game_seed(self._seed, self._played))
+        self._played += 1
+        return state
+
+    def _reset_games(self, gs: np.ndarray) -> None:
+        states = [self._next_game() for _ in range(len(gs))]
+        self.engine.reset_games(gs, states)
+        self._load_static(gs)
+
+    def _load_static(self, gs: np.ndarray) -> None:
+        """Статичные за игру столбцы игр gs — из только что загруженных столбцов BatchEngine."""
+        eng = self.engine
+        S, A = self.board_size, self.max_abilities
+        planes = self.obs["planes"]
+        planes[gs, PLANE_OBSTACLE] = ~eng.free[gs, :S, :S]
+        planes[gs, PLANE_REGEN] = eng.regen[gs, :S, :S]
+        self._mine[gs] = eng.present[gs] & (eng.team[gs] == self._team_code)
+
+        loaded = eng.ability_ids[gs]
+        if (loaded[..., A:] != NO_ABILITY).any():
+            width = int((loaded != NO_ABILITY).sum(axis=-1).max())
+            raise ValueError(f"profile has {width} abilities, env holds at most {A}")
+        ids = np.full((len(gs), self.max_units, A), NO_ABILITY, dtype=np.int32)
+        width = min(loaded.shape[-1], A)
+        ids[..., :width] = loaded[..., :width]
+        self._ability_ids[gs] = ids
+
+        known = ids != NO_ABILITY
+        table = eng.abilities
+        row = np.maximum(ids, 0)
+        self._point[gs] = known & (table.target[row] == TargetType.POINT.value)
+        self._cost[gs] = np.where(known, table.cost[row], 0)
+        # strongest_attack: первая по порядку профиля из самых сильных по врагу
+        offensive = known & (table.target[row] == TargetType.ENEMY.value)
+        best = np.where(offensive, table.damage[row], np.iinfo(np.int64).min).argmax(axis=-1)
+        strongest = np.take_along_axis(ids, best[..., None], axis=-1)[..., 0]
+        self._strongest[gs] = np.where(offensive.any(axis=-1), strongest, NO_ABILITY)
+        self._start_tick[gs] = eng.tick[gs]
+        self._hp_frac[gs] = self._team_hp(gs)
+
+    # ─── actions ────────────────────────────────────────────────────
+
+    def _decode(self, actions: np.ndarray) -> Orders:
+        """(K, U, 2) [способность, клетка] → Orders своих живых юнитов в идущих играх."""
+        eng = self.engine
+        S = self.board_size
+        orders = self._orders
+        orders.clear()
+        ab_idx = actions[..., 0]
+        cell = actions[..., 1]
+        chosen = (
+            (ab_idx >= 0) & (ab_idx < self.max_abilities)
+            & (cell >= 0) & (cell < S * S)
+            & self._mine & (eng.hp > 0) & eng.running[:, None]
+        )
+        gs, slots = np.nonzero(chosen)
+        a = ab_idx[gs, slots]
+        ability = self._ability_ids[gs, slots, a]
+        known = ability != NO_ABILITY
+        gs, slots, a, ability = gs[known], slots[known], a[known], ability[known]
+        cell = cell[gs, slots]
+        x, y = np.divmod(cell, S)
+        occupant = eng.occupancy[gs, x * eng.side + y] - 1
+        orders.ability[gs, slots] = ability
+        orders.target_x[gs, slots] = x
+        orders.target_y[gs, slots] = y
+        orders.target_slot[gs, slots] = np.where(self._point[gs, slots, a], NO_UNIT, occupant)
+        return orders
+
+    def _opponent_orders(self, orders: Orders) -> None:
+        if self._array_opponent is not None:
+            self._array_opponent(self.engine, TEAM_CODES[self.opponent_team], self._strongest, orders)
+            return
+        # произвольный агент — по объектам игр
+        views = [StateView(s) for s in self.engine.states]
+        theirs = self.engine.orders(self.opponent.act_batch(views))
+        mask = theirs.ability != NO_ABILITY
+        for mine, other in zip(
+            (orders.ability, orders.target_x, orders.target_y, orders.target_slot),
+            (theirs.ability, theirs.target_x, theirs.target_y, theirs.target_slot),
+        ):
+            mine[mask] = other[mask]
+
+    # ─── observations ──────────────────────────────────────────────
+
+    def _team_hp(self, idx: Any = slice(None)) -> np.ndarray:
+        """(len(idx), 2): доля суммарного HP своей команды и соперника в играх idx (по умолчанию — во всех)."""
+        eng = self.engine
+        present = eng.present[idx]
+        mine = self._mine[idx]
+        hp = np.where(present, eng.hp[idx], 0)
+        max_hp = np.where(present, eng.max_hp[idx], 0)
+        out = np.empty(present.shape[:-1] + (2,), dtype=np.float32)
+        for col, side in enumerate((mine, present & ~mine)):
+            total = (max_hp * side).sum(axis=-1)
+            out[..., col] = (hp * side).sum(axis=-1) / np.maximum(total, 1)
+        return out
+
+    def _fill(self, idx: Any = slice(None)) -> None:
+        """Пересчитывает наблюдения игр idx (по умолчанию — всех) из столбцов BatchEngine."""
+        eng = self.engine
+        planes = self.obs["planes"]
+        units = self.obs["units"]
+        S = self.board_size
+
+        games = np.arange(self.num_envs)[idx]
+        alive = eng.present[idx] & (eng.hp[idx] > 0)
+        mine = self._mine[idx]
+        hp = eng.hp[idx] / np.maximum(eng.max_hp[idx], 1)
+        ap = eng.ap[idx] / np.maximum(eng.max_ap[idx], 1)
+        # занятые слоты эффектов живых юнитов: (игра, слот юнита, номер типа, value)
+        gi, si, ei = np.nonzero(eng.eff_type[idx])
+        keep = alive[gi, si]
+        eg, es = games[gi[keep]], si[keep]
+        ecol = _EFFECT_COLUMN[eng.eff_type[eg, es, ei[keep]]]
+        evalue = eng.eff_value[eg, es, ei[keep]]
+
+        units[idx] = 0.0
+        units[idx, :, 0] = alive
+        units[idx, :, 1] = mine & alive
+        units[idx, :, 2] = eng.pos_x[idx] / S
+        units[idx, :, 3] = eng.pos_y[idx] / S
+        units[idx, :, 4] = hp * alive
+        units[idx, :, 5] = ap * alive
+        np.add.at(units, (eg, es, 6 + ecol), evalue)
+
+        planes[idx, PLANE_ALLY:] = 0.0
+        gi, si = np.nonzero(alive)
+        g = games[gi]
+        x = eng.pos_x[g, si]
+        y = eng.pos_y[g, si]
+        planes[g, PLANE_ALLY, x, y] = mine[gi, si]
+        planes[g, PLANE_ENEMY, x, y] = ~mine[gi, si]
+        planes[g, PLANE_HP, x, y] = hp[gi, si]
+        planes[g, PLANE_AP, x, y] = ap[gi, si]
+        np.add.at(planes, (eg, PLANE_EFFECTS + ecol, eng.pos_x[eg, es], eng.pos_y[eg, es]), evalue)
+
+        self.obs["ability_mask"][idx] = (
+            self.has_ability[idx]
+            & (alive & mine)[..., None]
+            & (eng.ap[idx][..., None] >= self._cost[idx])
+        )
@@ -0,0 +1,115 @@
+# src/agents/base.py
+
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Protocol, Sequence, runtime_checkable
+
+from domain.constants import TeamId
+from domain.core.ability import Ability
+from domain.core.action import ActiveAction
+from domain.core.board import Board
+from domain.core.state import GameState
+from domain.core.unit import HeroUnit
+from domain.geometry.position import Position
+
+Intents = Dict[int, ActiveAction]
+
+
+class StateView:
+    """
+    Read-only взгляд агента на GameState: только чтение и пространственные
+    запросы. Юниты отдаются как есть — менять их нельзя; для пробных
+    ходов (lookahead/MCTS) есть fork(), который возвращает независимую копию.
+    Вью живое: одно на игру, между тиками пересоздавать не нужно.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: GameState) -> None:
+        self._state = state
+
+    @property
+    def tick(self) -> int:
+        return self._state.tick
+
+    @property
+    def board(self) -> Board:
+        return self._state.board
+
+    @property
+    def units(self) -> Mapping[int, HeroUnit]:
+        return MappingProxyType(self._state.units)
+
+    def alive(self, team: Optional[TeamId] = None) -> List[HeroUnit]:
+        return [
+            u for u in self._state.units.values()
+            if u.is_alive() and (team is None or u.team == team)
+        ]
+
+    def enemies_of(self, team: TeamId) -> List[HeroUnit]:
+        return [u for u in self._state.units.values() if u.is_alive() and u.team != team]
+
+    def get_unit_at(self, pos: Position) -> Optional[HeroUnit]:
+        return self._state.get_unit_at(pos)
+
+    def units_in_radius(self, center: Position, radius: int, team: Optional[TeamId] = None) -> List[HeroUnit]:
+        return self._state.units_in_radius(center, radius, team)
+
+    def nearest_units(self, center: Position, k: int, radius: int, team: Optional[TeamId] = None) -> List[HeroUnit]:
+        return self._state.nearest_units(center, k, radius, team)
+
+    def has_los(self, a: Position, b: Position) -> bool:
+        """Линия обзора по статичной карте — битовый тест, см. Board.has_los."""
+        return self._state.board.has_los(a, b)
+
+    def is_game_over(self) -> bool:
+        return self._state.is_game_over()
+
+    def fork(self) -> GameState:
+        return self._state.fork()
+
+
+@runtime_checkable
+class Agent(Protocol):
+    """
+    Агент одной команды:
+      - act(view)        — интенты id→ActiveAction для своих юнитов в одной игре
+      - act_batch(views) — то же сразу для пачки параллельных игр
+        (векторная политика считается один раз на батч)
+    """
+    team: TeamId
+
+    def act(self, view: StateView) -> Intents: ...
+
+    def act_batch(self, views: Sequence[StateView]) -> List[Intents]: ...
+
+
+class BaseAgent:
+    """База для скриптовых агентов: act_batch по умолчанию — act по каждой игре."""
+
+    def __init__(self, team: TeamId) -> None:
+        self.team = team
+
+    def act(self, view: StateView) -> Intents:
+        raise NotImplementedError
+
+    def act_batch(self, views: Sequence[StateView]) -> List[Intents]:
+        return [self.act(v) for v in views]
+
+
+def make_intent(ability: Ability, target: HeroUnit) -> ActiveAction:
+    """Интент «применить ability к юниту target»."""
+    return ActiveAction(
+        ability=ability,
+        target=target.pos,
+        target_unit_id=target.id,
+        ticks_remaining=0,
+    )
+
+
+def batch_intents(agents: Iterable[Agent], views: Sequence[StateView]) -> List[Intents]:
+    """Интенты всех агентов для пачки игр: по одному act_batch на агента."""
+    merged: List[Intents] = [{} for _ in views]
+    for agent in agents:
+        for out, intents in zip(merged, agent.act_batch(views)):
+            out.update(intents)
+    return merged
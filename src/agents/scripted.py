@@ -0,0 +1,173 @@
+# src/agents/scripted.py
+
+from typing import Dict, List, Optional, Type
+
+from agents.base import BaseAgent, Intents, StateView, make_intent
+from domain.constants import TeamId
+from domain.core.ability import Ability
+from domain.core.action import ActiveAction
+from domain.core.unit import HeroUnit
+from domain.enums import AbilityKind, EffectType, TargetType
+
+
+def ability_damage(ability: Ability) -> int:
+    """Суммарный базовый урон способности."""
+    return sum(e.value for e in ability.effects if e.type is EffectType.DAMAGE)
+
+
+def strongest_attack(unit: HeroUnit) -> Optional[Ability]:
+    """Самая сильная способность юнита по врагу (None, если таких нет)."""
+    offensive = [ab for ab in unit.abilities if ab.target is TargetType.ENEMY]
+    if not offensive:
+        return None
+    return max(offensive, key=ability_damage)
+
+
+def _busy(unit: HeroUnit) -> bool:
+    """Юнит в середине каста — новый интент всё равно не примет."""
+    act = unit.current_action
+    return act is not None and act.started
+
+
+def _supporting(unit: HeroUnit) -> bool:
+    """В очереди — способность по союзнику (после каста _complete ставит её заново)."""
+    act = unit.current_action
+    return act is not None and act.ability.target is TargetType.ALLY
+
+
+def nearest_enemy_intent(unit: HeroUnit, enemies: List[HeroUnit]) -> Optional[ActiveAction]:
+    """Самая сильная атака юнита по ближайшему врагу (None — атаковать нечем / некого)."""
+    ability = strongest_attack(unit)
+    if ability is None or not enemies:
+        return None
+    target = min(enemies, key=lambda e: (unit.pos.distance(e.pos), e.id))
+    return make_intent(ability, target)
+
+
+def hold_intent(unit: HeroUnit) -> Optional[ActiveAction]:
+    """Ход на свою же клетку: вытесняет очередь и ничего не делает (None — ходить нечем)."""
+    move = next((ab for ab in unit.abilities if ab.kind is AbilityKind.MOVE), None)
+    if move is None:
+        return None
+    return ActiveAction(ability=move, target=unit.pos, target_unit_id=None, ticks_remaining=0)
+
+
+def _aiming_at(unit: HeroUnit, ability: Ability, target: HeroUnit) -> bool:
+    act = unit.current_action
+    return act is not None and act.ability is ability and act.target_unit_id == target.id
+
+
+class NearestEnemyAgent(BaseAgent):
+    """
+    Простейший скриптовый агент:
+      - каждый свободный юнит команды выбирает ближайшего живого врага
+      - бьёт его самой сильной вражеской способностью
+    Подход к цели делает сам HeroUnit.advance_action (шаг 4).
+    """
+
+    def act(self, view: StateView) -> Intents:
+        intents: Intents = {}
+        enemies = view.enemies_of(self.team)
+        if not enemies:
+            return intents
+
+        for u in view.alive(self.team):
+            if u.current_action is not None:
+                continue
+            intent = nearest_enemy_intent(u, enemies)
+            if intent is not None:
+                intents[u.id] = intent
+        return intents
+
+
+class FocusFireAgent(BaseAgent):
+    """
+    Вся команда бьёт одну цель — живого врага с наименьшим HP (при равенстве —
+    ближайшего к центру команды, затем по id). Юниты, уже идущие на другую
+    цель, перенацеливаются, если не в середине каста.
+    """
+
+    def act(self, view: StateView) -> Intents:
+        intents: Intents = {}
+        enemies = view.enemies_of(self.team)
+        mine = view.alive(self.team)
+        if not enemies or not mine:
+            return intents
+
+        cx = sum(u.pos.x for u in mine) / len(mine)
+        cy = sum(u.pos.y for u in mine) / len(mine)
+        focus = min(enemies, key=lambda e: (e.hp, max(abs(e.pos.x - cx), abs(e.pos.y - cy)), e.id))
+
+        for u in mine:
+            if _busy(u):
+                continue
+            ability = strongest_attack(u)
+            if ability is None or _aiming_at(u, ability, focus):
+                continue
+            intents[u.id] = make_intent(ability, focus)
+        return intents
+
+
+class SupportPriorityAgent(BaseAgent):
+    """
+    Саппорты сначала спасают своих, остальные — как NearestEnemyAgent:
+      - союзник ниже heal_threshold от max_hp → лечение (HEAL), иначе щит (SHIELD)
+        на самого раненого (по доле HP, затем по id)
+      - пока лечить некого — саппорт тоже атакует ближайшего врага; повтор
+        лечения по уже здоровому союзнику снимается (без атак — юнит стоит)
+    Решение пересматривается каждый тик, пока юнит не начал каст.
+    """
+
+    def __init__(self, team: TeamId, heal_threshold: float = 0.6) -> None:
+        super().__init__(team)
+        self.heal_threshold = heal_threshold
+        self._fallback = NearestEnemyAgent(team)
+
+    def act(self, view: StateView) -> Intents:
+        intents = self._fallback.act(view)
+        mine = view.alive(self.team)
+        wounded = sorted(
+            (u for u in mine if u.hp < u.profile.max_hp * self.heal_threshold),
+            key=lambda u: (u.hp / u.profile.max_hp, u.id),
+        )
+        patient = wounded[0] if wounded else None
+        enemies = view.enemies_of(self.team)
+
+        for u in mine:
+            if _busy(u):
+                continue
+            ability = self._pick_support(u)
+            if ability is None:
+                continue
+            if patient is None:
+                # лечить некого, а в очереди повтор лечения/щита по союзнику
+                # (NearestEnemyAgent такого юнита пропускает) — в атаку,
+                # а если атаковать нечем — снять каст и стоять
+                if _supporting(u):
+                    fallback = nearest_enemy_intent(u, enemies) or hold_intent(u)
+                    if fallback is not None:
+                        intents[u.id] = fallback
+            elif not _aiming_at(u, ability, patient):
+                intents[u.id] = make_intent(ability, patient)
+            else:
+                intents.pop(u.id, None)
+        return intents
+
+    @staticmethod
+    def _pick_support(unit: HeroUnit) -> Optional[Ability]:
+        for kind in (EffectType.HEAL, EffectType.SHIELD):
+            options = [
+                ab for ab in unit.abilities
+                if ab.target is TargetType.ALLY and any(e.type is kind for e in ab.effects)
+            ]
+            if options:
+                return max(options, key=lambda ab: sum(e.value for e in ab.effects if e.type is kind))
+        return None
+
+
+# имя → класс агента (для CLI и конфигов)
+SCRIPTED_AGENTS: Dict[str, Type[BaseAgent]] = {
+    "nearest": NearestEnemyAgent,
+    "focus": FocusFireAgent,
+    "support": SupportPriorityAgent,
+}
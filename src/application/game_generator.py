@@ -2,11 +2,14 @@
 
 import random
 from pathlib import Path
-from typing import Iterator, Callable, Optional, List
+from typing import Dict, Iterator, Callable, Optional, List, Tuple
 
 from config.config_loader import load_map_config, load_hero_setup
 from config.cli_config import cli_settings
-from domain.factory.game_factory import build_new_game
+from domain.factory.game_factory import ScenarioTemplate, compile_scenario
+
+# папка сценария → (mtime_ns map.json, mtime_ns heroes.json, шаблон)
+_SCENARIO_CACHE: Dict[Path, Tuple[int, int, ScenarioTemplate]] = {}
 
 
 class GeneratorConfig:
@@ -29,6 +32,35 @@ class GeneratorConfig:
         self.loop = loop
         self.filter_fn = filter_fn
 
+def load_scenario(path: Path) -> ScenarioTemplate:
+    """
+    Скомпилированный шаблон сценария из папки path (map.json + heroes.json).
+    JSON разбирается один раз; шаблон лежит в памяти, пока не изменится
+    mtime любого из файлов.
+    """
+    map_path, heroes_path = path / "map.json", path / "heroes.json"
+    map_mtime, heroes_mtime = map_path.stat().st_mtime_ns, heroes_path.stat().st_mtime_ns
+    cached = _SCENARIO_CACHE.get(path)
+    if cached and cached[0] == map_mtime and cached[1] == heroes_mtime:
+        return cached[2]
+
+    map_cfg = load_map_config(str(map_path))
+    template = compile_scenario(
+        hero_setup=load_hero_setup(str(heroes_path)),
+        obstacles=map_cfg.obstacles,
+        regen_zone=map_cfg.regen_zone,
+        seed=map_cfg.seed,
+        name=path.name,
+        size=map_cfg.size,
+    )
+    _SCENARIO_CACHE[path] = (map_mtime, heroes_mtime, template)
+    return template
+
+
+def clear_scenario_cache() -> None:
+    _SCENARIO_CACHE.clear()
+
+
 def build_generator_config_from_cli() -> GeneratorConfig:
     """
     Строит GeneratorConfig по значениям из cli_settings:
@@ -77,17 +109,8 @@ def generate_games(
             if count >= 0 and yielded >= count:
                 return
 
-            base = cfg.scenarios_dir / name
-            map_cfg    = load_map_config(str(base / "map.json"))
-            heroes_cfg = load_hero_setup(str(base / "heroes.json"))
-
-            state = build_new_game(
-                tick=0,
-                hero_setup=heroes_cfg,
-                obstacles=map_cfg.obstacles,
-                regen_zone=map_cfg.regen_zone,
-            )
-            yield state
+            # шаблон из кэша: JSON разбирается только при изменении файлов
+            yield load_scenario(cfg.scenarios_dir / name).instantiate()
             yielded += 1
 
         if cfg.mode == "random":
@@ -1,25 +1,40 @@
 # src/adapters/domain_adapter.py
 
+from pathlib import Path
+from typing import Optional
+
 from application.game_generator import build_generator_config_from_cli, generate_games
+from application.services.replay import ReplayRecorder
 from domain.engine.event_loop import event_tick
-from domain.analytics.stats import stats_tracker
 
 
 class DomainConnector:
-    def __init__(self):
+    """
+    replay_dir — если задан, каждая доигранная партия сохраняется туда
+    бинарной записью <scenario>-<seed>.tsr (см. services/replay.py).
+    """
+
+    def __init__(self, replay_dir: Optional[Path] = None):
+        self.replay_dir = Path(replay_dir) if replay_dir is not None else None
+        self.recorder: Optional[ReplayRecorder] = None
         self._create_new_game()
 
     def _create_new_game(self):
         gen_cfg = build_generator_config_from_cli()
         gen_iter = generate_games(gen_cfg, count=1)
         self.state = next(gen_iter)
+        if self.replay_dir is not None:
+            self.recorder = ReplayRecorder(self.state)
 
     def send_intents(self, intents: dict):
-        
+        if self.recorder:
+            self.recorder.record(self.state, intents)
         self.state, executed, is_over = event_tick(self.state, intents)
         if is_over:
+            if self.recorder:
+                self._save_replay()
             
-            final_stats = stats_tracker.get_stats()
+            final_stats = self.state.stats.get_stats()
             for unit_id, u_stats in final_stats.items():
 
                 print(f"=== Unit {unit_id} stats ===")
@@ -30,10 +45,15 @@ class DomainConnector:
                         f"damage→enemies={ab.damage_to_enemies}, allies={ab.damage_to_allies}, "
                         f"healed={ab.healing}, effects={ab.effects_applied}")
             
-            stats_tracker.reset()
-            
             self._create_new_game()
         return executed
 
     def get_state(self):
         return self.state
+
+    def _save_replay(self) -> Path:
+        self.replay_dir.mkdir(parents=True, exist_ok=True)
+        rec = self.recorder
+        path = self.replay_dir / f"{rec.scenario or 'game'}-{rec.seed}.tsr"
+        rec.save(path)
+        return path
@@ -0,0 +1,72 @@
+# src/application/services/parallel_runner.py
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from agents.scripted import NearestEnemyAgent
+from application.game_generator import GeneratorConfig, generate_games
+from application.services.simulation_runner import (
+    DEFAULT_MAX_TICKS,
+    AgentFactory,
+    GameResult,
+    SimulationReport,
+    game_seed,
+    run_game,
+)
+from config.logger import RTS_Logger
+from domain.core.state import GameState
+
+# сколько игр отдаём воркеру за одну пересылку
+DEFAULT_CHUNKSIZE = 8
+
+_Job = Tuple[GameState, AgentFactory, int, int]
+
+
+def _init_worker(log_level: str) -> None:
+    """Выставляет уровень доменных логов в воркере."""
+    RTS_Logger.set_global_level(log_level)
+
+
+def _play(job: _Job) -> GameResult:
+    state, agent_factory, max_ticks, seed = job
+    return run_game(state, agent_factory, max_ticks, seed)
+
+
+def run_parallel(
+    cfg: GeneratorConfig,
+    count: int,
+    workers: Optional[int] = None,
+    agent_factory: AgentFactory = NearestEnemyAgent,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    base_seed: int = 0,
+    log_level: str = "NONE",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> SimulationReport:
+    """
+    Раскидывает count независимых игр по пулу процессов.
+      - workers: число процессов (None — все ядра)
+      - i-я игра всегда получает seed game_seed(base_seed, i), поэтому итог
+        не зависит от числа воркеров и совпадает с run_simulations(base_seed=...)
+      - статистика каждой игры живёт в её GameState и возвращается вместе
+        с результатом, а затем сводится в отчёт в родительском процессе
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = (
+        (state, agent_factory, max_ticks, game_seed(base_seed, index))
+        for index, state in enumerate(generate_games(cfg, count=count))
+    )
+
+    report = SimulationReport()
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(log_level,),
+    ) as pool:
+        # map сохраняет порядок игр — отчёт собирается детерминированно
+        for result in pool.map(_play, jobs, chunksize=chunksize):
+            report.add(result)
+    report.elapsed = time.perf_counter() - started
+    return report
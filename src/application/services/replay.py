@@ -0,0 +1,293 @@
+# src/application/services/replay.py
+"""
+Компактная запись игры и её воспроизведение.
+
+Игра детерминирована (seed + интенты, см. GameRng), поэтому хранить нужно
+только сценарий, seed и интенты каждого тика — состояние любого тика
+пересчитывается event_tick'ом. Формат (все целые — беззнаковые varint,
+7 бит на байт, старший бит — «дальше ещё байт»):
+
+    MAGIC "TSRP" | version | seed | start_tick | board_size | unit_count
+    | ticks | len(scenario) scenario(utf-8)
+    затем ticks записей тика:
+        n_intents, и n раз: unit_id | ability_index | flags
+                            [| x | y если flags & 1] [| target_unit_id если flags & 2]
+
+ability_index — позиция способности в unit.abilities. Принудительные
+действия (TAUNT) не пишутся — движок выводит их сам. Тик без интентов —
+один байт.
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from application.game_generator import load_scenario
+from domain.core.action import ActiveAction
+from domain.core.state import GameState
+from domain.core.unit import HeroUnit
+from domain.engine.event_loop import event_tick
+from domain.factory.game_factory import ScenarioTemplate
+from domain.geometry.position import Position
+
+MAGIC = b"TSRP"
+FORMAT_VERSION = 1
+# каждые столько тиков Replayer держит снимок состояния для перемотки
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+# флаги записи интента
+_HAS_TARGET = 1
+_HAS_TARGET_UNIT = 2
+
+# (unit_id, ability_index, (x, y) | None, target_unit_id | None)
+IntentRecord = Tuple[int, int, Optional[Tuple[int, int]], Optional[int]]
+
+
+# ─── varint ────────────────────────────────────────────────────────
+
+def write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"varint must be non-negative, got {value}")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Значение и позиция следующего байта."""
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("truncated replay: varint runs past the end")
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+# ─── запись ────────────────────────────────────────────────────────
+
+def _ability_index(unit: HeroUnit, act: ActiveAction) -> int:
+    for i, ab in enumerate(unit.abilities):
+        if ab is act.ability or ab == act.ability:
+            return i
+    raise ValueError(f"unit {unit.id} has no ability '{act.ability.name}'")
+
+
+@dataclass(slots=True)
+class Replay:
+    """
+    Разобранная запись игры:
+      - scenario   — имя сценария (папка в scenarios_dir)
+      - seed       — seed потока бросков
+      - start_tick — тик, с которого шла запись
+      - board_size / unit_count — для проверки, что сценарий тот же
+      - ticks      — интенты по тикам (IntentRecord)
+    """
+    scenario: str
+    seed: int
+    start_tick: int
+    board_size: int
+    unit_count: int
+    ticks: List[Tuple[IntentRecord, ...]] = field(default_factory=list)
+
+    @property
+    def end_tick(self) -> int:
+        return self.start_tick + len(self.ticks)
+
+    def to_bytes(self) -> bytes:
+        out = _header(self.scenario, self.seed, self.start_tick,
+                      self.board_size, self.unit_count, len(self.ticks))
+        for records in self.ticks:
+            _write_tick(out, records)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a replay: bad magic")
+        pos = len(MAGIC)
+        version, pos = read_varint(data, pos)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        seed, pos = read_varint(data, pos)
+        start_tick, pos = read_varint(data, pos)
+        board_size, pos = read_varint(data, pos)
+        unit_count, pos = read_varint(data, pos)
+        n_ticks, pos = read_varint(data, pos)
+        name_len, pos = read_varint(data, pos)
+        scenario = data[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+
+        ticks: List[Tuple[IntentRecord, ...]] = []
+        for _ in range(n_ticks):
+            n, pos = read_varint(data, pos)
+            records = []
+            for _ in range(n):
+                uid, pos = read_varint(data, pos)
+                ab_idx, pos = read_varint(data, pos)
+                flags, pos = read_varint(data, pos)
+                target = target_uid = None
+                if flags & _HAS_TARGET:
+                    x, pos = read_varint(data, pos)
+                    y, pos = read_varint(data, pos)
+                    target = (x, y)
+                if flags & _HAS_TARGET_UNIT:
+                    target_uid, pos = read_varint(data, pos)
+                records.append((uid, ab_idx, target, target_uid))
+            ticks.append(tuple(records))
+        if pos != len(data):
+            raise ValueError(f"trailing {len(data) - pos} bytes after {n_ticks} ticks")
+        return cls(scenario, seed, start_tick, board_size, unit_count, ticks)
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def _header(scenario: str, seed: int, start_tick: int,
+            board_size: int, unit_count: int, ticks: int) -> bytearray:
+    out = bytearray(MAGIC)
+    name = scenario.encode("utf-8")
+    for value in (FORMAT_VERSION, seed, start_tick, board_size, unit_count, ticks, len(name)):
+        write_varint(out, value)
+    out += name
+    return out
+
+
+def _write_tick(out: bytearray, records: Tuple[IntentRecord, ...]) -> None:
+    write_varint(out, len(records))
+    for uid, ab_idx, target, target_uid in records:
+        write_varint(out, uid)
+        write_varint(out, ab_idx)
+        flags = (_HAS_TARGET if target is not None else 0) | (
+            _HAS_TARGET_UNIT if target_uid is not None else 0)
+        write_varint(out, flags)
+        if target is not None:
+            write_varint(out, target[0])
+            write_varint(out, target[1])
+        if target_uid is not None:
+            write_varint(out, target_uid)
+
+
+class ReplayRecorder:
+    """
+    Пишет игру по ходу: создаётся на свежем GameState (до первого тика —
+    seed и позиция rng берутся из него), record() — перед каждым
+    event_tick(state, intents) с теми же интентами. Тики кодируются сразу,
+    в памяти лежат только байты.
+    """
+
+    def __init__(self, state: GameState) -> None:
+        self.scenario = state.scenario or ""
+        self.seed = state.rng.seed
+        self.start_tick = state.tick
+        self.board_size = state.board.size
+        self.unit_count = len(state.units)
+        self.ticks = 0
+        self._body = bytearray()
+
+    def record(self, state: GameState, intents: Mapping[int, ActiveAction]) -> None:
+        records = []
+        for uid, act in intents.items():
+            target = (act.target.x, act.target.y) if act.target is not None else None
+            records.append((uid, _ability_index(state.units[uid], act), target, act.target_unit_id))
+        _write_tick(self._body, tuple(records))
+        self.ticks += 1
+
+    def to_bytes(self) -> bytes:
+        header = _header(self.scenario, self.seed, self.start_tick,
+                         self.board_size, self.unit_count, self.ticks)
+        return bytes(header + self._body)
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+
+# ─── воспроизведение ───────────────────────────────────────────────
+
+class Replayer:
+    """
+    Пересобирает любой тик записи, заново прогоняя event_tick.
+    Каждые keyframe_interval тиков сохраняется форк состояния (GameState.fork),
+    поэтому state_at() идёт не с начала игры, а от ближайшего ключевого кадра.
+
+    Статистика у форков своя (см. fork): stats у state_at() — только с
+    ключевого кадра; полную даёт play() с начала.
+    """
+
+    def __init__(
+        self,
+        replay: Replay,
+        template: ScenarioTemplate,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> None:
+        initial = template.instantiate(tick=replay.start_tick, seed=replay.seed)
+        if initial.board.size != replay.board_size or len(initial.units) != replay.unit_count:
+            raise ValueError(
+                f"scenario '{template.name}' does not match the replay "
+                f"(board {initial.board.size} vs {replay.board_size}, "
+                f"units {len(initial.units)} vs {replay.unit_count})"
+            )
+        self.replay = replay
+        self.keyframe_interval = max(1, keyframe_interval)
+        # тик → состояние на его начало; сами кадры не мутируются, только форкаются
+        self._keyframes: Dict[int, GameState] = {replay.start_tick: initial}
+        self._keyframe_ticks: List[int] = [replay.start_tick]
+
+    @classmethod
+    def from_scenarios(
+        cls,
+        replay: Replay,
+        scenarios_dir: Path,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> "Replayer":
+        return cls(replay, load_scenario(Path(scenarios_dir) / replay.scenario), keyframe_interval)
+
+    # -----------------------------------------------------------------
+    def intents(self, state: GameState) -> Dict[int, ActiveAction]:
+        """Интенты записи для тика state.tick, собранные на юнитах state."""
+        out: Dict[int, ActiveAction] = {}
+        for uid, ab_idx, target, target_uid in self.replay.ticks[state.tick - self.replay.start_tick]:
+            unit = state.units[uid]
+            out[uid] = ActiveAction(
+                ability=tuple(unit.abilities)[ab_idx],
+                target=Position(*target) if target is not None else None,
+                target_unit_id=target_uid,
+                ticks_remaining=0,
+            )
+        return out
+
+    def state_at(self, tick: int) -> GameState:
+        """Независимое состояние на начало tick (start_tick … end_tick)."""
+        replay = self.replay
+        if not replay.start_tick <= tick <= replay.end_tick:
+            raise ValueError(f"tick {tick} outside replay [{replay.start_tick}, {replay.end_tick}]")
+        i = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        state = self._keyframes[self._keyframe_ticks[i]].fork()
+        while state.tick < tick:
+            state = self._step(state)
+        return state
+
+    def play(self) -> Iterator[GameState]:
+        """Состояние после каждого тика записи (один и тот же объект, по ходу)."""
+        state = self._keyframes[self.replay.start_tick].fork()
+        while state.tick < self.replay.end_tick:
+            state = self._step(state)
+            yield state
+
+    # -----------------------------------------------------------------
+    def _step(self, state: GameState) -> GameState:
+        state, _, _ = event_tick(state, self.intents(state))
+        if (state.tick - self.replay.start_tick) % self.keyframe_interval == 0 \
+                and state.tick not in self._keyframes:
+            self._keyframes[state.tick] = state.fork()
+            bisect.insort(self._keyframe_ticks, state.tick)
+        return state
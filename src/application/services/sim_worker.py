@@ -0,0 +1,178 @@
+# src/application/services/sim_worker.py
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from application.services.domain_connector import DomainConnector
+from domain.core.action import ActiveAction
+from domain.core.state import GameState
+
+# interval == MAX_SPEED — тики подряд, без пауз; UI берёт снимки с частотой sample_interval
+MAX_SPEED = 0.0
+DEFAULT_SAMPLE_INTERVAL = 1 / 30
+# снимков в очереди; при переполнении выбрасывается самый старый
+DEFAULT_QUEUE_SIZE = 8
+# как часто спящий (пауза) воркер проверяет флаги
+_IDLE_WAIT = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """
+    Снимок после тика:
+      - tick      — номер тика state
+      - state     — форк GameState (см. GameState.fork); воркер его больше
+                    не трогает, UI только читает
+      - ticks_run — сколько тиков сыграно с прошлого снимка (>1 в max-режиме)
+      - created   — time.perf_counter() публикации, для интерполяции в UI
+    """
+    tick: int
+    state: GameState
+    ticks_run: int
+    created: float
+
+
+class SimulationWorker:
+    """
+    Симуляция в фоновом потоке: крутит DomainConnector.send_intents в своём
+    темпе и кладёт неизменяемые снимки в очередь, рендер их только читает.
+
+      - submit(intents)          — интенты игрока на ближайший тик
+      - set_pace(interval, paused) — темп: секунд на тик или MAX_SPEED
+      - poll()                   — все новые снимки (пусто — кадр без тика)
+
+    После start() DomainConnector принадлежит потоку воркера; ошибка в тике
+    всплывает в UI-потоке из poll().
+    """
+
+    def __init__(
+        self,
+        domain: DomainConnector,
+        interval: float = 1.0,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self.domain = domain
+        self.sample_interval = sample_interval
+        self._interval = interval
+        self._paused = False
+        self._intents: Dict[int, ActiveAction] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        # выставляется на каждом круге воркера на паузе (см. wait_idle)
+        self._idle = threading.Event()
+        self._snapshots: "queue.Queue[Snapshot]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    # ── API (UI-поток) ─────────────────────────────────────────────
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sim-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, intents: Dict[int, ActiveAction]) -> None:
+        """Интенты уходят копиями: объекты UI (оверлей) движок не мутирует."""
+        with self._lock:
+            for uid, act in intents.items():
+                self._intents[uid] = act.copy()
+
+    def set_pace(self, interval: float, paused: bool = False) -> None:
+        with self._lock:
+            changed = interval != self._interval or paused != self._paused
+            self._interval, self._paused = interval, paused
+        if changed:
+            self._wake.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ждёт, пока воркер пройдёт ещё один круг на паузе: после True все
+        снимки до паузы уже в очереди, а новых тиков до снятия паузы не будет.
+        """
+        self._idle.clear()
+        return self._idle.wait(timeout)
+
+    def poll(self) -> List[Snapshot]:
+        if self._error is not None:
+            raise RuntimeError("simulation worker failed") from self._error
+        snaps = []
+        while True:
+            try:
+                snaps.append(self._snapshots.get_nowait())
+            except queue.Empty:
+                return snaps
+
+    # ── поток воркера ──────────────────────────────────────────────
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except BaseException as e:  # отдаём в UI через poll()
+            self._error = e
+
+    def _loop(self) -> None:
+        ticks_run = 0
+        last_publish = 0.0
+        while not self._stop.is_set():
+            with self._lock:
+                interval, paused = self._interval, self._paused
+                # на паузе интенты копятся до первого тика после неё
+                if not paused:
+                    intents, self._intents = self._intents, {}
+            if paused:
+                self._idle.set()
+                self._wake.wait(_IDLE_WAIT)
+                self._wake.clear()
+                continue
+
+            started = time.perf_counter()
+            self.domain.send_intents(intents)
+            ticks_run += 1
+
+            now = time.perf_counter()
+            if interval > MAX_SPEED or now - last_publish >= self.sample_interval:
+                self._publish(Snapshot(
+                    tick=self.domain.state.tick,
+                    state=self.domain.state.fork(),
+                    ticks_run=ticks_run,
+                    created=now,
+                ))
+                ticks_run, last_publish = 0, now
+
+            if interval > MAX_SPEED:
+                self._wait_next(started)
+            else:
+                time.sleep(0)  # отпустить GIL рендеру
+
+    def _wait_next(self, started: float) -> None:
+        """Спит до started + interval; смена темпа пересчитывает срок, пауза / stop прерывают."""
+        while not self._stop.is_set():
+            with self._lock:
+                interval, paused = self._interval, self._paused
+            remaining = started + interval - time.perf_counter()
+            if paused or interval <= MAX_SPEED or remaining <= 0:
+                return
+            self._wake.wait(remaining)
+            self._wake.clear()
+
+    def _publish(self, snap: Snapshot) -> None:
+        while True:
+            try:
+                self._snapshots.put_nowait(snap)
+                return
+            except queue.Full:
+                try:
+                    self._snapshots.get_nowait()
+                except queue.Empty:
+                    pass
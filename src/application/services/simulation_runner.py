@@ -0,0 +1,148 @@
+# src/application/services/simulation_runner.py
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from agents.base import Agent, StateView
+from agents.scripted import NearestEnemyAgent
+from application.game_generator import GeneratorConfig, generate_games
+from application.services.replay import ReplayRecorder
+from domain.analytics.profiler import DEFAULT_SCENARIO, active_profiler
+from domain.analytics.stats import StatsTracker
+from domain.constants import TeamId
+from domain.core.rng import GameRng
+from domain.core.state import GameState
+from domain.engine.event_loop import event_tick
+
+# игра, не закончившаяся за столько тиков, считается ничьей
+DEFAULT_MAX_TICKS = 2000
+
+AgentFactory = Callable[[TeamId], Agent]
+
+
+def game_seed(base_seed: int, index: int) -> int:
+    """Детерминированный seed index-й игры пачки."""
+    return base_seed + index
+
+
+@dataclass(slots=True)
+class GameResult:
+    """
+    Итог одной headless-игры:
+      - winner   — команда-победитель (None при ничьей / обрыве по лимиту)
+      - ticks    — сколько тиков сыграно
+      - finished — закончилась ли игра сама (а не по max_ticks)
+      - stats    — статистика способностей за игру
+      - replay   — бинарная запись игры (run_game(record=True), см. replay.py)
+    """
+    winner: Optional[TeamId]
+    ticks: int
+    finished: bool
+    stats: StatsTracker = field(default_factory=StatsTracker)
+    replay: Optional[bytes] = None
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    """
+    Сводка пачки игр: количество, тики, время, победы по командам
+    и сведённая статистика способностей всех игр.
+    """
+    games: int = 0
+    ticks: int = 0
+    unfinished: int = 0
+    elapsed: float = 0.0
+    wins: Dict[str, int] = field(default_factory=dict)
+    stats: StatsTracker = field(default_factory=StatsTracker)
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.ticks += result.ticks
+        if not result.finished:
+            self.unfinished += 1
+        key = result.winner or "draw"
+        self.wins[key] = self.wins.get(key, 0) + 1
+        self.stats.merge(result.stats)
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        wins = ", ".join(f"{k}={v}" for k, v in sorted(self.wins.items()))
+        return (
+            f"games={self.games} ticks={self.ticks} unfinished={self.unfinished} "
+            f"time={self.elapsed:.2f}s "
+            f"games/s={self.games_per_sec:.1f} ticks/s={self.ticks_per_sec:.0f} "
+            f"wins: {wins}"
+        )
+
+
+def run_game(
+    state: GameState,
+    agent_factory: AgentFactory = NearestEnemyAgent,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    seed: Optional[int] = None,
+    record: bool = False,
+) -> GameResult:
+    """
+    Играет одну игру до конца без UI: на каждом тике каждая команда
+    получает интенты от своего агента.
+    seed — если задан, перезаписывает seed потока бросков игры.
+    record — вернуть в GameResult.replay запись игры (seed + интенты).
+    При активном профайлере тики игры записываются под её сценарием.
+    """
+    if seed is not None:
+        state.rng = GameRng(seed)
+    prof = active_profiler()
+    if prof:
+        prof.scenario = state.scenario or DEFAULT_SCENARIO
+    teams = sorted({u.team for u in state.units.values()})
+    agents = [agent_factory(team) for team in teams]
+    view = StateView(state)
+    recorder = ReplayRecorder(state) if record else None
+
+    start_tick = state.tick
+    is_over = state.is_game_over()
+    while not is_over and state.tick - start_tick < max_ticks:
+        intents = {}
+        for agent in agents:
+            intents.update(agent.act(view))
+        if recorder:
+            recorder.record(state, intents)
+        state, _, is_over = event_tick(state, intents)
+
+    alive = {u.team for u in state.units.values() if u.is_alive()}
+    winner = next(iter(alive)) if is_over and len(alive) == 1 else None
+    return GameResult(
+        winner=winner,
+        ticks=state.tick - start_tick,
+        finished=is_over,
+        stats=state.stats,
+        replay=recorder.to_bytes() if recorder else None,
+    )
+
+
+def run_simulations(
+    cfg: GeneratorConfig,
+    count: int,
+    agent_factory: AgentFactory = NearestEnemyAgent,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    base_seed: Optional[int] = None,
+) -> SimulationReport:
+    """
+    Прогоняет count игр из generate_games и меряет пропускную способность.
+    При заданном base_seed i-я игра получает seed game_seed(base_seed, i).
+    """
+    report = SimulationReport()
+    started = time.perf_counter()
+    for index, state in enumerate(generate_games(cfg, count=count)):
+        seed = game_seed(base_seed, index) if base_seed is not None else None
+        report.add(run_game(state, agent_factory, max_ticks, seed))
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -3,13 +3,13 @@
 import json
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from domain.geometry.position import Position
-from domain.constants import TeamId
+from domain.constants import BOARD_SIZE, TeamId
 
 # —————————————————————————————————————————————————————————————————————————————
 # Загрузка карт и героях
@@ -24,15 +24,23 @@ class HeroConfig:
 class MapConfig:
     obstacles: Set[Position]
     regen_zone: Set[Position]
+    seed: Optional[int] = None
+    size: int = BOARD_SIZE
 
 def load_map_config(path: str) -> MapConfig:
     """
-    Читает JSON с ключами "obstacles" и "regen_zone", возвращает MapConfig.
+    Читает JSON с ключами "obstacles", "regen_zone" и необязательными
+    "seed" и "size" (сторона доски, по умолчанию BOARD_SIZE), возвращает MapConfig.
     """
     data = json.loads(Path(path).read_text(encoding="utf-8"))
     obstacles = {Position(*p) for p in data.get("obstacles", [])}
     regen_zone = {Position(*p) for p in data.get("regen_zone", [])}
-    return MapConfig(obstacles=obstacles, regen_zone=regen_zone)
+    return MapConfig(
+        obstacles=obstacles,
+        regen_zone=regen_zone,
+        seed=data.get("seed"),
+        size=data.get("size", BOARD_SIZE),
+    )
 
 def load_hero_setup(path: str) -> Dict[TeamId, List[HeroConfig]]:
     """
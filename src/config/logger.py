@@ -2,8 +2,10 @@
 
 import inspect
 import logging
+import os
+import weakref
 from enum import Enum
-from typing import Final, Optional, Union
+from typing import Callable, Final, Optional, Union
 
 from .cli_config import cli_settings
 
@@ -23,6 +25,29 @@ LOG_LEVEL_MAP: Final[dict[LogLevel, int]] = {
     LogLevel.FULL:     logging.DEBUG,
 }
 
+# TURNSHOCK_LOG_DISABLED=1 — логирование выключено на этапе импорта:
+# log_lvl1/2/3 становятся пустыми методами, а все гарды — False.
+LOGGING_ENABLED: Final[bool] = os.environ.get("TURNSHOCK_LOG_DISABLED", "") not in ("1", "true", "yes")
+
+# Сообщение — готовая строка или функция без аргументов, которая её строит
+# (вызывается, только если уровень включён).
+Message = Union[str, Callable[[], str]]
+
+
+def _parse_level(level: Union[LogLevel, str]) -> LogLevel:
+    if isinstance(level, LogLevel):
+        return level
+    if isinstance(level, str):
+        try:
+            return LogLevel[level]
+        except KeyError:
+            raise ValueError(f"Unknown log level: {level!r}")
+    raise TypeError("level must be either LogLevel or string key")
+
+
+def _render(msg: Message) -> str:
+    return msg() if callable(msg) else msg
+
 
 class RTS_Logger:
     """
@@ -30,9 +55,23 @@ class RTS_Logger:
       - Автоматически берёт имя логгера из модуля-вызова.
       - Уровень по умолчанию — из cli_settings.log_level (строка или LogLevel).
       - Формирует единственный StreamHandler с форматом "[<logger_name>]: <msg>".
+
+    Быстрый путь для горячих циклов:
+      - гарды lvl1/lvl2/lvl3 посчитаны заранее:
+            if logger.lvl2:
+                logger.log_lvl2(f"... {roll:.2f} ...")
+        на уровне NONE f-строка не строится вовсе;
+      - msg может быть функцией: logger.log_lvl3(lambda: f"...");
+      - set_global_level() меняет уровень всех логгеров на лету;
+      - TURNSHOCK_LOG_DISABLED=1 выключает логирование целиком (см. LOGGING_ENABLED).
     """
 
-    __slots__ = ("logger", "level")
+    __slots__ = ("logger", "level", "lvl1", "lvl2", "lvl3", "__weakref__")
+
+    # все созданные логгеры — для set_global_level
+    _instances: "weakref.WeakSet[RTS_Logger]" = weakref.WeakSet()
+    # уровень, выставленный через set_global_level (перекрывает cli_settings)
+    _global_level: Optional[LogLevel] = None
 
     def __init__(
         self,
@@ -40,16 +79,12 @@ class RTS_Logger:
         level: Optional[Union[LogLevel, str]] = None,
     ) -> None:
         # 1) Определяем уровень
-        lvl_setting = level if level is not None else cli_settings.log_level
-        if isinstance(lvl_setting, str):
-            try:
-                self.level = LogLevel[lvl_setting]
-            except KeyError:
-                raise ValueError(f"Unknown log level: {lvl_setting!r}")
-        elif isinstance(lvl_setting, LogLevel):
-            self.level = lvl_setting
+        if level is not None:
+            lvl_setting = level
+        elif RTS_Logger._global_level is not None:
+            lvl_setting = RTS_Logger._global_level
         else:
-            raise TypeError("level must be either LogLevel or string key")
+            lvl_setting = cli_settings.log_level
 
         # 2) Определяем имя логгера
         if name is None:
@@ -58,34 +93,61 @@ class RTS_Logger:
             mod = inspect.getmodule(frame)
             name = mod.__name__ if mod else "rts"
         self.logger = logging.getLogger(name)
+        self.set_level(lvl_setting)
+        RTS_Logger._instances.add(self)
+
+    def set_level(self, level: Union[LogLevel, str]) -> None:
+        """Меняет уровень этого логгера и пересчитывает гарды."""
+        self.level = _parse_level(level)
+        self.lvl1 = LOGGING_ENABLED and self.level.value >= LogLevel.BRIEF.value
+        self.lvl2 = LOGGING_ENABLED and self.level.value >= LogLevel.DETAILED.value
+        self.lvl3 = LOGGING_ENABLED and self.level.value >= LogLevel.FULL.value
         self._configure_handlers()
 
+    @classmethod
+    def set_global_level(cls, level: Union[LogLevel, str]) -> None:
+        """Выставляет уровень всем существующим и будущим логгерам."""
+        cls._global_level = _parse_level(level)
+        for inst in list(cls._instances):
+            inst.set_level(cls._global_level)
+
     def _configure_handlers(self) -> None:
         lvlno = LOG_LEVEL_MAP[self.level]
         self.logger.setLevel(lvlno)
         # добавляем один StreamHandler, если его ещё нет
-        if not any(isinstance(h, logging.StreamHandler) for h in self.logger.handlers):
+        handler = next((h for h in self.logger.handlers if isinstance(h, logging.StreamHandler)), None)
+        if handler is None:
             handler = logging.StreamHandler()
-            handler.setLevel(lvlno)
             fmt = logging.Formatter("[%(name)s]: %(message)s")
             handler.setFormatter(fmt)
             self.logger.addHandler(handler)
+        handler.setLevel(lvlno)
+
+    if LOGGING_ENABLED:
+        def log_lvl1(self, msg: Message, *args, **kwargs) -> None:
+            """BRIEF+: warning & above."""
+            if self.lvl1:
+                self.logger.warning(_render(msg), *args, **kwargs)
+
+        def log_lvl2(self, msg: Message, *args, **kwargs) -> None:
+            """DETAILED+: info & above."""
+            if self.lvl2:
+                self.logger.info(_render(msg), *args, **kwargs)
 
-    def log_lvl1(self, msg: str, *args, **kwargs) -> None:
-        """BRIEF+: warning & above."""
-        if self.level.value >= LogLevel.BRIEF.value:
-            self.logger.warning(msg, *args, **kwargs)
+        def log_lvl3(self, msg: Message, *args, **kwargs) -> None:
+            """FULL+: debug only."""
+            if self.lvl3:
+                self.logger.debug(_render(msg), *args, **kwargs)
+    else:
+        def log_lvl1(self, msg: Message, *args, **kwargs) -> None:
+            """Логирование выключено (TURNSHOCK_LOG_DISABLED)."""
 
-    def log_lvl2(self, msg: str, *args, **kwargs) -> None:
-        """DETAILED+: info & above."""
-        if self.level.value >= LogLevel.DETAILED.value:
-            self.logger.info(msg, *args, **kwargs)
+        def log_lvl2(self, msg: Message, *args, **kwargs) -> None:
+            """Логирование выключено (TURNSHOCK_LOG_DISABLED)."""
 
-    def log_lvl3(self, msg: str, *args, **kwargs) -> None:
-        """FULL+: debug only."""
-        if self.level.value >= LogLevel.FULL.value:
-            self.logger.debug(msg, *args, **kwargs)
+        def log_lvl3(self, msg: Message, *args, **kwargs) -> None:
+            """Логирование выключено (TURNSHOCK_LOG_DISABLED)."""
 
-    def log_error(self, msg: str, *args, **kwargs) -> None:
+    def log_error(self, msg: Message, *args, **kwargs) -> None:
         """Всегда: error."""
-        self.logger.error(msg, *args, **kwargs)
+        self.logger.error(_render(msg), *args, **kwargs)
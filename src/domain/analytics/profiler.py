@@ -0,0 +1,149 @@
+# src/domain/analytics/profiler.py
+
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# сценарий, если игра создана не из generate_games
+DEFAULT_SCENARIO = "default"
+
+
+class FrameStats:
+    """Накопленное по одному стеку: число вызовов, полное и собственное время (с)."""
+
+    __slots__ = ("calls", "total", "self_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+
+
+class TickProfiler:
+    """
+    Лёгкий профайлер тика:
+      - enter(name)/exit() открывают и закрывают кадр; вложенные кадры
+        складываются в стек вида "tick;execute;find_path"
+      - по каждому стеку копятся вызовы, полное и собственное время
+        (собственное = полное минус время вложенных кадров)
+      - статистика раскладывается по scenario (его выставляет runner)
+    Включается через profiling(profiler); без активного профайлера
+    event_tick и обёрнутые profiled() функции работают как обычно.
+    """
+
+    __slots__ = ("scenario", "scenarios", "_stack", "_names")
+
+    def __init__(self) -> None:
+        self.scenario: str = DEFAULT_SCENARIO
+        self.scenarios: Dict[str, Dict[str, FrameStats]] = {}
+        # открытые кадры: [стек-ключ, время входа, время вложенных]
+        self._stack: List[List[Any]] = []
+        self._names: List[str] = []
+
+    def enter(self, name: str) -> None:
+        self._names.append(name)
+        self._stack.append([";".join(self._names), time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        key, started, children = self._stack.pop()
+        self._names.pop()
+        elapsed = time.perf_counter() - started
+        frames = self.scenarios.setdefault(self.scenario, {})
+        rec = frames.get(key)
+        if rec is None:
+            rec = frames[key] = FrameStats()
+        rec.calls += 1
+        rec.total += elapsed
+        rec.self_time += elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @property
+    def depth(self) -> int:
+        """Число открытых кадров."""
+        return len(self._stack)
+
+    def unwind(self, depth: int) -> None:
+        """
+        Закрывает открытые кадры, пока их не останется depth. Для finally:
+        если шаг упал между enter и exit, стек не остаётся разбалансированным
+        и следующие тики не пишутся внутрь чужого кадра.
+        """
+        while len(self._stack) > depth:
+            self.exit()
+
+    def merge(self, other: "TickProfiler") -> None:
+        """Добавляет накопленное другим профайлером (например, из воркера)."""
+        for scenario, frames in other.scenarios.items():
+            mine = self.scenarios.setdefault(scenario, {})
+            for key, rec in frames.items():
+                acc = mine.setdefault(key, FrameStats())
+                acc.calls += rec.calls
+                acc.total += rec.total
+                acc.self_time += rec.self_time
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Flame-сводка по сценариям:
+          {scenario: {"ticks": N, "frames": [{"stack", "calls", "total_ms", "self_ms"}, ...]}}
+        Кадры отсортированы по стеку — соседние строки образуют дерево.
+        """
+        out: Dict[str, Any] = {}
+        for scenario, frames in sorted(self.scenarios.items()):
+            tick = frames.get("tick")
+            out[scenario] = {
+                "ticks": tick.calls if tick else 0,
+                "frames": [
+                    {
+                        "stack": key,
+                        "calls": rec.calls,
+                        "total_ms": round(rec.total * 1000, 3),
+                        "self_ms": round(rec.self_time * 1000, 3),
+                    }
+                    for key, rec in sorted(frames.items())
+                ],
+            }
+        return out
+
+    def dump_json(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.summary(), indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+_active: Optional[TickProfiler] = None
+
+
+def active_profiler() -> Optional[TickProfiler]:
+    return _active
+
+
+@contextmanager
+def profiling(profiler: TickProfiler) -> Iterator[TickProfiler]:
+    """Делает profiler активным на время блока."""
+    global _active
+    prev, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = prev
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Декоратор: вызов функции попадает в активный профайлер кадром name."""
+    def decorate(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            prof = _active
+            if prof is None:
+                return fn(*args, **kwargs)
+            prof.enter(name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                prof.exit()
+        return wrapper  # type: ignore[return-value]
+    return decorate
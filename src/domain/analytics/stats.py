@@ -56,6 +56,17 @@ class StatsTracker:
     def reset(self) -> None:
         self.units: Dict[int, UnitStats] = {}
 
-
-# создать один глобальный трекер
-stats_tracker = StatsTracker()
+    def merge(self, other: "StatsTracker") -> None:
+        """
+        Складывает статистику other в текущий трекер (по id юнита и имени способности).
+        Используется для сведения результатов многих игр / воркеров в один отчёт.
+        """
+        for caster_id, unit_stats in other.units.items():
+            for ability_name, src in unit_stats.by_ability.items():
+                dst = self._get_ability_stats(caster_id, ability_name)
+                dst.uses += src.uses
+                dst.damage_to_enemies += src.damage_to_enemies
+                dst.damage_to_allies += src.damage_to_allies
+                dst.healing += src.healing
+                for eff_type, amount in src.effects_applied.items():
+                    dst.effects_applied[eff_type] = dst.effects_applied.get(eff_type, 0) + amount
@@ -3,6 +3,7 @@ from typing import Literal
 
 TeamId = Literal["A", "B"]
 
+# сторона доски по умолчанию; сценарий задаёт свою ключом "size" в map.json
 BOARD_SIZE: Final = 13
 TICKS_PER_TURN: Final = 16
 MAX_AP: Final = 16
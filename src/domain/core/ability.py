@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from typing import FrozenSet
-from ..enums import EffectType, TargetType
+from ..enums import AbilityKind, EffectType, TargetType
 from .effect import Effect
 
 @dataclass(frozen=True, slots=True)
@@ -18,6 +18,7 @@ class Ability:
       - aoe        — радиус области (0=одноцелевая)
       - bounces    — для цепочек
       - bounce_mult— множитель силы для прыжков
+      - kind       — поведение при исполнении (CAST/MOVE), ключ ACTION_HANDLERS
     """
     name: str
     range: int
@@ -35,3 +36,4 @@ class Ability:
     aoe: int = 0
     bounces: int = 0
     bounce_mult: float = 1.0
+    kind: AbilityKind = AbilityKind.CAST
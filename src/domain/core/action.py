@@ -1,7 +1,7 @@
 # src/domain/core/action.py
 
-from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Optional, Tuple
 from .ability import Ability
 from ..geometry.position import Position
 
@@ -16,7 +16,13 @@ class ActiveAction:
     path: Optional[List[Position]] = field(default=None)
     target_unit_id: Optional[int] = None 
     started: bool = False
-    
+    # id задетых юнитов после apply_ability (для цепных — в порядке прыжков)
+    hits: Tuple[int, ...] = ()
+
+
+    def copy(self) -> "ActiveAction":
+        """Копия с собственным path (ability и позиции неизменяемы)."""
+        return replace(self, path=list(self.path) if self.path is not None else None)
 
     def tick(self) -> bool:
         """
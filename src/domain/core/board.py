@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Optional
 
+from ..constants import BOARD_SIZE
+from ..geometry.bitboard import CellSet
 from ..geometry.position import Position
+from ..geometry.visibility import Visibility, visibility
 
 @dataclass(slots=True)
 class Board:
@@ -13,29 +16,57 @@ class Board:
     Матрица препятствий и «зон» (реген/бафф):
       - obstacles   клетки, по которым нельзя ходить и стрелять
       - regen_zone  клетки, где каждый тик +1 HP
+      - size        сторона квадратной доски (по умолчанию BOARD_SIZE;
+                    сценарий задаёт свою в map.json)
+    Оба поля — битборды CellSet (один int на карту, индекс клетки x * size + y);
+    снаружи они выглядят как Set[Position], на вход принимается любой
+    iterable Position. За игру не меняются.
     """
-    obstacles: Set[Position] = field(default_factory=set)
-    regen_zone: Set[Position] = field(default_factory=set)
+    obstacles: CellSet = field(default_factory=CellSet)
+    regen_zone: CellSet = field(default_factory=CellSet)
+    size: int = BOARD_SIZE
+    _visibility: Optional[Visibility] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.obstacles, CellSet):
+            self.obstacles = CellSet.from_positions(self.obstacles, self.size)
+        if not isinstance(self.regen_zone, CellSet):
+            self.regen_zone = CellSet.from_positions(self.regen_zone, self.size)
+        if self.obstacles.size != self.size or self.regen_zone.size != self.size:
+            raise ValueError(f"cell sets do not match a {self.size}x{self.size} board")
+
+    def layout_key(self) -> CellSet:
+        """
+        Неизменяемый ключ раскладки препятствий — для кэшей «на карту»
+        (flow field, видимость). Препятствия за игру не меняются.
+        """
+        return self.obstacles
+
+    def in_bounds(self, pos: Position) -> bool:
+        return pos.in_bounds(self.size)
 
     def is_blocked(self, pos: Position) -> bool:
         return pos in self.obstacles
 
+    def visibility(self) -> Visibility:
+        """Таблица видимости этой раскладки (общая для карт с теми же препятствиями)."""
+        if self._visibility is None:
+            self._visibility = visibility(self.layout_key())
+        return self._visibility
+
+    def has_los(self, a: Position, b: Position) -> bool:
+        """Линия обзора a↔b (Брезенхем, симметрично; клетки концов не мешают)."""
+        return self.visibility().visible(a, b)
+
     def is_line_blocked(self, a: Position, b: Position) -> bool:
-        # Простая Манхэттен-линия по X или Y
-        if a.x == b.x:
-            step = 1 if b.y > a.y else -1
-            for y in range(a.y + step, b.y, step):
-                if Position(a.x, y) in self.obstacles:
-                    return True
-        elif a.y == b.y:
-            step = 1 if b.x > a.x else -1
-            for x in range(a.x + step, b.x, step):
-                if Position(x, a.y) in self.obstacles:
-                    return True
-        return False
+        return not self.has_los(a, b)
 
     def apply_zone_effects(self, state: 'GameState') -> None:
         """Каждый тик в regen_zone: +1 HP живым юнитам."""
+        if not self.regen_zone.bits:
+            return
         for u in state.units.values():
             if u.pos in self.regen_zone and u.is_alive():
                 u.hp = min(u.profile.max_hp, u.hp + 1)
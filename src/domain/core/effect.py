@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
 from ..enums import EffectType
 
 @dataclass(frozen=True, slots=True)
@@ -12,3 +15,134 @@ class Effect:
     type: EffectType
     value: int
     duration: int
+
+
+class ActiveEffects:
+    """
+    Набор эффектов юнита с инкрементальными агрегатами.
+      - суммы value и количество по каждому EffectType обновляются при
+        наложении, расходовании и истечении — total()/has() за O(1)
+      - истечение планируется мин-кучей по тику истечения: tick() снимает
+        только то, что истекло, а не пересобирает весь список
+    Итерация отдаёт Effect в порядке наложения с оставшейся длительностью
+    (объекты создаются на лету — для UI и сериализации, не для горячего пути).
+    """
+
+    __slots__ = ("_clock", "_seq", "_entries", "_heap", "_totals", "_counts")
+
+    def __init__(self, effects: Iterable[Effect] = ()) -> None:
+        self.reset(effects)
+
+    def reset(self, effects: Iterable[Effect] = ()) -> None:
+        """Полностью заменяет набор эффектов."""
+        self._clock = 0
+        self._seq = 0
+        # seq → (effect, тик истечения); dict хранит порядок наложения
+        self._entries: Dict[int, Tuple[Effect, int]] = {}
+        self._heap: List[Tuple[int, int]] = []
+        self._totals: Dict[EffectType, int] = {}
+        self._counts: Dict[EffectType, int] = {}
+        for eff in effects:
+            self.add(eff)
+
+    def copy(self) -> "ActiveEffects":
+        """Независимая копия (Effect неизменяемы и делятся между копиями)."""
+        clone = ActiveEffects.__new__(ActiveEffects)
+        clone._clock = self._clock
+        clone._seq = self._seq
+        clone._entries = dict(self._entries)
+        clone._heap = list(self._heap)
+        clone._totals = dict(self._totals)
+        clone._counts = dict(self._counts)
+        return clone
+
+    # ─── изменение ─────────────────────────────────────────────────
+
+    def add(self, effect: Effect) -> None:
+        seq = self._seq
+        self._seq += 1
+        expires_at = self._clock + effect.duration
+        self._entries[seq] = (effect, expires_at)
+        heappush(self._heap, (expires_at, seq))
+        t = effect.type
+        self._totals[t] = self._totals.get(t, 0) + effect.value
+        self._counts[t] = self._counts.get(t, 0) + 1
+
+    def consume(self, type: EffectType) -> Optional[Effect]:
+        """Снимает первый эффект данного типа и возвращает его (с оставшейся длительностью)."""
+        seq = self._first_seq(type)
+        if seq is None:
+            return None
+        effect, expires_at = self._entries[seq]
+        self._drop(seq)
+        return Effect(effect.type, effect.value, expires_at - self._clock)
+
+    def tick(self) -> None:
+        """Один ход: длительности уменьшаются на 1, истёкшие эффекты снимаются."""
+        self._clock += 1
+        heap = self._heap
+        while heap and heap[0][0] <= self._clock:
+            _, seq = heappop(heap)
+            # записи, уже снятые через consume, в куче остаются до истечения
+            if seq in self._entries:
+                self._drop(seq)
+
+    # ─── чтение ────────────────────────────────────────────────────
+
+    def total(self, type: EffectType) -> int:
+        """Сумма value всех активных эффектов типа."""
+        return self._totals.get(type, 0)
+
+    def has(self, type: EffectType) -> bool:
+        return self._counts.get(type, 0) > 0
+
+    def first(self, type: EffectType) -> Optional[Effect]:
+        seq = self._first_seq(type)
+        if seq is None:
+            return None
+        effect, expires_at = self._entries[seq]
+        return Effect(effect.type, effect.value, expires_at - self._clock)
+
+    def of_type(self, type: EffectType) -> Iterator[Effect]:
+        if not self.has(type):
+            return
+        for effect, expires_at in list(self._entries.values()):
+            if effect.type is type:
+                yield Effect(effect.type, effect.value, expires_at - self._clock)
+
+    def __iter__(self) -> Iterator[Effect]:
+        clock = self._clock
+        for effect, expires_at in list(self._entries.values()):
+            yield Effect(effect.type, effect.value, expires_at - clock)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rows(self) -> List[Tuple[EffectType, int, int]]:
+        """(type, value, оставшаяся длительность) в порядке наложения — без создания Effect."""
+        clock = self._clock
+        return [(effect.type, effect.value, expires_at - clock) for effect, expires_at in self._entries.values()]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ActiveEffects):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"ActiveEffects({list(self)!r})"
+
+    # ─── внутреннее ────────────────────────────────────────────────
+
+    def _first_seq(self, type: EffectType) -> Optional[int]:
+        if not self.has(type):
+            return None
+        for seq, (effect, _) in self._entries.items():
+            if effect.type is type:
+                return seq
+        return None
+
+    def _drop(self, seq: int) -> None:
+        effect, _ = self._entries.pop(seq)
+        t = effect.type
+        self._totals[t] -= effect.value
+        self._counts[t] -= 1
@@ -0,0 +1,48 @@
+# src/domain/core/rng.py
+
+import random
+from typing import List, Optional
+
+# диапазон, из которого берётся seed, если он не задан явно
+_SEED_BITS = 63
+
+
+class GameRng:
+    """
+    Поток случайных бросков одной игры.
+    Все вероятностные проверки движка (крит/провал, DODGE, BLIND) идут через него,
+    поэтому игра с тем же seed и теми же интентами воспроизводится один в один.
+
+    Поток — последовательность бросков d100 в [0, 100). roll() берёт следующий
+    бросок, rolls(n) — сразу n следующих; порядок значений от способа чтения
+    не зависит.
+    """
+
+    __slots__ = ("seed", "_random")
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        if seed is None:
+            # seed всё равно запоминаем — чтобы игру можно было переиграть
+            seed = random.SystemRandom().getrandbits(_SEED_BITS)
+        self.seed: int = seed
+        self._random = random.Random(seed)
+
+    def roll(self) -> float:
+        """Следующий бросок d100: float в [0, 100)."""
+        return self._random.random() * 100.0
+
+    def rolls(self, n: int) -> List[float]:
+        """Следующие n бросков одним вызовом (для пакетной обработки тика)."""
+        rnd = self._random.random
+        return [rnd() * 100.0 for _ in range(n)]
+
+    def copy(self) -> "GameRng":
+        """Независимая копия с той же позицией в потоке (для форков состояния)."""
+        clone = GameRng.__new__(GameRng)
+        clone.seed = self.seed
+        clone._random = random.Random()
+        clone._random.setstate(self._random.getstate())
+        return clone
+
+    def __repr__(self) -> str:
+        return f"GameRng(seed={self.seed})"
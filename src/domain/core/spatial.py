@@ -0,0 +1,149 @@
+# src/domain/core/spatial.py
+
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+from ..constants import BOARD_SIZE, TeamId
+from ..enums import EffectType
+from ..geometry.position import Position
+from .unit import HeroUnit
+
+# сторона корзины сетки в клетках
+BUCKET_SIZE = 4
+
+_Bucket = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Сеточный индекс живых юнитов: клетки доски сгруппированы в корзины
+    BUCKET_SIZE×BUCKET_SIZE, запрос по радиусу обходит только корзины,
+    пересекающие квадрат радиуса (метрика — Чебышёв, как Position.distance).
+    Результаты упорядочены по id юнита — детерминированно для rng.
+    """
+
+    __slots__ = ("_buckets", "_where")
+
+    def __init__(self) -> None:
+        self._buckets: Dict[_Bucket, Dict[int, HeroUnit]] = {}
+        # id → корзина, в которой юнит сейчас лежит
+        self._where: Dict[int, _Bucket] = {}
+
+    @staticmethod
+    def bucket_of(pos: Position) -> _Bucket:
+        return pos.x // BUCKET_SIZE, pos.y // BUCKET_SIZE
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._where.clear()
+
+    def insert(self, unit: HeroUnit) -> None:
+        key = self.bucket_of(unit.pos)
+        self._buckets.setdefault(key, {})[unit.id] = unit
+        self._where[unit.id] = key
+
+    def remove(self, unit: HeroUnit) -> None:
+        key = self._where.pop(unit.id, None)
+        if key is not None:
+            self._buckets[key].pop(unit.id, None)
+
+    def update(self, unit: HeroUnit) -> None:
+        """Юнит сменил позицию: перекладываем, только если сменилась корзина."""
+        if self._where.get(unit.id) != self.bucket_of(unit.pos):
+            self.remove(unit)
+            self.insert(unit)
+
+    def within(self, center: Position, radius: int, team: Optional[TeamId] = None) -> List[HeroUnit]:
+        """Живые юниты на дистанции ≤ radius от center (опционально — только команды team)."""
+        bx0, by0 = self.bucket_of(Position(center.x - radius, center.y - radius))
+        bx1, by1 = self.bucket_of(Position(center.x + radius, center.y + radius))
+        found: List[HeroUnit] = []
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                bucket = self._buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for u in bucket.values():
+                    if team is not None and u.team != team:
+                        continue
+                    if u.is_alive() and center.distance(u.pos) <= radius:
+                        found.append(u)
+        found.sort(key=lambda u: u.id)
+        return found
+
+    def nearest(
+        self,
+        center: Position,
+        k: int,
+        radius: int,
+        team: Optional[TeamId] = None,
+        exclude: Collection[int] = (),
+        include_center: bool = True,
+    ) -> List[HeroUnit]:
+        """
+        До k ближайших живых юнитов на дистанции ≤ radius, по (дистанция, id).
+        Корзины обходятся кольцами от корзины center; поиск останавливается,
+        как только k-й найденный ближе любой клетки следующего кольца, —
+        дальние корзины не трогаются. exclude — id, которые пропускаются.
+        """
+        if k <= 0:
+            return []
+        cb = self.bucket_of(center)
+        found: List[Tuple[int, int, HeroUnit]] = []
+        for ring in range(radius // BUCKET_SIZE + 2):
+            for key in self._ring(cb, ring):
+                bucket = self._buckets.get(key)
+                if not bucket:
+                    continue
+                for u in bucket.values():
+                    if team is not None and u.team != team:
+                        continue
+                    if u.id in exclude or not u.is_alive():
+                        continue
+                    d = center.distance(u.pos)
+                    if d > radius or (d == 0 and not include_center):
+                        continue
+                    found.append((d, u.id, u))
+            # любая клетка кольца ring+1 не ближе ring*BUCKET_SIZE + 1
+            bound = ring * BUCKET_SIZE + 1
+            if len(found) >= k:
+                found.sort(key=lambda t: (t[0], t[1]))
+                if found[k - 1][0] < bound:
+                    break
+            if bound > radius:
+                break
+        found.sort(key=lambda t: (t[0], t[1]))
+        return [u for _, _, u in found[:k]]
+
+    @staticmethod
+    def _ring(cb: _Bucket, ring: int) -> Iterator[_Bucket]:
+        """Корзины на чебышёвском расстоянии ring (в корзинах) от cb."""
+        cx, cy = cb
+        if ring == 0:
+            yield cb
+            return
+        for bx in range(cx - ring, cx + ring + 1):
+            yield bx, cy - ring
+            yield bx, cy + ring
+        for by in range(cy - ring + 1, cy + ring):
+            yield cx - ring, by
+            yield cx + ring, by
+
+    def taunt_auras(self, size: int = BOARD_SIZE) -> Dict[Position, List[HeroUnit]]:
+        """
+        Клетка → юниты, чья TAUNT-аура её накрывает (в порядке id).
+        Радиус ауры — максимальное value среди TAUNT-эффектов юнита.
+        """
+        auras: Dict[Position, List[HeroUnit]] = {}
+        taunters = [
+            u for bucket in self._buckets.values() for u in bucket.values()
+            if u.is_alive() and u.effects.has(EffectType.TAUNT)
+        ]
+        taunters.sort(key=lambda u: u.id)
+        for u in taunters:
+            r = max(e.value for e in u.effects.of_type(EffectType.TAUNT))
+            for x in range(u.pos.x - r, u.pos.x + r + 1):
+                for y in range(u.pos.y - r, u.pos.y + r + 1):
+                    cell = Position(x, y)
+                    if cell.in_bounds(size):
+                        auras.setdefault(cell, []).append(u)
+        return auras
@@ -1,7 +1,12 @@
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import AbstractSet, Collection, Dict, List, Optional, Set
 from .unit import HeroUnit
 from .board import Board
+from .rng import GameRng
+from .spatial import SpatialIndex
+from ..constants import TeamId
+from ..analytics.stats import StatsTracker
+from ..geometry.position import Position
 
 
 @dataclass(slots=True)
@@ -11,23 +16,125 @@ class GameState:
       - tick           — номер тика
       - units          — словарь id→HeroUnit
       - board          — экземпляр Board
+      - stats          — статистика этой игры (своя у каждого GameState)
+      - rng            — поток случайных бросков игры (seed → воспроизводимость)
+      - scenario       — имя сценария, из которого собрана игра (для отчётов)
+      - _occupancy     — индекс занятости клеток Position→HeroUnit
+                         (обновляется через move_unit / vacate)
+      - _occupied      — те же клетки индексами x * size + y (для find_path)
+      - _spatial       — сеточный индекс живых юнитов для запросов по радиусу
     """
     tick: int
     units: Dict[int, HeroUnit]
     board: Board
+    stats: StatsTracker = field(default_factory=StatsTracker, compare=False)
+    rng: GameRng = field(default_factory=GameRng, compare=False)
+    scenario: Optional[str] = field(default=None, compare=False)
+    _occupancy: Dict[Position, HeroUnit] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _spatial: SpatialIndex = field(
+        default_factory=SpatialIndex, init=False, repr=False, compare=False
+    )
+    _occupied: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def fork(self) -> "GameState":
+        """
+        Дешёвый снимок для поиска (lookahead/MCTS): форк можно гонять через
+        event_tick, не трогая оригинал.
+          - Board, профили и способности общие — за игру они не меняются
+          - юниты копируются через HeroUnit.clone (только изменяемые поля)
+          - rng — копия с той же позиции потока: форк с теми же интентами
+            повторяет оригинал
+          - stats у форка свои, пустые — пробные ходы не попадают в статистику
+        """
+        return GameState(
+            tick=self.tick,
+            units={uid: u.clone() for uid, u in self.units.items()},
+            board=self.board,
+            rng=self.rng.copy(),
+            scenario=self.scenario,
+        )
 
     def clear_temporary(self) -> None:
         for u in self.units.values():
             u.clear_queue()
             u.tick_effects()
 
-    def get_unit_at(self, pos):
+    # ─── occupancy index ───────────────────────────────────────────
+
+    def reindex(self) -> None:
+        """Полностью пересобирает индексы занятости и пространственный по текущим units."""
+        self._occupancy = {}
+        self._occupied = set()
+        self._spatial.clear()
         for u in self.units.values():
-            if u.pos == pos and u.is_alive():
-                return u
+            if u.is_alive():
+                self._occupancy.setdefault(u.pos, u)
+                self._occupied.add(self._cell(u.pos))
+                self._spatial.insert(u)
+
+    def move_unit(self, unit: HeroUnit, pos: Position) -> None:
+        """Переставляет юнита на pos, поддерживая индекс занятости."""
+        if self._occupancy.get(unit.pos) is unit:
+            del self._occupancy[unit.pos]
+            self._occupied.discard(self._cell(unit.pos))
+        unit.pos = pos
+        if unit.is_alive():
+            self._occupancy[pos] = unit
+            self._occupied.add(self._cell(pos))
+            self._spatial.update(unit)
+
+    def vacate(self, unit: HeroUnit) -> None:
+        """Освобождает клетку погибшего юнита."""
+        if self._occupancy.get(unit.pos) is unit:
+            del self._occupancy[unit.pos]
+            self._occupied.discard(self._cell(unit.pos))
+        self._spatial.remove(unit)
+
+    def _cell(self, pos: Position) -> int:
+        return pos.x * self.board.size + pos.y
+
+    def occupied_cells(self) -> AbstractSet[int]:
+        """Индексы клеток из индекса занятости (живость юнита не проверяется)."""
+        return self._occupied
+
+    def get_unit_at(self, pos: Position) -> Optional[HeroUnit]:
+        u = self._occupancy.get(pos)
+        if u is not None and u.is_alive():
+            return u
         return None
 
+    # ─── spatial queries ───────────────────────────────────────────
+
+    def units_in_radius(
+        self,
+        center: Position,
+        radius: int,
+        team: Optional[TeamId] = None,
+    ) -> List[HeroUnit]:
+        """Живые юниты на дистанции ≤ radius от center, по id; team — фильтр по команде."""
+        return self._spatial.within(center, radius, team)
+
+    def nearest_units(
+        self,
+        center: Position,
+        k: int,
+        radius: int,
+        team: Optional[TeamId] = None,
+        include_center: bool = True,
+        exclude: Collection[int] = (),
+    ) -> List[HeroUnit]:
+        """До k ближайших живых юнитов в радиусе radius (ничьи — по id); exclude — id для пропуска."""
+        return self._spatial.nearest(center, k, radius, team, exclude, include_center)
+
+    def taunt_auras(self) -> Dict[Position, List[HeroUnit]]:
+        """Клетка → живые юниты, чья TAUNT-аура её накрывает (в порядке id)."""
+        return self._spatial.taunt_auras(self.board.size)
+
     def is_game_over(self) -> bool:
         teams = {u.team for u in self.units.values() if u.is_alive()}
         return len(teams) <= 1
-
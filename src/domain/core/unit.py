@@ -1,18 +1,19 @@
 # src/domain/core/unit.py
 
 from dataclasses import dataclass, field
-from typing import Optional, Iterable
+from typing import Callable, Dict, Optional, Iterable
 
 from domain.engine.combat import add_effect_to_unit, apply_damage_to_unit, apply_heal_to_unit, calculate_damage
 from domain.geometry.pathfinding import find_path
 
 from ..constants import TeamId
-from ..enums import EffectType, UnitRole
+from ..enums import AbilityKind, EffectType, UnitRole
 from ..geometry.position import Position
 from .ability import Ability
-from .effect import Effect
+from .effect import ActiveEffects, Effect
 from ..heroes.profile import CharacterProfile
 from .action import ActiveAction
+from .rng import GameRng
 from config.logger import RTS_Logger
 
 
@@ -31,7 +32,7 @@ class HeroUnit:
     hp: int =   field(init=False)
     ap: int =   field(init=False)
     luck: int = field(init=False)
-    effects: list[Effect] = field(default_factory=list, init=False)
+    effects: ActiveEffects = field(default_factory=ActiveEffects, init=False)
 
     # single in‐flight action
     current_action: Optional[ActiveAction] = field(default=None, init=False)
@@ -54,31 +55,38 @@ class HeroUnit:
     def luck(self) -> int:
         return self.profile.luck
     
+    def clone(self) -> "HeroUnit":
+        """
+        Копия изменяемой части юнита (hp, ap, позиция, эффекты, действия).
+        profile и способности неизменяемы — общие с оригиналом.
+        """
+        u = HeroUnit(self.id, self.role, self.team, self.pos, self.profile)
+        u.hp = self.hp
+        u.ap = self.ap
+        u.effects = self.effects.copy()
+        if self.current_action is not None:
+            u.current_action = self.current_action.copy()
+        u.completed_action = self.completed_action
+        return u
+
     def tick_effects(self) -> None:
-        remaining = []
-        for eff in self.effects:
-            new_duration = eff.duration - 1
-            if new_duration > 0:
-                # создаём новый Effect (copy with duration-1)
-                new_eff = Effect(eff.type, eff.value, new_duration)
-                remaining.append(new_eff)
-        self.effects = remaining
+        self.effects.tick()
 
     def apply_ap_regen(self) -> None:
         """
         Regenerate AP taking into account SLOW_AP debuffs and AP_BOOST buffs.
         """
         base_regen: int = self.profile.ap_regen
-        slow_amount: int = sum(e.value for e in self.effects if e.type is EffectType.SLOW_AP)
-        boost_amount: int = sum(e.value for e in self.effects if e.type is EffectType.AP_BOOST)
+        slow_amount: int = self.effects.total(EffectType.SLOW_AP)
+        boost_amount: int = self.effects.total(EffectType.AP_BOOST)
 
         regen: int = max(0, base_regen - slow_amount + boost_amount)
         self.ap = min(self.profile.max_ap, self.ap + regen)
 
     # ─── combat shortcuts ──────────────────────────────────────────
 
-    def apply_damage(self, amount: int) -> int:
-        return apply_damage_to_unit(self, amount)
+    def apply_damage(self, amount: int, rng: GameRng) -> int:
+        return apply_damage_to_unit(self, amount, rng)
 
     def apply_heal(self, amount: int) -> int:
         return apply_heal_to_unit(self, amount)
@@ -86,8 +94,8 @@ class HeroUnit:
     def add_effect(self, effect: Effect) -> None:
         add_effect_to_unit(self, effect)
     
-    def calculate_damage(self, ability: Ability) -> int:
-        return calculate_damage(self, ability)
+    def calculate_damage(self, ability: Ability, rng: GameRng) -> int:
+        return calculate_damage(self, ability, rng)
     # ─── action management ──────────────────────────────────
 
     def start_action(
@@ -104,7 +112,8 @@ class HeroUnit:
         if prev and getattr(prev, "started", False):
             # if in the middle of a cast, don't override
             raise RuntimeError("Cannot override a casting action")
-        logger.log_lvl3(f"[start_action] Unit {self.id} ⇒ '{ability.name}' @ {target or target_unit_id}")
+        if logger.lvl3:
+            logger.log_lvl3(f"[start_action] Unit {self.id} ⇒ '{ability.name}' @ {target or target_unit_id}")
         self.current_action = ActiveAction(
             ability=ability,
             target=target,
@@ -118,10 +127,9 @@ class HeroUnit:
         """
         Execute the current_action one tick:
           1) If casting already started → tick down
-          2) Else if it's a movement ability → walk/sprint along path (no stepping onto occupied cells)
-          3) Else if in range & have AP → begin cast
-          4) Else if out of range & have AP → step closer
-          5) Else wait.
+          2) Else dispatch on ability.kind via ACTION_HANDLERS:
+             MOVE → walk/sprint along path (no stepping onto occupied cells);
+             CAST → begin cast if in range & have AP, else step closer, else wait.
         After an action completes, *re-queues* it until overridden.
         Returns the completed ActiveAction once, else None.
         """
@@ -130,7 +138,6 @@ class HeroUnit:
             return None
 
         ab = act.ability
-        name = ab.name.lower()
 
         # determine current target position
         if act.target_unit_id is not None:
@@ -146,83 +153,115 @@ class HeroUnit:
         if getattr(act, "started", False):
             done = act.tick()
             if done:
-                self.completed_action = act
-                logger.log_lvl2(f"Unit {self.id} finished cast '{ab.name}'")
-                completed = act
-                self.current_action = ActiveAction(
-                    ability=ab,
-                    target=act.target,
-                    target_unit_id=act.target_unit_id,
-                    ticks_remaining=ab.cast_time,
-                    path=None,
-                    started=False
-                )
-                return completed
+                if logger.lvl2:
+                    logger.log_lvl2(f"Unit {self.id} finished cast '{ab.name}'")
+                return self._complete(act)
             return None
 
-        # 2) movement abilities
-        if name in ("move_to", "sprint"):
-            if act.path is None:
-                act.path = find_path(self.pos, tgt_pos, state)
-            if not act.path:
-                return None
+        # 2+) поведение по виду способности — один lookup вместо сравнения имён
+        return ACTION_HANDLERS[ab.kind](self, act, tgt_pos, state)
 
-            step_len = ab.range
-            moved = 0
-            while moved < step_len and self.ap > 0 and act.path:
-                next_pos = act.path[0]
-                occupant = state.get_unit_at(next_pos)
-                if occupant and occupant.is_alive() and occupant.id != self.id:
-                    logger.log_lvl2(f"Unit {self.id} movement blocked at {next_pos} by unit {occupant.id}")
-                    break
-                self.pos = act.path.pop(0)
-                self.ap -= 1
-                moved += 1
-
-            if not act.path or self.pos == tgt_pos:
-                logger.log_lvl2(f"Unit {self.id} reached move target {tgt_pos}")
-                completed = act
-                self.current_action = ActiveAction(
-                    ability=ab,
-                    target=act.target,
-                    target_unit_id=act.target_unit_id,
-                    ticks_remaining=ab.cast_time,
-                    path=None,
-                    started=False
-                )
-                return completed
-            return None
+    def _complete(self, act: ActiveAction) -> ActiveAction:
+        """Фиксирует завершение act и ставит ту же способность в очередь заново."""
+        self.completed_action = act
+        ab = act.ability
+        self.current_action = ActiveAction(
+            ability=ab,
+            target=act.target,
+            target_unit_id=act.target_unit_id,
+            ticks_remaining=ab.cast_time,
+            path=None,
+            started=False
+        )
+        return act
 
-        # 3) can start cast?
-        if self.ap >= ab.cost and (name == "sprint" or self.pos.distance(tgt_pos) <= ab.range):
-            self.ap -= ab.cost
-            act.started = True
-            done = act.tick()
-            if done:
-                self.completed_action = act
-                logger.log_lvl2(f"Unit {self.id} instant '{ab.name}'")
-                completed = act
-                self.current_action = ActiveAction(
-                    ability=ab,
-                    target=act.target,
-                    target_unit_id=act.target_unit_id,
-                    ticks_remaining=ab.cast_time,
-                    path=None,
-                    started=False
-                )
-                return completed
-            return None
 
-        # 4) step closer if out of range & have AP
-        if self.ap > 0 and self.pos.distance(tgt_pos) > ab.range:
-            path = find_path(self.pos, tgt_pos, state)
-            if path:
-                next_pos = path[0]
-                occupant = state.get_unit_at(next_pos)
-                if not (occupant and occupant.is_alive() and occupant.id != self.id):
-                    self.pos = next_pos
-                    self.ap -= 1
-            return None
+# ─── action handlers ───────────────────────────────────────────────
+
+ActionHandler = Callable[[HeroUnit, ActiveAction, Position, "GameState"], Optional[ActiveAction]]
+
+# AbilityKind → как продвигается ещё не начатое действие этого вида.
+# Новое поведение (рывок, прыжки…) — новый AbilityKind + register_action_handler.
+ACTION_HANDLERS: Dict[AbilityKind, ActionHandler] = {}
 
-        # 5) no AP → wait
+
+def register_action_handler(kind: AbilityKind) -> Callable[[ActionHandler], ActionHandler]:
+    def decorate(fn: ActionHandler) -> ActionHandler:
+        ACTION_HANDLERS[kind] = fn
+        return fn
+    return decorate
+
+
+@register_action_handler(AbilityKind.MOVE)
+def _advance_move(unit: HeroUnit, act: ActiveAction, tgt_pos: Position, state: "GameState") -> Optional[ActiveAction]:
+    """Движение (move_to, sprint): до ab.range клеток по пути, не наступая на занятые."""
+    if act.path is None:
+        act.path = find_path(unit.pos, tgt_pos, state, moving_goal=act.target_unit_id is not None)
+    if not act.path:
         return None
+
+    step_len = act.ability.range
+    moved = 0
+    while moved < step_len and unit.ap > 0 and act.path:
+        next_pos = act.path[0]
+        occupant = state.get_unit_at(next_pos)
+        if occupant and occupant.is_alive() and occupant.id != unit.id:
+            if logger.lvl2:
+                logger.log_lvl2(f"Unit {unit.id} movement blocked at {next_pos} by unit {occupant.id}")
+            break
+        state.move_unit(unit, act.path.pop(0))
+        unit.ap -= 1
+        moved += 1
+
+    if not act.path or unit.pos == tgt_pos:
+        if logger.lvl2:
+            logger.log_lvl2(f"Unit {unit.id} reached move target {tgt_pos}")
+        # ход не «исполняет» способность: completed_action не выставляется
+        unit.current_action = ActiveAction(
+            ability=act.ability,
+            target=act.target,
+            target_unit_id=act.target_unit_id,
+            ticks_remaining=act.ability.cast_time,
+            path=None,
+            started=False
+        )
+        return act
+    return None
+
+
+@register_action_handler(AbilityKind.CAST)
+def _advance_cast(unit: HeroUnit, act: ActiveAction, tgt_pos: Position, state: "GameState") -> Optional[ActiveAction]:
+    """
+    Каст: в радиусе и с AP — начать (мгновенный завершается сразу),
+    иначе шаг к цели, иначе ждать.
+    """
+    ab = act.ability
+
+    # 3) can start cast?
+    if unit.ap >= ab.cost and unit.pos.distance(tgt_pos) <= ab.range:
+        unit.ap -= ab.cost
+        act.started = True
+        done = act.tick()
+        if done:
+            if logger.lvl2:
+                logger.log_lvl2(f"Unit {unit.id} instant '{ab.name}'")
+            return unit._complete(act)
+        return None
+
+    # 4) step closer if out of range & have AP
+    #    путь кэшируется в act.path и пересчитывается, только если цель
+    #    сместилась или следующая клетка занята
+    if unit.ap > 0 and unit.pos.distance(tgt_pos) > ab.range:
+        path = act.path
+        if not path or path[-1] != tgt_pos or state.get_unit_at(path[0]) is not None:
+            path = act.path = find_path(unit.pos, tgt_pos, state, moving_goal=act.target_unit_id is not None)
+        if path:
+            next_pos = path[0]
+            occupant = state.get_unit_at(next_pos)
+            if not (occupant and occupant.is_alive() and occupant.id != unit.id):
+                state.move_unit(unit, path.pop(0))
+                unit.ap -= 1
+        return None
+
+    # 5) no AP → wait
+    return None
@@ -1,24 +1,28 @@
 # src/domain/engine/ability_utils.py
 
 from typing import List
+from ..core.ability import Ability
 from ..core.unit import HeroUnit
 from ..geometry.position import Position
 
 
-
-def select_chain_targets(
-    center: Position,
-    state: "GameState",
-    max_targets: int = 3,
-    radius: int = 5
-) -> List[HeroUnit]:
+def chain_targets(state: "GameState", ability: Ability, target_pos: Position) -> List[HeroUnit]:
     """
-    Возвращает до max_targets ближайших живых юнитов (кроме primary)
-    в пределах радиуса manhattan от center.
+    Цепочка попаданий способности с bounces > 0: первичная цель в target_pos,
+    затем до ability.bounces прыжков — каждый на ближайшего ещё не задетого
+    живого юнита команды первичной цели в радиусе ability.aoe от предыдущего.
+    i-й элемент получает эффект с множителем ability.bounce_mult ** i.
+    Пусто, если в target_pos никого нет.
     """
-    units = [
-        u for u in state.units.values()
-        if u.is_alive() and u.pos != center and u.pos.distance(center) <= radius
-    ]
-    units.sort(key=lambda u: u.pos.distance(center))
-    return units[:max_targets]
+    primary = state.get_unit_at(target_pos)
+    if primary is None:
+        return []
+    chain = [primary]
+    hit = {primary.id}
+    for _ in range(ability.bounces):
+        nxt = state.nearest_units(chain[-1].pos, 1, ability.aoe, team=primary.team, exclude=hit)
+        if not nxt:
+            break
+        chain.append(nxt[0])
+        hit.add(nxt[0].id)
+    return chain
@@ -1,6 +1,5 @@
 # src/domain/engine/applier.py
 
-import random
 from typing import List
 
 from domain.engine.combat import calculate_damage
@@ -9,62 +8,79 @@ from ..core.unit import HeroUnit
 from ..core.ability import Ability
 from ..core.effect import EffectType, Effect
 
-from ..analytics.stats import stats_tracker
 from ..geometry.position import Position
+from .ability_utils import chain_targets
+from ..analytics.profiler import profiled
 
 from config.logger import RTS_Logger
 
 logger = RTS_Logger()
 
 
+@profiled("apply_ability")
 def apply_ability(
     state: GameState,
     caster: HeroUnit,
     ability: Ability,
     target_pos: Position
-) -> None:
+) -> List[HeroUnit]:
+    """Применяет ability в target_pos; возвращает задетых юнитов (для цепных — в порядке прыжков)."""
     # зафиксировать факт использования
-    stats_tracker.record_use(caster.id, ability.name)
-    logger.log_lvl2(f"Caster {caster.id} uses '{ability.name}' on {target_pos}")
+    state.stats.record_use(caster.id, ability.name)
+    if logger.lvl2:
+        logger.log_lvl2(f"Caster {caster.id} uses '{ability.name}' on {target_pos}")
 
     # соберём список целей
-    primary = state.get_unit_at(target_pos)
-    targets: List[HeroUnit] = [primary] if primary else []
+    if ability.bounces > 0:
+        # цепная: aoe — радиус прыжка, урон затухает на bounce_mult за прыжок
+        targets = chain_targets(state, ability, target_pos)
+    else:
+        primary = state.get_unit_at(target_pos)
+        targets: List[HeroUnit] = [primary] if primary else []
 
-    if ability.aoe > 0:
-        for u in state.units.values():
-            if u is not primary and u.pos.distance(target_pos) <= ability.aoe:
-                targets.append(u)
+        if ability.aoe > 0:
+            for u in state.units_in_radius(target_pos, ability.aoe):
+                if u is not primary:
+                    targets.append(u)
 
     # примение эффектов
-    for u in targets:
+    for hop, u in enumerate(targets):
         for eff in ability.effects:
 
-            blinds = [e for e in u.effects if e.type is EffectType.BLIND]
-            if blinds:
-                blind = blinds[0]
-                roll = random.uniform(0, 100)
-                logger.log_lvl2(f"Unit {u.id} BLIND roll={roll:.2f} vs chance={blind.value}")
+            blind = u.effects.first(EffectType.BLIND)
+            if blind:
+                roll = state.rng.roll()
+                if logger.lvl2:
+                    logger.log_lvl2(f"Unit {u.id} BLIND roll={roll:.2f} vs chance={blind.value}")
                 if roll < blind.value:
-                    logger.log_lvl2(f"Unit {u.id} evades '{ability.name}' due to BLIND")
+                    if logger.lvl2:
+                        logger.log_lvl2(f"Unit {u.id} evades '{ability.name}' due to BLIND")
                     continue
 
             # 1) Урон — через calculate_damage (учёт crit/fumble, BUFF/DEBUFF на кастере)
             if eff.type is EffectType.DAMAGE:
-                dmg = calculate_damage(caster, ability)
-                dealt = u.apply_damage(dmg)
+                dmg = calculate_damage(caster, ability, state.rng)
+                if hop and ability.bounces:
+                    dmg = int(dmg * ability.bounce_mult ** hop)
+                dealt = u.apply_damage(dmg, state.rng)
+                if not u.is_alive():
+                    state.vacate(u)
                 enemy = (u.team != caster.team)
-                stats_tracker.record_damage(caster.id, ability.name, dealt, enemy)
-                logger.log_lvl3(f"Unit {u.id} took {dealt} damage (rolled {dmg})")
+                state.stats.record_damage(caster.id, ability.name, dealt, enemy)
+                if logger.lvl3:
+                    logger.log_lvl3(f"Unit {u.id} took {dealt} damage (rolled {dmg})")
 
             # 2) Лечение — как было
             elif eff.type is EffectType.HEAL:
                 healed = u.apply_heal(eff.value)
-                stats_tracker.record_heal(caster.id, ability.name, healed)
-                logger.log_lvl3(f"Unit {u.id} healed {healed}")
+                state.stats.record_heal(caster.id, ability.name, healed)
+                if logger.lvl3:
+                    logger.log_lvl3(f"Unit {u.id} healed {healed}")
 
             # 3) Все остальные эффекты (BUFF, DEBUFF, SLOW_AP, AP_BOOST и т.д.) — навешиваем на цель
             else:
                 u.add_effect(eff)
-                stats_tracker.record_effect(caster.id, ability.name, eff.type, eff.value)
-                logger.log_lvl3(f"Unit {u.id} gains {eff.type.name} ({eff.value})")
+                state.stats.record_effect(caster.id, ability.name, eff.type, eff.value)
+                if logger.lvl3:
+                    logger.log_lvl3(f"Unit {u.id} gains {eff.type.name} ({eff.value})")
+    return targets
@@ -1,96 +1,115 @@
 # src/domain/engine/event_loop.py
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from ..core.state import GameState
 from ..core.action import ActiveAction
 from ..core.effect import EffectType
 from ..core.ability import Ability
 from ..core.unit import HeroUnit
+from ..geometry.position import Position
 from .applier import apply_ability
 from ..errors import DomainError
+from ..analytics.profiler import TickProfiler, active_profiler
 from config.logger import RTS_Logger
 
 logger = RTS_Logger(__name__)
 
-def apply_effects(unit: HeroUnit, state: GameState) -> Optional[ActiveAction]:
+def apply_effects(
+    unit: HeroUnit,
+    state: GameState,
+    auras: Optional[Dict[Position, List[HeroUnit]]] = None,
+) -> Optional[ActiveAction]:
     """
     Проверяет эффекты на вражеских юнитах (например, TAUNT) и,
     если нужно, возвращает новый ActiveAction, которым следует
     заменить intent этого юнита.
+    auras — карта TAUNT-аур (state.taunt_auras()); build_intents строит её
+    один раз на тик.
     """
-    for other in state.units.values():
-        if other.team != unit.team and other.is_alive():
-            for eff in other.effects:
-                if eff.type is EffectType.TAUNT and other.pos.distance(unit.pos) <= eff.value:
-                    # вражеский юнит other таунтит этого unit
-                    melee = next((ab for ab in unit.profile.abilities if ab.name == "melee_attack"), None)
-                    if melee and unit.ap >= melee.cost and unit.pos.distance(other.pos) <= melee.range:
-                        logger.log_lvl2(f"Unit {unit.id} is taunted by {other.id}: will melee_attack")
-                        return ActiveAction(
-                            ability=melee,
-                            target=other.pos,
-                            target_unit_id=other.id,
-                            ticks_remaining=melee.cast_time,
-                            path=None,
-                            started=False
-                        )
-                    move = next((ab for ab in unit.profile.abilities if ab.name == "move_to"), None)
-                    if move:
-                        logger.log_lvl2(f"Unit {unit.id} is taunted by {other.id}: will move_to")
-                        return ActiveAction(
-                            ability=move,
-                            target=other.pos,
-                            target_unit_id=other.id,
-                            ticks_remaining=move.cast_time,
-                            path=None,
-                            started=False
-                        )
+    if auras is None:
+        auras = state.taunt_auras()
+    for other in auras.get(unit.pos, ()):
+        if other.team != unit.team:
+            # вражеский юнит other таунтит этого unit
+            melee = unit.profile.melee_ability
+            if melee and unit.ap >= melee.cost and unit.pos.distance(other.pos) <= melee.range:
+                if logger.lvl2:
+                    logger.log_lvl2(f"Unit {unit.id} is taunted by {other.id}: will melee_attack")
+                return ActiveAction(
+                    ability=melee,
+                    target=other.pos,
+                    target_unit_id=other.id,
+                    ticks_remaining=melee.cast_time,
+                    path=None,
+                    started=False
+                )
+            move = unit.profile.move_ability
+            if move:
+                if logger.lvl2:
+                    logger.log_lvl2(f"Unit {unit.id} is taunted by {other.id}: will move_to")
+                return ActiveAction(
+                    ability=move,
+                    target=other.pos,
+                    target_unit_id=other.id,
+                    ticks_remaining=move.cast_time,
+                    path=None,
+                    started=False
+                )
     return None
 
-def event_tick(
-    state: GameState,
-    action_intents: Dict[int, ActiveAction]
-) -> tuple[GameState, Dict[int, bool], bool]:
-    executed: Dict[int, bool] = {}
-    logger.log_lvl2(f"=== Tick {state.tick} START ===")
-    
-    # Шаг 0. Очистить completed_action, оставшееся после прошлого тика
+def age_effects(state: GameState) -> None:
+    """Шаги 0–1: сброс completed_action и старение эффектов."""
     for u in state.units.values():
         u.completed_action = None
-
-    # 1) Aging status effects
     for u in state.units.values():
         if u.is_alive:
             u.tick_effects()
 
-    # 2) Zone effects
-    state.board.apply_zone_effects(state)
 
-    # 3) AP regen
+def regen_ap(state: GameState) -> None:
+    """Шаг 3: регенерация AP живых юнитов."""
     for u in state.units.values():
         if u.is_alive():
             prev = u.ap
             u.apply_ap_regen()
-            logger.log_lvl3(f"Unit {u.id} AP regen {prev}->{u.ap}")
+            if logger.lvl3:
+                logger.log_lvl3(f"Unit {u.id} AP regen {prev}->{u.ap}")
 
-    # 4) Build intents including effect overrides
+
+def build_intents(state: GameState, action_intents: Dict[int, ActiveAction]) -> Dict[int, ActiveAction]:
+    """Шаг 4: интенты игроков + принудительные действия от эффектов (TAUNT)."""
     intents = dict(action_intents)
+    auras = state.taunt_auras()
+    if not auras:
+        return intents
     for u in state.units.values():
         if not u.is_alive():
             continue
-        override = apply_effects(u, state)
+        override = apply_effects(u, state, auras)
         if override:
             intents[u.id] = override
+    return intents
 
-    # 5) STUN: skip any stunned unit
+
+def drop_stunned(intents: Dict[int, ActiveAction], unit_id: int) -> None:
+    """Оглушённый юнит пропускает ход: его интент снимается."""
+    if logger.lvl2:
+        logger.log_lvl2(f"Unit {unit_id} is stunned and skips its turn")
+    intents.pop(unit_id, None)
+
+
+def filter_stunned(state: GameState, intents: Dict[int, ActiveAction]) -> None:
+    """Шаг 5: STUN — снять интенты оглушённых юнитов."""
     for u in state.units.values():
         if not u.is_alive():
             continue
-        if any(e.type is EffectType.STUN for e in u.effects):
-            logger.log_lvl2(f"Unit {u.id} is stunned and skips its turn")
-            intents.pop(u.id, None)
+        if u.effects.has(EffectType.STUN):
+            drop_stunned(intents, u.id)
 
-    # 6) Execute actions
+
+def execute_actions(state: GameState, intents: Dict[int, ActiveAction]) -> Dict[int, bool]:
+    """Шаг 6: исполнение действий; возвращает id→было ли действие на этом тике."""
+    executed: Dict[int, bool] = {}
     for u in state.units.values():
         executed[u.id] = False
         if not u.is_alive():
@@ -102,7 +121,7 @@ def event_tick(
             comp = u.advance_action(state)
             if comp:
                 tgt = state.units[comp.target_unit_id].pos if comp.target_unit_id is not None else comp.target
-                apply_ability(state, u, comp.ability, tgt)
+                comp.hits = tuple(t.id for t in apply_ability(state, u, comp.ability, tgt))
                 executed[u.id] = True
             continue
 
@@ -113,16 +132,88 @@ def event_tick(
                 u.start_action(intent.ability, intent.target, state, intent.target_unit_id)
                 executed[u.id] = True
             except DomainError as e:
-                logger.log_lvl1(f"Unit {u.id} intent failed: {e}")
+                if logger.lvl1:
+                    logger.log_lvl1(f"Unit {u.id} intent failed: {e}")
             continue
 
         # c) continue current_action
         comp = u.advance_action(state)
         if comp and (comp.ability.effects or comp.ability.aoe > 0):
             tgt = state.units[comp.target_unit_id].pos if comp.target_unit_id is not None else comp.target
-            apply_ability(state, u, comp.ability, tgt)
+            comp.hits = tuple(t.id for t in apply_ability(state, u, comp.ability, tgt))
             executed[u.id] = True
+    return executed
+
+
+def event_tick(
+    state: GameState,
+    action_intents: Dict[int, ActiveAction]
+) -> tuple[GameState, Dict[int, bool], bool]:
+    """
+    Один тик симуляции. Шаги вынесены в отдельные функции; BatchEngine
+    (vectorized.py) повторяет их же на столбцах NumPy.
+    При активном профайлере (analytics.profiler.profiling) каждый шаг
+    пишется отдельным кадром внутри кадра "tick".
+    """
+    prof = active_profiler()
+    if prof is None:
+        return _tick(state, action_intents, None)
+    depth = prof.depth
+    prof.enter("tick")
+    try:
+        return _tick(state, action_intents, prof)
+    finally:
+        # исключение в любом шаге: закрываем и его кадр, и "tick"
+        prof.unwind(depth)
+
+
+def _tick(
+    state: GameState,
+    action_intents: Dict[int, ActiveAction],
+    prof: Optional[TickProfiler],
+) -> tuple[GameState, Dict[int, bool], bool]:
+    """Шаги тика; кадры шагов открывает/закрывает prof (кадр "tick" — у event_tick)."""
+    if logger.lvl2:
+        logger.log_lvl2(f"=== Tick {state.tick} START ===")
+
+    # 0-1) Clear completed actions, age status effects
+    if prof:
+        prof.enter("ageing")
+    age_effects(state)
+
+    # 2) Zone effects
+    if prof:
+        prof.exit()
+        prof.enter("zones")
+    state.board.apply_zone_effects(state)
+
+    # 3) AP regen
+    if prof:
+        prof.exit()
+        prof.enter("ap_regen")
+    regen_ap(state)
+
+    # 4) Build intents including effect overrides
+    if prof:
+        prof.exit()
+        prof.enter("intents")
+    intents = build_intents(state, action_intents)
+
+    # 5) STUN: skip any stunned unit
+    if prof:
+        prof.exit()
+        prof.enter("stun")
+    filter_stunned(state, intents)
+
+    # 6) Execute actions
+    if prof:
+        prof.exit()
+        prof.enter("execute")
+    executed = execute_actions(state, intents)
+    if prof:
+        prof.exit()
 
     state.tick += 1
-    logger.log_lvl2(f"=== Tick {state.tick-1} END ===")
+    if logger.lvl2:
+        logger.log_lvl2(f"=== Tick {state.tick-1} END ===")
     return state, executed, state.is_game_over()
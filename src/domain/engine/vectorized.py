@@ -0,0 +1,1291 @@
+# src/domain/engine/vectorized.py
+"""
+Structure-of-arrays бэкенд движка: много независимых игр в одних NumPy-массивах.
+
+Всё состояние игр батча — в столбцах: hp/ap/позиции, слоты эффектов,
+текущие и завершённые действия, пути, индекс занятости клеток и статистика.
+Объекты GameState/HeroUnit во время step не трогаются (кроме GameRng —
+поток бросков у каждой игры свой) и собираются из столбцов по запросу:
+BatchEngine.states синхронизирует их перед отдачей.
+
+Шаги тика:
+  - старение эффектов, зоны, реген AP, TAUNT-оверрайды и STUN — векторно
+    по всему батчу
+  - исполнение действий — по слотам юнитов: k-й юнит всех игр за раз.
+    Внутри игры юниты ходят по очереди (как в execute_actions), поэтому
+    порядок бросков rng и взаимное влияние юнитов те же, а между играми
+    всё векторно: движение, старт и завершение кастов, цели способностей,
+    урон/щиты/уклонение, лечение и эффекты
+  - пути ищутся пакетным BFS по всем играм, которым путь нужен на этом
+    слоте; из кратчайших берётся тот же канонический путь, что и у find_path
+    (pathfinding.canonical_path)
+Поэтому при одинаковом seed результат совпадает с event_tick один в один.
+Сравнение скорости — tools/bench_batch.py.
+
+Требует numpy (extra "fast").
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..analytics.stats import AbilityStats, StatsTracker, UnitStats
+from ..core.ability import Ability
+from ..core.action import ActiveAction
+from ..core.effect import Effect
+from ..core.state import GameState
+from ..core.unit import HeroUnit
+from ..constants import BOARD_SIZE
+from ..enums import AbilityKind, EffectType
+from ..geometry.bitboard import DIRECTIONS_8, cell_positions
+from ..geometry.position import Position
+from ..heroes.profile import CharacterProfile
+
+# начальное число слотов эффектов на юнита (при нехватке массивы растут)
+DEFAULT_EFFECT_SLOTS = 8
+
+# начальная длина буфера пути на юнита (при нехватке растёт)
+DEFAULT_PATH_SLOTS = 32
+
+# код пустого слота эффекта; остальные коды — EffectType.value
+NO_EFFECT = 0
+
+# нет действия / интента (id способности в AbilityTable)
+NO_ABILITY = -1
+
+# цель действия — клетка, а не юнит
+NO_UNIT = -1
+# target_unit_id, которого нет в игре: действие снимается, как с мёртвой целью
+MISSING_UNIT = -2
+
+TEAM_CODES: Dict[str, int] = {"A": 0, "B": 1}
+
+_EFFECTS: Dict[int, EffectType] = {t.value: t for t in EffectType}
+_DAMAGE = EffectType.DAMAGE.value
+_HEAL = EffectType.HEAL.value
+_BUFF = EffectType.BUFF.value
+_DEBUFF = EffectType.DEBUFF.value
+_SLOW_AP = EffectType.SLOW_AP.value
+_AP_BOOST = EffectType.AP_BOOST.value
+_DODGE = EffectType.DODGE.value
+_SHIELD = EffectType.SHIELD.value
+_BLIND = EffectType.BLIND.value
+_STUN = EffectType.STUN.value
+_TAUNT = EffectType.TAUNT.value
+
+# ключ сортировки для «не кандидатов» (уходят в конец)
+_FAR = np.iinfo(np.int32).max
+
+
+class AbilityTable:
+    """
+    Способности батча столбцами; индекс в таблице — id способности в движке.
+    Профили интернируют способности, поэтому таблица короткая (десятки
+    строк на все игры); новая способность из интента добавляется на лету.
+    Эффекты способности идут в порядке перебора Ability.effects — в том же,
+    в каком их применяет apply_ability.
+    """
+
+    def __init__(self, max_hops: int) -> None:
+        self.items: List[Ability] = []
+        # id(ability) → (ability, индекс); ability держится ссылкой, чтобы id не переиспользовался
+        self._by_identity: Dict[int, Tuple[Ability, int]] = {}
+        self._by_value: Dict[Ability, int] = {}
+        self._max_hops = max_hops
+        self._rows: List[Tuple] = []
+        self._effects: List[List[Tuple[int, int, int]]] = []
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def index(self, ability: Ability) -> int:
+        known = self._by_identity.get(id(ability))
+        if known is not None:
+            return known[1]
+        found = self._by_value.get(ability)
+        if found is None:
+            found = len(self.items)
+            self.items.append(ability)
+            self._by_value[ability] = found
+            self._rows.append((
+                ability.range, ability.cost, ability.cast_time, ability.aoe, ability.bounces,
+                ability.kind is AbilityKind.MOVE,
+                bool(ability.effects) or ability.aoe > 0,
+                sum(e.value for e in ability.effects if e.type is EffectType.DAMAGE),
+                getattr(ability, "crit_base", 5.0),
+                getattr(ability, "fumble_base", 2.0),
+                ability.target.value,
+            ))
+            self._effects.append([(e.type.value, e.value, e.duration) for e in ability.effects])
+            self._build()
+        self._by_identity[id(ability)] = (ability, found)
+        return found
+
+    def _build(self) -> None:
+        rows = self._rows or [(0, 0, 0, 0, 0, False, False, 0, 0.0, 0.0, 0)]
+        cols = list(zip(*rows))
+        self.range = np.array(cols[0], dtype=np.int32)
+        self.cost = np.array(cols[1], dtype=np.int32)
+        self.cast_time = np.array(cols[2], dtype=np.int32)
+        self.aoe = np.array(cols[3], dtype=np.int32)
+        self.bounces = np.array(cols[4], dtype=np.int32)
+        self.move = np.array(cols[5], dtype=bool)
+        self.applies = np.array(cols[6], dtype=bool)
+        self.damage = np.array(cols[7], dtype=np.int64)
+        self.crit_base = np.array(cols[8], dtype=np.float64)
+        self.fumble_base = np.array(cols[9], dtype=np.float64)
+        # TargetType.value — движку не нужен, по нему выбирают цели агенты
+        self.target = np.array(cols[10], dtype=np.int8)
+
+        width = max((len(e) for e in self._effects), default=0)
+        n = max(len(self._effects), 1)
+        self.n_effects = np.zeros(n, dtype=np.int32)
+        self.eff_type = np.zeros((n, max(width, 1)), dtype=np.int8)
+        self.eff_value = np.zeros((n, max(width, 1)), dtype=np.int32)
+        self.eff_dur = np.zeros((n, max(width, 1)), dtype=np.int32)
+        for a, effects in enumerate(self._effects):
+            self.n_effects[a] = len(effects)
+            for f, (t, v, d) in enumerate(effects):
+                self.eff_type[a, f] = t
+                self.eff_value[a, f] = v
+                self.eff_dur[a, f] = d
+        # bounce_mult ** hop — степень считает Python, как в apply_ability
+        self.hop_mult = np.array(
+            [[ab.bounce_mult ** h for h in range(self._max_hops)] for ab in self.items]
+            or [[1.0] * self._max_hops],
+            dtype=np.float64,
+        )
+
+
+@dataclass(slots=True)
+class Orders:
+    """
+    Интенты батча столбцами (G, U):
+      - ability      — id способности в AbilityTable движка; NO_ABILITY — интента нет
+      - target_x/y   — клетка цели (ActiveAction.target)
+      - target_slot  — слот юнита-цели; NO_UNIT — цель-клетка
+    """
+    ability: np.ndarray
+    target_x: np.ndarray
+    target_y: np.ndarray
+    target_slot: np.ndarray
+
+    @classmethod
+    def empty(cls, n_games: int, n_units: int) -> "Orders":
+        shape = (n_games, n_units)
+        return cls(
+            ability=np.full(shape, NO_ABILITY, dtype=np.int32),
+            target_x=np.zeros(shape, dtype=np.int32),
+            target_y=np.zeros(shape, dtype=np.int32),
+            target_slot=np.full(shape, NO_UNIT, dtype=np.int32),
+        )
+
+    def clear(self) -> None:
+        self.ability.fill(NO_ABILITY)
+        self.target_slot.fill(NO_UNIT)
+
+    def copy(self) -> "Orders":
+        return Orders(self.ability.copy(), self.target_x.copy(), self.target_y.copy(), self.target_slot.copy())
+
+
+class BatchEngine:
+    """
+    G игр × U юнитов (U — максимум по батчу; лишние слоты помечены present=False).
+
+    Столбцы (shape (G, U), если не сказано иначе):
+      - present, hp, ap, max_hp, max_ap, ap_regen, luck
+      - pos_x, pos_y, team (код из TEAM_CODES)
+      - eff_type / eff_value / eff_dur — (G, U, E) слоты эффектов в порядке
+        наложения; eff_type == NO_EFFECT — пустой слот
+      - act_ability, act_x, act_y, act_unit, act_ticks, act_started —
+        current_action; act_ability == NO_ABILITY — действия нет
+      - path / path_len / path_head — путь действия: клетки (x * S + y)
+        path[g, u, path_head:path_len]; path_len == -1 — путь не считался
+      - done_* — completed_action последнего тика
+      - ability_ids — (G, U, A) способности профиля юнита (id в abilities)
+      - occupancy — (G, S * S) слот живого юнита на клетке + 1 (0 — пусто)
+      - regen, free — (G, S, S) зона регенерации и проходимые клетки; S —
+        наибольшая сторона доски в батче (игры с меньшей доской занимают
+        угол, остальное непроходимо)
+      - tick, running — (G,) номер тика и «игра ещё идёт»
+    Столбцы — единственный источник правды: states собирает из них объекты
+    по запросу, а менять юнитов в states между вызовами step нельзя
+    (изменение не попадёт в столбцы) — игру целиком заменяет reset_game.
+    """
+
+    def __init__(
+        self,
+        states: Sequence[GameState],
+        effect_slots: int = DEFAULT_EFFECT_SLOTS,
+        n_units: Optional[int] = None,
+    ) -> None:
+        """n_units — ширина батча по юнитам (None — максимум по states); задаётся явно,
+        если через reset_game придут игры крупнее стартовых."""
+        self._states: List[GameState] = list(states)
+        self.n_games = len(self._states)
+        widest = max((len(s.units) for s in self._states), default=0)
+        if n_units is not None and n_units < widest:
+            raise ValueError(f"game has {widest} units, batch holds at most {n_units}")
+        self.n_units = widest if n_units is None else n_units
+        G, U = self.n_games, self.n_units
+        shape = (G, U)
+        self.side = max((s.board.size for s in self._states), default=BOARD_SIZE)
+        self.abilities = AbilityTable(max_hops=U + 1)
+        # id(profile) → _profile_abilities (профиль держится ссылкой, чтобы id не переиспользовался)
+        self._profiles: Dict[int, Tuple[CharacterProfile, int, int, List[int]]] = {}
+
+        self.present = np.zeros(shape, dtype=bool)
+        self.hp = np.zeros(shape, dtype=np.int32)
+        self.ap = np.zeros(shape, dtype=np.int32)
+        self.max_hp = np.zeros(shape, dtype=np.int32)
+        self.max_ap = np.zeros(shape, dtype=np.int32)
+        self.ap_regen = np.zeros(shape, dtype=np.int32)
+        self.luck = np.zeros(shape, dtype=np.int32)
+        self.pos_x = np.zeros(shape, dtype=np.int32)
+        self.pos_y = np.zeros(shape, dtype=np.int32)
+        self.team = np.zeros(shape, dtype=np.int8)
+        # ранг id юнита в игре: «по id» в запросах по радиусу и аурах
+        self.id_rank = np.zeros(shape, dtype=np.int32)
+        self.melee = np.full(shape, NO_ABILITY, dtype=np.int32)
+        self.move = np.full(shape, NO_ABILITY, dtype=np.int32)
+        self.ability_ids = np.full(shape + (0,), NO_ABILITY, dtype=np.int32)
+
+        self.eff_type = np.zeros(shape + (effect_slots,), dtype=np.int8)
+        self.eff_value = np.zeros(shape + (effect_slots,), dtype=np.int32)
+        self.eff_dur = np.zeros(shape + (effect_slots,), dtype=np.int32)
+
+        self.act_ability = np.full(shape, NO_ABILITY, dtype=np.int32)
+        self.act_x = np.zeros(shape, dtype=np.int32)
+        self.act_y = np.zeros(shape, dtype=np.int32)
+        self.act_unit = np.full(shape, NO_UNIT, dtype=np.int32)
+        self.act_ticks = np.zeros(shape, dtype=np.int32)
+        self.act_started = np.zeros(shape, dtype=bool)
+        self.path = np.zeros(shape + (DEFAULT_PATH_SLOTS,), dtype=np.int32)
+        self.path_len = np.full(shape, -1, dtype=np.int32)
+        self.path_head = np.zeros(shape, dtype=np.int32)
+
+        self.done_ability = np.full(shape, NO_ABILITY, dtype=np.int32)
+        self.done_x = np.zeros(shape, dtype=np.int32)
+        self.done_y = np.zeros(shape, dtype=np.int32)
+        self.done_unit = np.full(shape, NO_UNIT, dtype=np.int32)
+        self.done_ticks = np.zeros(shape, dtype=np.int32)
+        self.done_hits = np.full(shape + (U + 1,), NO_UNIT, dtype=np.int32)
+        self.done_path = np.zeros_like(self.path)
+        self.done_path_len = np.full(shape, -1, dtype=np.int32)
+        self.done_path_head = np.zeros(shape, dtype=np.int32)
+
+        S = self.side
+        self.occupancy = np.zeros((G, S * S), dtype=np.int32)
+        # те же клетки упакованными битами (см. _pack) — для BFS путей
+        self._words = (S + 63) // 64
+        self._occupied_bits = np.zeros((G, S, self._words), dtype=np.uint64)
+        self._free_bits = np.zeros((G, S, self._words), dtype=np.uint64)
+        self.regen = np.zeros((G, S, S), dtype=bool)
+        self.free = np.zeros((G, S, S), dtype=bool)
+        self.tick = np.zeros(G, dtype=np.int64)
+        self.running = np.ones(G, dtype=bool)
+
+        # статистика apply_ability: (G, U-кастер, id способности[, эффект])
+        self.stat_uses = np.zeros(shape + (0,), dtype=np.int64)
+        self.stat_damage_enemy = np.zeros(shape + (0,), dtype=np.int64)
+        self.stat_damage_ally = np.zeros(shape + (0,), dtype=np.int64)
+        self.stat_healing = np.zeros(shape + (0,), dtype=np.int64)
+        self.stat_effects = np.zeros(shape + (0, 0), dtype=np.int64)
+        # статистика, накопленная играми до попадания в батч
+        self._base_stats: List[StatsTracker] = [StatsTracker() for _ in range(G)]
+
+        # slot → unit id для каждой игры
+        self.unit_ids: List[List[int]] = [[] for _ in range(G)]
+        # slot → юнит и id → slot (для сборки объектов и разбора интентов)
+        self._units: List[List[HeroUnit]] = [[] for _ in range(G)]
+        self._slot_of: List[Dict[int, int]] = [{} for _ in range(G)]
+        # slot → target_unit_id, которого нет в игре (act_unit == MISSING_UNIT)
+        self._missing: List[Dict[int, int]] = [{} for _ in range(G)]
+        # объекты игры отстают от столбцов (step был после последней сборки)
+        self._stale = np.zeros(G, dtype=bool)
+        self._build_neighbours()
+
+        self._load(range(G))
+
+    # ─── public API ─────────────────────────────────────────────────
+
+    @property
+    def states(self) -> List[GameState]:
+        """Игры батча объектами — отстающие собираются из столбцов."""
+        for g in np.flatnonzero(self._stale).tolist():
+            self._sync(g)
+        return self._states
+
+    def reset_game(self, g: int, state: GameState) -> None:
+        """Подменяет g-ю игру новой (например, после её окончания)."""
+        self.reset_games([g], [state])
+
+    def reset_games(self, gs: Sequence[int], states: Sequence[GameState]) -> None:
+        """reset_game сразу для нескольких (разных) игр: столбцы пишутся одним проходом."""
+        for state in states:
+            if len(state.units) > self.n_units:
+                raise ValueError(f"game has {len(state.units)} units, batch holds at most {self.n_units}")
+        for g, state in zip(gs, states):
+            self._states[g] = state
+        self._load(gs)
+        self.running[list(gs)] = [not s.is_game_over() for s in states]
+
+    def orders(self, intents: Sequence[Dict[int, ActiveAction]]) -> Orders:
+        """Интенты по играм (id юнита → ActiveAction) → Orders."""
+        orders = Orders.empty(self.n_games, self.n_units)
+        index = self.abilities.index
+        for g, game_intents in enumerate(intents):
+            if not game_intents:
+                continue
+            slot_of = self._slot_of[g]
+            for uid, act in game_intents.items():
+                slot = slot_of.get(uid)
+                if slot is None or not act:
+                    continue
+                orders.ability[g, slot] = index(act.ability)
+                if act.target is not None:
+                    orders.target_x[g, slot] = act.target.x
+                    orders.target_y[g, slot] = act.target.y
+                if act.target_unit_id is not None:
+                    target = slot_of.get(act.target_unit_id, MISSING_UNIT)
+                    if target == MISSING_UNIT:
+                        self._missing[g][slot] = act.target_unit_id
+                    orders.target_slot[g, slot] = target
+        return orders
+
+    def step(
+        self,
+        intents: Union[None, Orders, Sequence[Dict[int, ActiveAction]]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Один тик во всех идущих играх. intents — Orders или интенты по играм.
+        Возвращает (executed — (G, U) «действие было на этом тике», маску игр,
+        закончившихся на этом тике).
+        Закончившиеся игры дальше не шагают, пока их не заменят через reset_game.
+        """
+        if intents is None:
+            orders = Orders.empty(self.n_games, self.n_units)
+        elif isinstance(intents, Orders):
+            orders = intents.copy()
+        else:
+            orders = self.orders(intents)
+        live = self.running.copy()
+        self._stale |= live
+        self.done_ability[live] = NO_ABILITY
+
+        # 1) ageing, 2) zones, 3) AP regen, 4) TAUNT, 5) STUN — векторно по батчу
+        self._age_effects(live)
+        self._apply_zones(live)
+        self._regen_ap(live)
+        self._taunt_overrides(orders, live)
+        orders.ability[self._stunned()] = NO_ABILITY
+
+        # 6) исполнение — по слотам, k-й юнит всех игр разом
+        executed = np.zeros((self.n_games, self.n_units), dtype=bool)
+        for k in range(self.n_units):
+            self._execute_slot(k, live, orders, executed)
+
+        self.tick[live] += 1
+        finished = live & self._game_over()
+        self.running &= ~finished
+        return executed, finished
+
+    # ─── vectorized phases ─────────────────────────────────────────
+
+    def _age_effects(self, live: np.ndarray) -> None:
+        # как HeroUnit.tick_effects: duration-1, истёкшие выпадают, порядок сохраняется
+        mask = live[:, None, None] & (self.eff_type != NO_EFFECT)
+        self.eff_dur -= mask.astype(self.eff_dur.dtype)
+        expired = mask & (self.eff_dur <= 0)
+        if not expired.any():
+            return
+        self.eff_type[expired] = NO_EFFECT
+        self.eff_value[expired] = 0
+        self.eff_dur[expired] = 0
+        # стабильно сдвигаем живые слоты влево — только у юнитов, где что-то истекло
+        gi, ui = np.nonzero(expired.any(axis=-1))
+        order = np.argsort(self.eff_type[gi, ui] == NO_EFFECT, axis=-1, kind="stable")
+        for col in (self.eff_type, self.eff_value, self.eff_dur):
+            col[gi, ui] = np.take_along_axis(col[gi, ui], order, axis=-1)
+
+    def _apply_zones(self, live: np.ndarray) -> None:
+        g_idx = np.arange(self.n_games)[:, None]
+        on_zone = self.regen[g_idx, self.pos_x, self.pos_y]
+        heal = live[:, None] & self.present & (self.hp > 0) & on_zone
+        self.hp = np.where(heal, np.minimum(self.max_hp, self.hp + 1), self.hp)
+
+    def _regen_ap(self, live: np.ndarray) -> None:
+        slow = np.where(self.eff_type == _SLOW_AP, self.eff_value, 0).sum(axis=-1)
+        boost = np.where(self.eff_type == _AP_BOOST, self.eff_value, 0).sum(axis=-1)
+        regen = np.maximum(0, self.ap_regen - slow + boost)
+        alive = live[:, None] & self.present & (self.hp > 0)
+        self.ap = np.where(alive, np.minimum(self.max_ap, self.ap + regen), self.ap)
+
+    def _taunt_overrides(self, orders: Orders, live: np.ndarray) -> None:
+        """
+        Как build_intents: живой юнит в ауре вражеского TAUNT (первый по id
+        таунтер) бьёт его melee, если хватает AP и дистанции, иначе идёт к нему.
+        """
+        alive = live[:, None] & self.present & (self.hp > 0)
+        radius = np.where(self.eff_type == _TAUNT, self.eff_value, -1).max(axis=-1, initial=-1)
+        radius = np.where(alive, radius, -1)
+        games = np.flatnonzero((radius >= 0).any(axis=1))
+        if not games.size:
+            return
+        x, y, team = self.pos_x[games], self.pos_y[games], self.team[games]
+        # dist[g, i, j] — от юнита i до таунтера j
+        dist = np.maximum(np.abs(x[:, :, None] - x[:, None, :]), np.abs(y[:, :, None] - y[:, None, :]))
+        covered = (
+            alive[games][:, :, None]
+            & (dist <= radius[games][:, None, :])
+            & (team[:, :, None] != team[:, None, :])
+        )
+        melee = self.melee[games]
+        has_melee = melee >= 0
+        melee_ab = np.maximum(melee, 0)
+        melee_ok = (
+            has_melee[:, :, None]
+            & (self.ap[games] >= self.abilities.cost[melee_ab])[:, :, None]
+            & (dist <= self.abilities.range[melee_ab][:, :, None])
+        )
+        valid = covered & (melee_ok | (self.move[games] >= 0)[:, :, None])
+        rank = np.where(valid, self.id_rank[games][:, None, :], _FAR)
+        taunter = rank.argmin(axis=-1)
+        hit = valid.any(axis=-1)
+        gi, si = np.nonzero(hit)
+        if not gi.size:
+            return
+        tj = taunter[gi, si]
+        g = games[gi]
+        use_melee = melee_ok[gi, si, tj]
+        orders.ability[g, si] = np.where(use_melee, melee[gi, si], self.move[g, si])
+        orders.target_x[g, si] = self.pos_x[g, tj]
+        orders.target_y[g, si] = self.pos_y[g, tj]
+        orders.target_slot[g, si] = tj
+
+    def _stunned(self) -> np.ndarray:
+        return self.present & (self.hp > 0) & (self.eff_type == _STUN).any(axis=-1)
+
+    def _game_over(self) -> np.ndarray:
+        alive = self.present & (self.hp > 0)
+        has_a = (alive & (self.team == TEAM_CODES["A"])).any(axis=1)
+        has_b = (alive & (self.team == TEAM_CODES["B"])).any(axis=1)
+        return ~(has_a & has_b)
+
+    # ─── execute_actions по слоту ──────────────────────────────────
+
+    def _execute_slot(self, k: int, live: np.ndarray, orders: Orders, executed: np.ndarray) -> None:
+        """Ход k-го юнита во всех играх: ветки a/b/c execute_actions масками."""
+        gs = np.flatnonzero(live & self.present[:, k] & (self.hp[:, k] > 0))
+        if not gs.size:
+            return
+
+        # a) каст уже идёт — тикает, по завершении применяется
+        casting = self.act_started[gs, k]
+        if casting.any():
+            ga = self._keep_live_targets(gs[casting], k)
+            self.act_ticks[ga, k] -= 1
+            done = ga[self.act_ticks[ga, k] <= 0]
+            if done.size:
+                tx, ty = self._target_pos(done, k)
+                ab = self.act_ability[done, k]
+                self._complete(done, k)
+                self._apply(done, k, ab, tx, ty)
+                executed[done, k] = True
+            gs = gs[~casting]
+
+        # b) новый интент (или оверрайд) — только ставится в очередь
+        fresh = orders.ability[gs, k] != NO_ABILITY
+        if fresh.any():
+            gb = gs[fresh]
+            ab = orders.ability[gb, k]
+            self.act_ability[gb, k] = ab
+            self.act_x[gb, k] = orders.target_x[gb, k]
+            self.act_y[gb, k] = orders.target_y[gb, k]
+            self.act_unit[gb, k] = orders.target_slot[gb, k]
+            self.act_ticks[gb, k] = self.abilities.cast_time[ab]
+            self.act_started[gb, k] = False
+            self.path_len[gb, k] = -1
+            executed[gb, k] = True
+            gs = gs[~fresh]
+
+        # c) продвинуть текущее действие
+        gs = gs[self.act_ability[gs, k] != NO_ABILITY]
+        if not gs.size:
+            return
+        gs = self._keep_live_targets(gs, k)
+        moving = self.abilities.move[self.act_ability[gs, k]]
+        if moving.any():
+            self._advance_move(gs[moving], k, executed)
+        if not moving.all():
+            self._advance_cast(gs[~moving], k, executed)
+
+    def _keep_live_targets(self, gs: np.ndarray, k: int) -> np.ndarray:
+        """Игры, где цель действия k-го юнита жива; у остальных действие снимается."""
+        tu = self.act_unit[gs, k]
+        dead = (tu == MISSING_UNIT) | ((tu >= 0) & (self.hp[gs, np.maximum(tu, 0)] <= 0))
+        if not dead.any():
+            return gs
+        gd = gs[dead]
+        self.act_ability[gd, k] = NO_ABILITY
+        self.act_started[gd, k] = False
+        self.path_len[gd, k] = -1
+        return gs[~dead]
+
+    def _target_pos(self, gs: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Клетка цели: позиция юнита-цели или клетка действия."""
+        tu = self.act_unit[gs, k]
+        on_unit = tu >= 0
+        slot = np.maximum(tu, 0)
+        tx = np.where(on_unit, self.pos_x[gs, slot], self.act_x[gs, k])
+        ty = np.where(on_unit, self.pos_y[gs, slot], self.act_y[gs, k])
+        return tx, ty
+
+    def _complete(self, gs: np.ndarray, k: int) -> None:
+        """HeroUnit._complete: completed_action и та же способность заново в очередь."""
+        ab = self.act_ability[gs, k]
+        self.done_ability[gs, k] = ab
+        self.done_x[gs, k] = self.act_x[gs, k]
+        self.done_y[gs, k] = self.act_y[gs, k]
+        self.done_unit[gs, k] = self.act_unit[gs, k]
+        self.done_ticks[gs, k] = self.act_ticks[gs, k]
+        self.done_path[gs, k] = self.path[gs, k]
+        self.done_path_len[gs, k] = self.path_len[gs, k]
+        self.done_path_head[gs, k] = self.path_head[gs, k]
+        self._requeue(gs, k, ab)
+
+    def _requeue(self, gs: np.ndarray, k: int, ab: np.ndarray) -> None:
+        self.act_ticks[gs, k] = self.abilities.cast_time[ab]
+        self.act_started[gs, k] = False
+        self.path_len[gs, k] = -1
+
+    def _advance_move(self, gs: np.ndarray, k: int, executed: np.ndarray) -> None:
+        """_advance_move: до ability.range клеток по пути, не наступая на занятые."""
+        need = self.path_len[gs, k] < 0
+        if need.any():
+            tx, ty = self._target_pos(gs[need], k)
+            self._find_paths(gs[need], k, tx, ty)
+        gs = gs[self.path_len[gs, k] > self.path_head[gs, k]]
+        if not gs.size:
+            return
+        tx, ty = self._target_pos(gs, k)
+        ab = self.act_ability[gs, k]
+        steps = self.abilities.range[ab]
+        walking = np.ones(gs.size, dtype=bool)
+        for r in range(int(steps.max())):
+            g = gs
+            walking &= (steps > r) & (self.ap[g, k] > 0) & (self.path_head[g, k] < self.path_len[g, k])
+            rows = np.flatnonzero(walking)
+            if not rows.size:
+                break
+            g = gs[rows]
+            nxt = self.path[g, k, self.path_head[g, k]]
+            occupant = self.occupancy[g, nxt]
+            blocked = (occupant != 0) & (occupant != k + 1)
+            walking[rows[blocked]] = False
+            go = ~blocked
+            self._step(g[go], k, nxt[go])
+
+        arrived = (self.path_head[gs, k] >= self.path_len[gs, k]) | (
+            (self.pos_x[gs, k] == tx) & (self.pos_y[gs, k] == ty)
+        )
+        if not arrived.any():
+            return
+        # ход не «исполняет» способность: completed не выставляется
+        ga, ab = gs[arrived], ab[arrived]
+        self._requeue(ga, k, ab)
+        applies = self.abilities.applies[ab]
+        if applies.any():
+            ga, ab = ga[applies], ab[applies]
+            self._apply(ga, k, ab, tx[arrived][applies], ty[arrived][applies])
+            executed[ga, k] = True
+
+    def _advance_cast(self, gs: np.ndarray, k: int, executed: np.ndarray) -> None:
+        """_advance_cast: в радиусе и с AP — начать, иначе шаг к цели, иначе ждать."""
+        ab = self.act_ability[gs, k]
+        tx, ty = self._target_pos(gs, k)
+        dist = np.maximum(np.abs(self.pos_x[gs, k] - tx), np.abs(self.pos_y[gs, k] - ty))
+        in_range = dist <= self.abilities.range[ab]
+        start = (self.ap[gs, k] >= self.abilities.cost[ab]) & in_range
+        if start.any():
+            g, a = gs[start], ab[start]
+            self.ap[g, k] -= self.abilities.cost[a]
+            self.act_started[g, k] = True
+            self.act_ticks[g, k] -= 1
+            done = self.act_ticks[g, k] <= 0
+            if done.any():
+                g, a = g[done], a[done]
+                self._complete(g, k)
+                applies = self.abilities.applies[a]
+                if applies.any():
+                    self._apply(g[applies], k, a[applies], tx[start][done][applies], ty[start][done][applies])
+                    executed[g[applies], k] = True
+
+        # шаг ближе; путь пересчитывается, если цель сместилась или следующая клетка занята
+        closer = ~start & (self.ap[gs, k] > 0) & ~in_range
+        if not closer.any():
+            return
+        g = gs[closer]
+        gx, gy = tx[closer], ty[closer]
+        length, head = self.path_len[g, k], self.path_head[g, k]
+        width = self.path.shape[-1]
+        last = self.path[g, k, np.clip(length - 1, 0, width - 1)]
+        first = self.path[g, k, np.clip(head, 0, width - 1)]
+        need = (length <= head) | (last != gx * self.side + gy) | (self.occupancy[g, first] != 0)
+        if need.any():
+            self._find_paths(g[need], k, gx[need], gy[need])
+        g = g[self.path_len[g, k] > self.path_head[g, k]]
+        if not g.size:
+            return
+        nxt = self.path[g, k, self.path_head[g, k]]
+        occupant = self.occupancy[g, nxt]
+        go = (occupant == 0) | (occupant == k + 1)
+        self._step(g[go], k, nxt[go])
+
+    def _step(self, gs: np.ndarray, k: int, cells: np.ndarray) -> None:
+        """Шаг k-го юнита на следующую клетку пути (move_unit): занятость, позиция, −1 AP."""
+        if not gs.size:
+            return
+        S = self.side
+        old = self.pos_x[gs, k] * S + self.pos_y[gs, k]
+        mine = self.occupancy[gs, old] == k + 1
+        self._occupy(gs[mine], old[mine], 0)
+        self._occupy(gs, cells, k + 1)
+        self.pos_x[gs, k] = cells // S
+        self.pos_y[gs, k] = cells % S
+        self.path_head[gs, k] += 1
+        self.ap[gs, k] -= 1
+
+    # ─── пути ──────────────────────────────────────────────────────
+
+    def _build_neighbours(self) -> None:
+        S = self.side
+        x, y = np.divmod(np.arange(S * S), S)
+        nx = x[:, None] + np.array([dx for dx, _ in DIRECTIONS_8])
+        ny = y[:, None] + np.array([dy for _, dy in DIRECTIONS_8])
+        # клетка → соседи в порядке DIRECTIONS_8 (-1 — за краем)
+        inside = (nx >= 0) & (nx < S) & (ny >= 0) & (ny < S)
+        self._neighbours = np.where(inside, nx * S + ny, -1)
+
+    def _pack(self, cells: np.ndarray) -> np.ndarray:
+        """(n, S, S) bool → (n, S, W) uint64: строка x доски — биты y."""
+        bits = np.packbits(cells, axis=-1, bitorder="little")
+        if bits.shape[-1] == self._words * 8:
+            return bits.view("<u8")
+        out = np.zeros(bits.shape[:-1] + (self._words * 8,), dtype=np.uint8)
+        out[..., :bits.shape[-1]] = bits
+        return out.view("<u8")
+
+    @staticmethod
+    def _bit(masks: np.ndarray, rows: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Бит клетки (x, y) в упакованной маске строки rows."""
+        word = masks[rows, x, y >> 6]
+        return ((word >> (y & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def _dilate(self, front: np.ndarray) -> np.ndarray:
+        """
+        Соседство 8 на упакованных масках: сдвиги ±1 по битам строки
+        (с переносом между словами), затем OR трёх соседних строк.
+        front — (n, S + 2, W) с пустыми строками-рамками; результат — (n, S, W).
+        """
+        one = np.uint64(1)
+        wide = front | (front << one) | (front >> one)
+        if self._words > 1:
+            wide[..., 1:] |= front[..., :-1] >> np.uint64(63)
+            wide[..., :-1] |= front[..., 1:] << np.uint64(63)
+        return wide[:, :-2] | wide[:, 1:-1] | wide[:, 2:]
+
+    def _find_paths(self, gs: np.ndarray, k: int, tx: np.ndarray, ty: np.ndarray) -> None:
+        """
+        find_path для k-го юнита в играх gs одним BFS по всем сразу: волна
+        от старта по свободным клеткам (цель проходима, даже если занята),
+        затем канонический путь от цели назад — как pathfinding.canonical_path.
+        Волна идёт по упакованным битовым маскам: строка доски — одно слово
+        на каждые 64 клетки. Результат — в path/path_len/path_head (пустой
+        путь — path_len 0).
+        """
+        S = self.side
+        n = gs.size
+        rows = np.arange(n)
+        sx, sy = self.pos_x[gs, k], self.pos_y[gs, k]
+        inside = (tx >= 0) & (tx < S) & (ty >= 0) & (ty < S)
+        gx, gy = np.where(inside, tx, 0), np.where(inside, ty, 0)
+        goal = gx * S + gy
+
+        goal_ok = inside & self.free[gs, gx, gy] & ((gx != sx) | (gy != sy))
+        passable = self._free_bits[gs] & ~self._occupied_bits[gs]
+        one = np.uint64(1)
+        passable[rows, gx, gy >> 6] |= goal_ok.astype(np.uint64) << (gy & 63).astype(np.uint64)
+        reached = np.zeros_like(passable)
+        reached[rows, sx, sy >> 6] = one << (sy & 63).astype(np.uint64)
+
+        front = np.zeros((n, S + 2, self._words), dtype=np.uint64)
+        front[:, 1:-1] = reached
+        # levels[d - 1] — клетки на расстоянии d от старта
+        levels: List[np.ndarray] = []
+        pending = goal_ok.copy()
+        while pending.any():
+            grown = self._dilate(front) & passable & ~reached
+            if not grown.any():
+                break
+            levels.append(grown)
+            reached |= grown
+            front[:, 1:-1] = grown
+            pending &= ~self._bit(grown, rows, gx, gy)
+
+        length = np.zeros(n, dtype=np.int32)
+        for d, level in enumerate(levels, 1):
+            length[self._bit(level, rows, gx, gy)] = d
+        found = goal_ok & (length > 0)
+        length[~found] = 0
+        self.path_len[gs, k] = length
+        self.path_head[gs, k] = 0
+        if not found.any():
+            return
+        self._ensure_path_slots(int(length.max()))
+
+        # от цели назад: первый сосед (DIRECTIONS_8) на шаг ближе к старту
+        by_level = np.stack(levels)
+        self.path[gs[found], k, length[found] - 1] = goal[found]
+        cur, left = goal.copy(), length.copy()
+        while True:
+            act = np.flatnonzero(left > 1)
+            if not act.size:
+                break
+            nb = self._neighbours[cur[act]]
+            want = left[act] - 1
+            nx, ny = np.divmod(np.maximum(nb, 0), S)
+            word = by_level[want[:, None] - 1, act[:, None], nx, ny >> 6]
+            closer = (nb >= 0) & ((word >> (ny & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+            cur[act] = nb[np.arange(act.size), closer.argmax(axis=1)]
+            left[act] = want
+            self.path[gs[act], k, want - 1] = cur[act]
+
+    def _ensure_path_slots(self, n: int) -> None:
+        have = self.path.shape[-1]
+        if n <= have:
+            return
+        grow = ((0, 0), (0, 0), (0, max(n, have * 2) - have))
+        self.path = np.pad(self.path, grow)
+        self.done_path = np.pad(self.done_path, grow)
+
+    # ─── apply_ability ─────────────────────────────────────────────
+
+    def _apply(self, gs: np.ndarray, k: int, ab: np.ndarray, tx: np.ndarray, ty: np.ndarray) -> None:
+        """
+        apply_ability k-го юнита в играх gs: цели (первичная + AoE по id или
+        цепочка), затем по каждой цели — эффекты способности по очереди.
+        Броски rng — в том же порядке, что и в объектном движке.
+        """
+        table = self._ensure_ability_stats()
+        self.stat_uses[gs, k, ab] += 1
+        targets = self._targets(gs, ab, tx, ty)
+        self.done_hits[gs, k] = NO_UNIT
+        hits = targets.shape[1]
+        self.done_hits[gs, k, :hits] = targets
+        n_eff = table.n_effects[ab]
+        for hop in range(hits):
+            victim = targets[:, hop]
+            hit = victim >= 0
+            if not hit.any():
+                break
+            for f in range(int(n_eff.max(initial=0))):
+                rows = np.flatnonzero(hit & (n_eff > f))
+                if rows.size:
+                    self._apply_effect(gs[rows], k, ab[rows], victim[rows], f, hop)
+
+    def _targets(self, gs: np.ndarray, ab: np.ndarray, tx: np.ndarray, ty: np.ndarray) -> np.ndarray:
+        """(n, H) слоты задетых юнитов по порядку применения; NO_UNIT — конец списка."""
+        S, U = self.side, self.n_units
+        n = gs.size
+        inside = (tx >= 0) & (tx < S) & (ty >= 0) & (ty < S)
+        primary = np.where(inside, self.occupancy[gs, np.where(inside, tx * S + ty, 0)] - 1, NO_UNIT)
+        targets = np.full((n, U + 1), NO_UNIT, dtype=np.int32)
+        targets[:, 0] = primary
+        alive = self.present[gs] & (self.hp[gs] > 0)
+        aoe = self.abilities.aoe[ab]
+        bounces = self.abilities.bounces[ab]
+
+        # AoE: первичная, затем остальные в радиусе от клетки цели — по id
+        area = (aoe > 0) & (bounces == 0)
+        if area.any():
+            r = np.flatnonzero(area)
+            g = gs[r]
+            dist = np.maximum(np.abs(self.pos_x[g] - tx[r, None]), np.abs(self.pos_y[g] - ty[r, None]))
+            cand = alive[r] & (dist <= aoe[r, None]) & (np.arange(U) != primary[r, None])
+            order = np.argsort(np.where(cand, self.id_rank[g], _FAR), axis=1, kind="stable")
+            count = cand.sum(axis=1)
+            offset = (primary[r] >= 0).astype(np.int32)
+            j = np.arange(U)
+            keep = j < count[:, None]
+            rr = np.broadcast_to(r[:, None], keep.shape)[keep]
+            cc = (offset[:, None] + j)[keep]
+            targets[rr, cc] = order[keep]
+
+        # цепочка: до bounces прыжков на ближайшего (дистанция, id) ещё не
+        # задетого живого юнита команды первичной цели в радиусе aoe
+        chain = (bounces > 0) & (primary >= 0)
+        if chain.any():
+            r = np.flatnonzero(chain)
+            g = gs[r]
+            team = self.team[g, primary[r]]
+            hit = np.zeros((r.size, U), dtype=bool)
+            hit[np.arange(r.size), primary[r]] = True
+            last = primary[r].copy()
+            going = np.ones(r.size, dtype=bool)
+            for b in range(int(bounces[r].max())):
+                going &= bounces[r] > b
+                if not going.any():
+                    break
+                lx = self.pos_x[g, last]
+                ly = self.pos_y[g, last]
+                dist = np.maximum(np.abs(self.pos_x[g] - lx[:, None]), np.abs(self.pos_y[g] - ly[:, None]))
+                cand = alive[r] & (self.team[g] == team[:, None]) & ~hit & (dist <= aoe[r, None])
+                key = np.where(cand, dist.astype(np.int64) * (U + 1) + self.id_rank[g], np.iinfo(np.int64).max)
+                nxt = key.argmin(axis=1)
+                going &= cand.any(axis=1)
+                w = np.flatnonzero(going)
+                targets[r[w], b + 1] = nxt[w]
+                hit[w, nxt[w]] = True
+                last[w] = nxt[w]
+        return targets
+
+    def _apply_effect(self, gs: np.ndarray, k: int, ab: np.ndarray, u: np.ndarray, f: int, hop: int) -> None:
+        """f-й эффект способности ab на юнитов u (по одному в каждой игре gs)."""
+        table = self.abilities
+        kind = table.eff_type[ab, f].astype(np.int32)
+        value = table.eff_value[ab, f]
+        duration = table.eff_dur[ab, f]
+
+        # BLIND цели: бросок на каждый эффект, при успехе эффект мимо
+        has, _, chance, _ = self._first_effect(gs, u, _BLIND)
+        if has.any():
+            r = np.flatnonzero(has)
+            evaded = self._rolls(gs[r]) < chance[r]
+            if evaded.any():
+                keep = np.ones(gs.size, dtype=bool)
+                keep[r[evaded]] = False
+                gs, ab, u, kind, value, duration = gs[keep], ab[keep], u[keep], kind[keep], value[keep], duration[keep]
+                if not gs.size:
+                    return
+
+        dmg = kind == _DAMAGE
+        if dmg.any():
+            self._damage(gs[dmg], k, ab[dmg], u[dmg], hop)
+        heal = kind == _HEAL
+        if heal.any():
+            g, v = gs[heal], u[heal]
+            before = self.hp[g, v]
+            after = np.where(before > 0, np.minimum(self.max_hp[g, v], before + value[heal]), before)
+            self.hp[g, v] = after
+            self.stat_healing[g, k, ab[heal]] += after - before
+        other = ~dmg & ~heal
+        if other.any():
+            g, v, a = gs[other], u[other], ab[other]
+            alive = self.hp[g, v] > 0
+            self._add_effect(g[alive], v[alive], kind[other][alive], value[other][alive], duration[other][alive])
+            self.stat_effects[g, k, a, f] += 1
+
+    def _damage(self, gs: np.ndarray, k: int, ab: np.ndarray, u: np.ndarray, hop: int) -> None:
+        """calculate_damage кастера k + apply_damage_to_unit цели u (DODGE, SHIELD)."""
+        table = self.abilities
+        base = table.damage[ab] + self._total(gs, k, _BUFF) - self._total(gs, k, _DEBUFF)
+        luck = self.luck[gs, k]
+        crit = np.minimum(100.0, table.crit_base[ab] + luck * 0.2)
+        fumble = np.maximum(0.0, table.fumble_base[ab] - luck * 0.1)
+        roll = self._rolls(gs)
+        amount = np.where(
+            roll < fumble, (base * 0.5).astype(np.int64),
+            np.where(roll < fumble + crit, (base * 1.5).astype(np.int64), base),
+        )
+        if hop:
+            bounced = table.bounces[ab] > 0
+            amount = np.where(bounced, (amount * table.hop_mult[ab, hop]).astype(np.int64), amount)
+
+        # DODGE: бросок, при успехе эффект расходуется и урона нет
+        dealt = amount.copy()
+        hits = np.ones(gs.size, dtype=bool)
+        has, idx, chance, _ = self._first_effect(gs, u, _DODGE)
+        if has.any():
+            r = np.flatnonzero(has)
+            dodged = r[self._rolls(gs[r]) < chance[r]]
+            if dodged.size:
+                self._remove_effect(gs[dodged], u[dodged], idx[dodged])
+                hits[dodged] = False
+                dealt[dodged] = 0
+
+        # SHIELD: первый щит снимается, остаток возвращается в конец списка
+        has, idx, shield, left_dur = self._first_effect(gs, u, _SHIELD)
+        has &= hits
+        if has.any():
+            r = np.flatnonzero(has)
+            absorb = np.minimum(shield[r], dealt[r])
+            self._remove_effect(gs[r], u[r], idx[r])
+            rest = shield[r] - absorb
+            back = rest > 0
+            if back.any():
+                rb = r[back]
+                self._add_effect(gs[rb], u[rb], np.full(rb.size, _SHIELD), rest[back], left_dur[rb])
+            dealt[r] -= absorb
+
+        g, v = gs[hits], u[hits]
+        hp = np.maximum(0, self.hp[g, v] - dealt[hits])
+        self.hp[g, v] = hp
+        dead = hp <= 0
+        if dead.any():
+            self._vacate(g[dead], v[dead])
+        enemy = self.team[gs, u] != self.team[gs, k]
+        self.stat_damage_enemy[gs, k, ab] += np.where(enemy, dealt, 0)
+        self.stat_damage_ally[gs, k, ab] += np.where(enemy, 0, dealt)
+
+    def _vacate(self, gs: np.ndarray, u: np.ndarray) -> None:
+        cells = self.pos_x[gs, u] * self.side + self.pos_y[gs, u]
+        mine = self.occupancy[gs, cells] == u + 1
+        self._occupy(gs[mine], cells[mine], 0)
+
+    def _occupy(self, gs: np.ndarray, cells: np.ndarray, slot: Union[int, np.ndarray]) -> None:
+        """occupancy[gs, cells] = slot (slot + 1 юнита, 0 — освободить) вместе с битами."""
+        self.occupancy[gs, cells] = slot
+        x, y = np.divmod(cells, self.side)
+        bit = np.uint64(1) << (y & 63).astype(np.uint64)
+        if np.all(slot == 0):
+            self._occupied_bits[gs, x, y >> 6] &= ~bit
+        else:
+            self._occupied_bits[gs, x, y >> 6] |= bit
+
+    def _rolls(self, gs: np.ndarray) -> np.ndarray:
+        """По броску rng каждой из игр gs (игры в gs не повторяются)."""
+        states = self._states
+        return np.array([states[g].rng.roll() for g in gs.tolist()], dtype=np.float64)
+
+    # ─── слоты эффектов ────────────────────────────────────────────
+
+    def _first_effect(
+        self, gs: np.ndarray, u: np.ndarray, code: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """ActiveEffects.first: (есть ли, слот, value, оставшаяся длительность)."""
+        match = self.eff_type[gs, u] == code
+        idx = match.argmax(axis=1)
+        return match.any(axis=1), idx, self.eff_value[gs, u, idx], self.eff_dur[gs, u, idx]
+
+    def _total(self, gs: np.ndarray, u: Union[int, np.ndarray], code: int) -> np.ndarray:
+        return np.where(self.eff_type[gs, u] == code, self.eff_value[gs, u], 0).sum(axis=1)
+
+    def _remove_effect(self, gs: np.ndarray, u: np.ndarray, idx: np.ndarray) -> None:
+        """Снимает слот idx со сдвигом остальных влево (порядок наложения сохраняется)."""
+        E = self.eff_type.shape[-1]
+        j = np.arange(E)
+        src = np.minimum(j + (j >= idx[:, None]), E - 1)
+        for col in (self.eff_type, self.eff_value, self.eff_dur):
+            rows = np.take_along_axis(col[gs, u], src, axis=1)
+            rows[:, -1] = 0
+            col[gs, u] = rows
+
+    def _add_effect(
+        self, gs: np.ndarray, u: np.ndarray, kind: np.ndarray, value: np.ndarray, duration: np.ndarray
+    ) -> None:
+        """Эффект в конец списка юнита (ActiveEffects.add)."""
+        if not gs.size:
+            return
+        count = (self.eff_type[gs, u] != NO_EFFECT).sum(axis=1)
+        self._ensure_slots(int(count.max()) + 1)
+        self.eff_type[gs, u, count] = kind
+        self.eff_value[gs, u, count] = value
+        self.eff_dur[gs, u, count] = duration
+
+    def _ensure_slots(self, n: int) -> None:
+        have = self.eff_type.shape[-1]
+        if n <= have:
+            return
+        grow = ((0, 0), (0, 0), (0, max(n, have * 2) - have))
+        self.eff_type = np.pad(self.eff_type, grow)
+        self.eff_value = np.pad(self.eff_value, grow)
+        self.eff_dur = np.pad(self.eff_dur, grow)
+
+    def _ensure_ability_stats(self) -> AbilityTable:
+        """Столбцы статистики — по ширине таблицы способностей."""
+        table = self.abilities
+        have = self.stat_uses.shape[-1]
+        width = table.eff_type.shape[-1]
+        if have < len(table) or self.stat_effects.shape[-1] < width:
+            grow = max(len(table), have * 2) - have if have < len(table) else 0
+            pad = ((0, 0), (0, 0), (0, grow))
+            self.stat_uses = np.pad(self.stat_uses, pad)
+            self.stat_damage_enemy = np.pad(self.stat_damage_enemy, pad)
+            self.stat_damage_ally = np.pad(self.stat_damage_ally, pad)
+            self.stat_healing = np.pad(self.stat_healing, pad)
+            self.stat_effects = np.pad(
+                self.stat_effects, pad + ((0, max(0, width - self.stat_effects.shape[-1])),)
+            )
+        return table
+
+    # ─── objects ⇄ arrays ──────────────────────────────────────────
+
+    def _load(self, gs: Sequence[int]) -> None:
+        """Игры gs целиком → столбцы (новые игры или reset_games): каждый столбец пишется разом по всем."""
+        gs = list(gs)
+        if not gs:
+            return
+        S = self.side
+        rows = np.array(gs, dtype=np.intp)
+
+        units: List[HeroUnit] = []
+        game_of: List[int] = []
+        slot_list: List[int] = []
+        for g in gs:
+            state = self._states[g]
+            if state.board.size > S:
+                raise ValueError(f"game board is {state.board.size} cells wide, batch holds at most {S}")
+            game_units = list(state.units.values())
+            self.unit_ids[g] = [u.id for u in game_units]
+            self._units[g] = game_units
+            self._slot_of[g] = {u.id: i for i, u in enumerate(game_units)}
+            self._missing[g] = {}
+            self._base_stats[g] = state.stats
+            units.extend(game_units)
+            game_of.extend([g] * len(game_units))
+            slot_list.extend(range(len(game_units)))
+        gi = np.array(game_of, dtype=np.intp)
+        si = np.array(slot_list, dtype=np.intp)
+        profiles = [u.profile for u in units]
+
+        self.present[rows] = False
+        self.present[gi, si] = True
+        self.hp[rows] = 0
+        self.hp[gi, si] = [u.hp for u in units]
+        self.ap[gi, si] = [u.ap for u in units]
+        self.max_hp[gi, si] = [p.max_hp for p in profiles]
+        self.max_ap[gi, si] = [p.max_ap for p in profiles]
+        self.ap_regen[gi, si] = [p.ap_regen for p in profiles]
+        self.luck[gi, si] = [p.luck for p in profiles]
+        self.pos_x[gi, si] = [u.pos.x for u in units]
+        self.pos_y[gi, si] = [u.pos.y for u in units]
+        self.team[gi, si] = [TEAM_CODES[u.team] for u in units]
+        # ранг id внутри игры: сортировка по (игра, id), минус начало игры в ней
+        order = np.lexsort(([u.id for u in units], gi))
+        ranked = gi[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size) - np.searchsorted(ranked, ranked)
+        self.id_rank[rows] = 0
+        self.id_rank[gi, si] = rank
+
+        known = [self._profile_abilities(p) for p in profiles]
+        self.melee[rows] = NO_ABILITY
+        self.move[rows] = NO_ABILITY
+        self.melee[gi, si] = [k[1] for k in known]
+        self.move[gi, si] = [k[2] for k in known]
+        ability_rows = [k[3] for k in known]
+        width = max(map(len, ability_rows), default=0)
+        if width > self.ability_ids.shape[-1]:
+            grow = width - self.ability_ids.shape[-1]
+            self.ability_ids = np.pad(self.ability_ids, ((0, 0), (0, 0), (0, grow)), constant_values=NO_ABILITY)
+        self.ability_ids[rows] = NO_ABILITY
+        if width:
+            self.ability_ids[gi, si, :width] = [r + [NO_ABILITY] * (width - len(r)) for r in ability_rows]
+
+        self.eff_type[rows] = NO_EFFECT
+        self.eff_value[rows] = 0
+        self.eff_dur[rows] = 0
+        self.act_ability[rows] = NO_ABILITY
+        self.act_started[rows] = False
+        self.path_len[rows] = -1
+        self.path_head[rows] = 0
+        self.done_ability[rows] = NO_ABILITY
+        self.done_hits[rows] = NO_UNIT
+        self.done_path_len[rows] = -1
+        self.done_path_head[rows] = 0
+        # эффекты и действия — только у юнитов, где они есть (в свежей игре их нет)
+        for g, slot, u in zip(game_of, slot_list, units):
+            effects = u.effects.rows()
+            if effects:
+                self._ensure_slots(len(effects))
+                for e, (kind, value, duration) in enumerate(effects):
+                    self.eff_type[g, slot, e] = kind.value
+                    self.eff_value[g, slot, e] = value
+                    self.eff_dur[g, slot, e] = duration
+            if u.current_action is not None or u.completed_action is not None:
+                self._load_actions(g, slot, u)
+
+        self.regen[rows] = False
+        self.free[rows] = False
+        regen: List[Tuple[int, int, int]] = []
+        blocked: List[Tuple[int, int, int]] = []
+        for g in gs:
+            board = self._states[g].board
+            self.free[g, :board.size, :board.size] = True
+            regen.extend((g, p.x, p.y) for p in board.regen_zone)
+            blocked.extend((g, p.x, p.y) for p in board.obstacles)
+        if regen:
+            self.regen[tuple(np.array(regen).T)] = True
+        if blocked:
+            self.free[tuple(np.array(blocked).T)] = False
+
+        # на клетке — первый по слоту живой юнит
+        self.occupancy[rows] = 0
+        alive = np.array([u.is_alive() for u in units], dtype=bool)
+        cells = (self.pos_x[gi, si] * S + self.pos_y[gi, si])[alive]
+        keys, first = np.unique(gi[alive] * (S * S) + cells, return_index=True)
+        self.occupancy[keys // (S * S), keys % (S * S)] = si[alive][first] + 1
+        self._occupied_bits[rows] = self._pack((self.occupancy[rows] != 0).reshape(-1, S, S))
+        self._free_bits[rows] = self._pack(self.free[rows])
+
+        self._ensure_ability_stats()
+        for col in (self.stat_uses, self.stat_damage_enemy, self.stat_damage_ally, self.stat_healing, self.stat_effects):
+            col[rows] = 0
+        self.tick[rows] = [self._states[g].tick for g in gs]
+        self._stale[rows] = False
+
+    def _profile_abilities(self, profile: CharacterProfile) -> Tuple[CharacterProfile, int, int, List[int]]:
+        """(profile, melee, move, способности) в id таблицы; профили интернированы — кэш по identity."""
+        known = self._profiles.get(id(profile))
+        if known is None:
+            index = self.abilities.index
+            known = self._profiles[id(profile)] = (
+                profile,
+                NO_ABILITY if profile.melee_ability is None else index(profile.melee_ability),
+                NO_ABILITY if profile.move_ability is None else index(profile.move_ability),
+                [index(ab) for ab in profile.abilities],
+            )
+        return known
+
+    def _load_actions(self, g: int, slot: int, u: HeroUnit) -> None:
+        """current_action / completed_action юнита → столбцы act_* / done_*."""
+        S = self.side
+        slot_of = self._slot_of[g]
+        index = self.abilities.index
+        act = u.current_action
+        if act is not None:
+            self.act_ability[g, slot] = index(act.ability)
+            self.act_x[g, slot], self.act_y[g, slot] = (act.target.x, act.target.y) if act.target else (0, 0)
+            self.act_unit[g, slot] = self._slot_ref(slot_of, act.target_unit_id)
+            if self.act_unit[g, slot] == MISSING_UNIT:
+                self._missing[g][slot] = act.target_unit_id
+            self.act_ticks[g, slot] = act.ticks_remaining
+            self.act_started[g, slot] = bool(act.started)
+            if act.path is not None:
+                self._ensure_path_slots(len(act.path))
+                self.path[g, slot, :len(act.path)] = [p.x * S + p.y for p in act.path]
+                self.path_len[g, slot] = len(act.path)
+        done = u.completed_action
+        if done is not None:
+            self.done_ability[g, slot] = index(done.ability)
+            self.done_x[g, slot], self.done_y[g, slot] = (done.target.x, done.target.y) if done.target else (0, 0)
+            self.done_unit[g, slot] = self._slot_ref(slot_of, done.target_unit_id)
+            self.done_ticks[g, slot] = done.ticks_remaining
+            hits = [slot_of[uid] for uid in done.hits if uid in slot_of]
+            self.done_hits[g, slot, :len(hits)] = hits
+            if done.path is not None:
+                self._ensure_path_slots(len(done.path))
+                self.done_path[g, slot, :len(done.path)] = [p.x * S + p.y for p in done.path]
+                self.done_path_len[g, slot] = len(done.path)
+
+    @staticmethod
+    def _slot_ref(slot_of: Dict[int, int], unit_id: Optional[int]) -> int:
+        if unit_id is None:
+            return NO_UNIT
+        return slot_of.get(unit_id, MISSING_UNIT)
+
+    def _sync(self, g: int) -> None:
+        """Столбцы игры g → её GameState и HeroUnit (позиции, hp/ap, эффекты, действия, статистика)."""
+        state = self._states[g]
+        units = self._units[g]
+        ids = self.unit_ids[g]
+        items = self.abilities.items
+        cells = cell_positions(self.side)
+        S = self.side
+        n = len(units)
+        hp = self.hp[g, :n].tolist()
+        ap = self.ap[g, :n].tolist()
+        xs = self.pos_x[g, :n].tolist()
+        ys = self.pos_y[g, :n].tolist()
+        counts = (self.eff_type[g, :n] != NO_EFFECT).sum(axis=1).tolist()
+        act_ab = self.act_ability[g, :n].tolist()
+        done_ab = self.done_ability[g, :n].tolist()
+
+        missing = self._missing[g]
+
+        def unit_ref(slot: int, owner: int) -> Optional[int]:
+            if slot == MISSING_UNIT:
+                return missing.get(owner)
+            return ids[slot] if slot >= 0 else None
+
+        for slot, u in enumerate(units):
+            u.hp = hp[slot]
+            u.ap = ap[slot]
+            u.pos = cells[xs[slot] * S + ys[slot]]
+            c = counts[slot]
+            u.effects.reset(
+                Effect(_EFFECTS[t], v, d)
+                for t, v, d in zip(
+                    self.eff_type[g, slot, :c].tolist(),
+                    self.eff_value[g, slot, :c].tolist(),
+                    self.eff_dur[g, slot, :c].tolist(),
+                )
+            )
+            a = act_ab[slot]
+            if a == NO_ABILITY:
+                u.current_action = None
+            else:
+                u.current_action = ActiveAction(
+                    ability=items[a],
+                    target=cells[int(self.act_x[g, slot]) * S + int(self.act_y[g, slot])],
+                    ticks_remaining=int(self.act_ticks[g, slot]),
+                    path=self._path_of(self.path, self.path_head, self.path_len, g, slot),
+                    target_unit_id=unit_ref(int(self.act_unit[g, slot]), slot),
+                    started=bool(self.act_started[g, slot]),
+                )
+            d = done_ab[slot]
+            if d == NO_ABILITY:
+                u.completed_action = None
+            else:
+                hits = [ids[h] for h in self.done_hits[g, slot].tolist() if h >= 0]
+                u.completed_action = ActiveAction(
+                    ability=items[d],
+                    target=cells[int(self.done_x[g, slot]) * S + int(self.done_y[g, slot])],
+                    ticks_remaining=int(self.done_ticks[g, slot]),
+                    path=self._path_of(self.done_path, self.done_path_head, self.done_path_len, g, slot),
+                    target_unit_id=unit_ref(int(self.done_unit[g, slot]), slot),
+                    started=True,
+                    hits=tuple(hits),
+                )
+        state.tick = int(self.tick[g])
+        state.reindex()
+        state.stats = self._stats(g)
+        self._stale[g] = False
+
+    def _path_of(
+        self, path: np.ndarray, head: np.ndarray, length: np.ndarray, g: int, slot: int
+    ) -> Optional[List[Position]]:
+        """Остаток пути из буфера path как список Position (None — путь не считался)."""
+        end = int(length[g, slot])
+        if end < 0:
+            return None
+        cells = cell_positions(self.side)
+        return [cells[i] for i in path[g, slot, int(head[g, slot]):end].tolist()]
+
+    def _stats(self, g: int) -> StatsTracker:
+        """StatsTracker игры g: накопленное до батча + столбцы stat_*."""
+        tracker = StatsTracker()
+        tracker.merge(self._base_stats[g])
+        batch = StatsTracker()
+        items = self.abilities.items
+        table = self.abilities
+        uses = self.stat_uses[g]
+        for slot, a in zip(*(x.tolist() for x in np.nonzero(uses))):
+            ab = items[a]
+            stats = batch.units.setdefault(self.unit_ids[g][slot], UnitStats())
+            entry = stats.by_ability.setdefault(ab.name, AbilityStats())
+            entry.uses += int(uses[slot, a])
+            entry.damage_to_enemies += int(self.stat_damage_enemy[g, slot, a])
+            entry.damage_to_allies += int(self.stat_damage_ally[g, slot, a])
+            entry.healing += int(self.stat_healing[g, slot, a])
+            for f in range(int(table.n_effects[a])):
+                count = int(self.stat_effects[g, slot, a, f])
+                if count:
+                    kind = _EFFECTS[int(table.eff_type[a, f])]
+                    amount = count * int(table.eff_value[a, f])
+                    entry.effects_applied[kind] = entry.effects_applied.get(kind, 0) + amount
+        tracker.merge(batch)
+        return tracker
@@ -15,6 +15,10 @@ class EffectType(Enum):
     CRIT_DAMAGE = auto()
     STUN = auto()
 
+class AbilityKind(Enum):
+    # как юнит исполняет способность по тикам (см. unit.ACTION_HANDLERS)
+    CAST = auto(); MOVE = auto()
+
 class TargetType(Enum):
     ENEMY = auto(); ALLY = auto()
     DEAD_ENEMY = auto(); DEAD_ALLY = auto()
@@ -1,45 +1,99 @@
 # src/domain/factory/game_factory.py
 
-from typing import Dict, Set
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
 from ..core.state import GameState
 from ..core.board import Board
+from ..core.rng import GameRng
 from ..factory.unit_factory import create_heroes_for_setup
 from ..geometry.position import Position
 from ..core.unit import HeroUnit
-from ..constants import TeamId
+from ..constants import BOARD_SIZE, TeamId
 from config.logger import RTS_Logger
 
 
 logger = RTS_Logger()
 
+
+@dataclass(frozen=True, slots=True)
+class ScenarioTemplate:
+    """
+    Скомпилированный сценарий: всё, что одинаково у каждой его игры.
+      - board   — общая для всех игр карта (за игру не меняется; один
+                  layout_key → общие кэши flow field и видимости)
+      - units   — прототипы юнитов в стартовом состоянии; профили в них
+                  неизменяемы и делятся всеми играми
+      - seed    — seed из map.json (None — у каждой игры свой случайный)
+    Новая игра — instantiate(): клон прототипов без повторного разбора JSON.
+    """
+    name: Optional[str]
+    board: Board
+    units: Tuple[HeroUnit, ...]
+    seed: Optional[int] = None
+
+    def instantiate(self, tick: int = 0, seed: Optional[int] = None) -> GameState:
+        """Свежий GameState сценария; seed перекрывает seed шаблона."""
+        rng = GameRng(seed if seed is not None else self.seed)
+        units = {u.id: u.clone() for u in self.units}
+        if logger.lvl2:
+            logger.log_lvl2(f"GameState created: tick={tick}, units={len(units)}, seed={rng.seed}")
+        if logger.lvl3:
+            for u in units.values():
+                logger.log_lvl3(
+                    f"Unit {u.id} | team={u.team} | pos={u.pos} | hp={u.hp}/{u.profile.max_hp} | ap={u.ap}/{u.profile.max_ap}"
+                )
+        return GameState(tick=tick, units=units, board=self.board, rng=rng, scenario=self.name)
+
+
+def compile_scenario(
+    *,
+    hero_setup: Dict[TeamId, list["HeroConfig"]],
+    obstacles: Set[Position],
+    regen_zone: Set[Position],
+    seed: Optional[int] = None,
+    name: Optional[str] = None,
+    size: int = BOARD_SIZE,
+) -> ScenarioTemplate:
+    """
+    Собирает шаблон сценария: карту size×size и прототипы юнитов
+    (профили создаются один раз). Юнит вне доски — ValueError.
+    """
+    board = Board(obstacles=obstacles, regen_zone=regen_zone, size=size)
+    units = tuple(create_heroes_for_setup(hero_setup))
+    for u in units:
+        if not board.in_bounds(u.pos):
+            raise ValueError(f"unit {u.id} at {u.pos} is outside a {size}x{size} board")
+    return ScenarioTemplate(
+        name=name,
+        board=board,
+        units=units,
+        seed=seed,
+    )
+
+
 def build_new_game(
     *,
     tick: int = 0,
     hero_setup: Dict[TeamId, list["HeroConfig"]],
     obstacles: Set[Position],
     regen_zone: Set[Position],
+    seed: Optional[int] = None,
+    size: int = BOARD_SIZE,
 ) -> GameState:
     """
     Собирает новое состояние игры:
       - hero_setup: описание юнитов на старте
-      - obstacles, regen_zone: параметры карты
+      - obstacles, regen_zone, size: параметры карты
+      - seed: seed потока бросков (None — случайный)
+    Для пачек игр одного сценария дешевле один раз compile_scenario
+    и дальше instantiate().
     """
-    
-
-    # 1. Создаём всех юнитов
-    heroes: list[HeroUnit] = create_heroes_for_setup(hero_setup)
-    units: Dict[int, HeroUnit] = {u.id: u for u in heroes}
-
-    # 2. Создаём карту
-    board = Board(obstacles=obstacles, regen_zone=regen_zone)
-
-    # 3. Логгируем создание состояния игры
-    logger.log_lvl2(f"GameState created: tick={tick}, units={len(units)}")
-    for u in units.values():
-        logger.log_lvl3(
-            f"Unit {u.id} | team={u.team} | pos={u.pos} | hp={u.hp}/{u.profile.max_hp} | ap={u.ap}/{u.profile.max_ap}"
-        )
-
-    # 4. Возвращаем GameState
-    return GameState(tick=tick, units=units, board=board)
+    template = compile_scenario(
+        hero_setup=hero_setup,
+        obstacles=obstacles,
+        regen_zone=regen_zone,
+        seed=seed,
+        size=size,
+    )
+    return template.instantiate(tick=tick)
 
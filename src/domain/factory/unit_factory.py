@@ -8,24 +8,7 @@ from ..geometry.position import Position
 from ..core.unit import HeroUnit
 from ..enums import UnitRole
 
-from ..heroes.swordsman_profile import SwordsmanProfile
-from ..heroes.defender_profile import DefenderProfile
-from ..heroes.archer_profile    import ArcherProfile
-from ..heroes.mage_dps_profile  import MageDpsProfile
-from ..heroes.mage_supp_profile import MageSuppProfile
-from ..heroes.assassin_profile import AssassinProfile
-from ..heroes.bard_profile import BardProfile
-
-# маппинг роли → класс профиля
-_PROFILE_MAP: Dict[UnitRole, type] = {
-    UnitRole.SWORDSMAN:    SwordsmanProfile,
-    UnitRole.SHIELD:   DefenderProfile,
-    UnitRole.ARCHER:   ArcherProfile,
-    UnitRole.MAGE_DPS: MageDpsProfile,
-    UnitRole.MAGE_SUPP: MageSuppProfile,
-    UnitRole.ASSASSIN: AssassinProfile,
-    UnitRole.BARD: BardProfile
-}
+from ..heroes.registry import get_profile
 
 def create_heroes_for_setup(
     hero_setup: Dict[TeamId, List["HeroConfig"]]
@@ -33,7 +16,7 @@ def create_heroes_for_setup(
     """
     Для каждого HeroConfig:
       - берём роль
-      - инстанцируем соответствующий CharacterProfile
+      - берём общий экземпляр CharacterProfile роли (heroes.registry)
       - создаём HeroUnit(id, role, team, pos, profile)
     """
     units: List[HeroUnit] = []
@@ -43,8 +26,7 @@ def create_heroes_for_setup(
         for hc in heroes:
             role = UnitRole[hc.role]
             pos = Position(*hc.pos)
-            profile_cls = _PROFILE_MAP[role]
-            profile = profile_cls()  # Composition: единый HeroUnit + профиль
+            profile = get_profile(role)  # Composition: единый HeroUnit + общий профиль
             unit = HeroUnit(
                 id=uid,
                 role=role,
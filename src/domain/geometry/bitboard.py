@@ -0,0 +1,104 @@
+# src/domain/geometry/bitboard.py
+
+from collections.abc import Set
+from functools import lru_cache
+from typing import Iterable, Iterator, Tuple
+
+from ..constants import BOARD_SIZE
+from .position import Position
+
+# порядок соседей — тот же, что и в поиске пути (важно для детерминизма A*)
+DIRECTIONS_8 = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+)
+
+
+def cell_index(pos: Position, size: int = BOARD_SIZE) -> int:
+    """Индекс клетки в битборде: бит x * size + y."""
+    return pos.x * size + pos.y
+
+
+@lru_cache(maxsize=None)
+def cell_positions(size: int = BOARD_SIZE) -> Tuple[Position, ...]:
+    """Индекс → Position; объекты общие, новых Position на каждый запрос не создаётся."""
+    return tuple(Position(x, y) for x in range(size) for y in range(size))
+
+
+@lru_cache(maxsize=None)
+def neighbours8(size: int = BOARD_SIZE) -> Tuple[Tuple[int, ...], ...]:
+    """Индекс → индексы соседей в пределах доски (порядок DIRECTIONS_8)."""
+    table = []
+    for x in range(size):
+        for y in range(size):
+            table.append(tuple(
+                (x + dx) * size + (y + dy)
+                for dx, dy in DIRECTIONS_8
+                if 0 <= x + dx < size and 0 <= y + dy < size
+            ))
+    return tuple(table)
+
+
+class CellSet(Set):
+    """
+    Неизменяемое множество клеток доски size×size поверх одного int
+    (бит x * size + y). Ведёт себя как Set[Position] — перебор, in, len,
+    сравнение с обычными set/frozenset, хэш совместим с frozenset, — а
+    внутренние проверки идут битовыми операциями по индексу (has, bits).
+    """
+
+    __slots__ = ("bits", "size", "_cached_hash")
+
+    def __init__(self, bits: int = 0, size: int = BOARD_SIZE) -> None:
+        self.bits = bits
+        self.size = size
+        self._cached_hash = None
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position], size: int = BOARD_SIZE) -> "CellSet":
+        bits = 0
+        for p in positions:
+            if not (0 <= p.x < size and 0 <= p.y < size):
+                raise ValueError(f"cell {p} is outside a {size}x{size} board")
+            bits |= 1 << (p.x * size + p.y)
+        return cls(bits, size)
+
+    def _from_iterable(self, positions: Iterable[Position]) -> "CellSet":
+        # операции Set (|, &, -) собирают результат на той же доске
+        return CellSet.from_positions(positions, self.size)
+
+    def has(self, index: int) -> bool:
+        return self.bits >> index & 1 == 1
+
+    def __contains__(self, pos: object) -> bool:
+        if not isinstance(pos, Position):
+            return False
+        size = self.size
+        if not (0 <= pos.x < size and 0 <= pos.y < size):
+            return False
+        return self.bits >> (pos.x * size + pos.y) & 1 == 1
+
+    def __iter__(self) -> Iterator[Position]:
+        cells = cell_positions(self.size)
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield cells[low.bit_length() - 1]
+            bits ^= low
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CellSet):
+            return self.bits == other.bits and self.size == other.size
+        return Set.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        # Set._hash — тот же алгоритм, что у frozenset: ключи кэшей взаимозаменяемы
+        if self._cached_hash is None:
+            self._cached_hash = self._hash()
+        return self._cached_hash
+
+    def __repr__(self) -> str:
+        return f"CellSet({sorted((p.x, p.y) for p in self)}, size={self.size})"
@@ -1,56 +1,254 @@
 # src/domain/geometry/pathfinding.py
 
-from collections import deque
-from typing import List, Dict
+from array import array
+from collections import OrderedDict, deque
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import count
+from typing import AbstractSet, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
+from ..analytics.profiler import profiled
+from ..geometry.bitboard import CellSet, cell_positions, neighbours8
 from ..geometry.position import Position
 from config.logger import RTS_Logger
 
 logger = RTS_Logger()
 
 
-DIRECTIONS_8 = [
-    (1, 0), (-1, 0), (0, 1), (0, -1),
-    (1, 1), (1, -1), (-1, 1), (-1, -1)
-]
+# бюджет памяти кэша flow field (ключ — раскладка карты + цель); поле —
+# array('i') на size² клеток: 676 байт на 13×13, 64 КБ на 128×128
+FLOW_FIELD_CACHE_BYTES = 32 * 1024 * 1024
 
-def find_path(start: Position, goal: Position, state: "GameState") -> List[Position]:
+# сколько масок препятствий держим (по одной на раскладку)
+BLOCKED_MASK_CACHE_SIZE = 64
+
+# значение flow field для клеток, откуда цель недостижима
+UNREACHABLE = -1
+
+
+class FlowFieldCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    fields: int
+    nbytes: int
+
+
+class _FieldCache:
+    """LRU flow field'ов, ограниченный суммарным размером полей, а не их числом."""
+
+    __slots__ = ("budget", "nbytes", "hits", "misses", "_fields")
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self._fields: "OrderedDict[Tuple[AbstractSet[Position], Position], array]" = OrderedDict()
+        self.clear()
+
+    def get(self, key: Tuple[AbstractSet[Position], Position]) -> Optional[array]:
+        found = self._fields.get(key)
+        if found is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._fields.move_to_end(key)
+        return found
+
+    def put(self, key: Tuple[AbstractSet[Position], Position], field: array) -> None:
+        self._fields[key] = field
+        self.nbytes += len(field) * field.itemsize
+        while self.nbytes > self.budget and len(self._fields) > 1:
+            _, old = self._fields.popitem(last=False)
+            self.nbytes -= len(old) * old.itemsize
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self.nbytes = self.hits = self.misses = 0
+
+    def info(self) -> FlowFieldCacheInfo:
+        return FlowFieldCacheInfo(self.hits, self.misses, len(self._fields), self.nbytes)
+
+
+_flow_fields = _FieldCache(FLOW_FIELD_CACHE_BYTES)
+
+
+def flow_field_cache_info() -> FlowFieldCacheInfo:
+    return _flow_fields.info()
+
+
+def flow_field_cache_clear() -> None:
+    _flow_fields.clear()
+
+
+def chebyshev(a: Position, b: Position) -> int:
+    """Чебышёвская дистанция — та же метрика, что и Position.distance."""
+    return max(abs(a.x - b.x), abs(a.y - b.y))
+
+
+def _as_cells(obstacles: AbstractSet[Position]) -> CellSet:
+    if isinstance(obstacles, CellSet):
+        return obstacles
+    return CellSet.from_positions(obstacles)
+
+
+@lru_cache(maxsize=BLOCKED_MASK_CACHE_SIZE)
+def blocked_mask(obstacles: AbstractSet[Position]) -> bytes:
     """
-    BFS: возвращает список позиций от start (не включая) до goal (включая),
+    Препятствия раскладки байтовой маской по индексу клетки (1 — препятствие):
+    проверка mask[i] вместо сдвига битборда на size² бит на каждом соседе.
+    """
+    obstacles = _as_cells(obstacles)
+    size = obstacles.size
+    mask = bytearray(size * size)
+    for p in obstacles:
+        mask[p.x * size + p.y] = 1
+    return bytes(mask)
+
+
+def flow_field(obstacles: AbstractSet[Position], goal: Position) -> Sequence[int]:
+    """
+    Поле расстояний до goal по статичной карте (только препятствия, без юнитов),
+    индексированное клеткой битборда (x * size + y).
+    Считается одним BFS от цели и кэшируется на раскладку карты, поэтому все
+    юниты, идущие к одной клетке, делят один поиск. Имеет смысл только для
+    неподвижных целей — см. find_path.
+    Клетки, из которых goal недостижима (и сами препятствия), — UNREACHABLE.
+    """
+    key = (obstacles, goal)
+    cached = _flow_fields.get(key)
+    if cached is not None:
+        return cached
+
+    obstacles = _as_cells(obstacles)
+    size = obstacles.size
+    dist = array("i", [UNREACHABLE]) * (size * size)
+    if 0 <= goal.x < size and 0 <= goal.y < size and goal not in obstacles:
+        blocked = blocked_mask(obstacles)
+        nbrs = neighbours8(size)
+        gi = goal.x * size + goal.y
+        dist[gi] = 0
+        q = deque([gi])
+        while q:
+            cur = q.popleft()
+            d = dist[cur] + 1
+            for nxt in nbrs[cur]:
+                if dist[nxt] != UNREACHABLE or blocked[nxt]:
+                    continue
+                dist[nxt] = d
+                q.append(nxt)
+    _flow_fields.put(key, dist)
+    return dist
+
+
+def _no_path(start: Position, goal: Position) -> List[Position]:
+    if logger.lvl2:
+        logger.log_lvl2(f"[find_path] No path found from {start} to {goal}")
+    return []
+
+
+@profiled("find_path")
+def find_path(
+    start: Position,
+    goal: Position,
+    state: "GameState",
+    moving_goal: bool = False,
+) -> List[Position]:
+    """
+    A*: возвращает список позиций от start (не включая) до goal (включая),
     обходя препятствия и занятые клетки.
+    Эвристика для неподвижной цели — расстояние из flow field (точная длина
+    пути по статичной карте), поэтому без помех со стороны юнитов поиск идёт
+    прямо по кратчайшему пути, а поле делят все, кто идёт к этой клетке.
+    Для цели, которая двигается (юнит: moving_goal=True), поле пришлось бы
+    строить BFS по всей карте на каждое её смещение — там обычный A* с
+    чебышёвской эвристикой.
+    Поиск идёт по индексам клеток с готовой таблицей соседей; препятствия —
+    байтовая маска раскладки, занятость — state.occupied_cells().
+    Из кратчайших путей выбирается канонический (см. canonical_path), а не
+    тот, что первым снялся с кучи.
     Если путь не найден — возвращает [].
     """
-    logger.log_lvl3(f"[find_path] start={start}, goal={goal}")
+    if logger.lvl3:
+        logger.log_lvl3(f"[find_path] start={start}, goal={goal}")
     if start == goal:
         logger.log_lvl3("[find_path] start == goal, empty path.")
         return []
 
-    visited = {start}
-    prev: Dict[Position, Position] = {}
-    q = deque([start])
+    obstacles = state.board.layout_key()
+    size = obstacles.size
+    if not (0 <= goal.x < size and 0 <= goal.y < size) or goal in obstacles:
+        return _no_path(start, goal)
 
-    while q:
-        cur = q.popleft()
-        for dx, dy in DIRECTIONS_8:
-            nxt = Position(cur.x + dx, cur.y + dy)
-            if not nxt.in_bounds():
-                continue
-            if state.board.is_blocked(nxt):
+    si = start.x * size + start.y
+    gi = goal.x * size + goal.y
+    blocked = blocked_mask(obstacles)
+    gx, gy = goal.x, goal.y
+    if moving_goal:
+        field = None
+        h0 = chebyshev(start, goal)
+    else:
+        field = flow_field(obstacles, goal)
+        h0 = field[si]
+        if h0 == UNREACHABLE:
+            return _no_path(start, goal)
+
+    cells = cell_positions(size)
+    nbrs = neighbours8(size)
+    occupied = state.occupied_cells()
+
+    seq = count()
+    g: Dict[int, int] = {si: 0}
+    closed = set()
+    heap = [(h0, h0, next(seq), si)]
+    # длина кратчайшего пути: после того как goal снята с кучи, доразбираем
+    # все узлы с f ≤ length — так g точно известен на всех кратчайших путях
+    length = None
+
+    while heap:
+        f, _, _, cur = heappop(heap)
+        if length is not None and f > length:
+            break
+        if cur == gi:
+            length = g[gi]
+            continue
+        if cur in closed:
+            continue
+        closed.add(cur)
+
+        g_next = g[cur] + 1
+        for nxt in nbrs[cur]:
+            if blocked[nxt] or g_next >= g.get(nxt, g_next + 1):
                 continue
-            occ = state.get_unit_at(nxt)
-            if occ and nxt != goal:
+            if nxt != gi and nxt in occupied and state.get_unit_at(cells[nxt]) is not None:
                 continue
-            if nxt in visited:
+            if field is None:
+                p = cells[nxt]
+                dx, dy = p.x - gx, p.y - gy
+                h = max(dx if dx >= 0 else -dx, dy if dy >= 0 else -dy)
+            else:
+                # goal оттуда недостижима
+                h = field[nxt]
+                if h == UNREACHABLE:
+                    continue
+            if length is not None and g_next + h > length:
                 continue
-            # (MVP: можно пропустить угловую проверку)
-            visited.add(nxt)
-            prev[nxt] = cur
-            if nxt == goal:
-                path = [goal]
-                while path[-1] != start:
-                    path.append(prev[path[-1]])
-                return list(reversed(path))[1:]
-            q.append(nxt)
-            
-    logger.log_lvl2(f"[find_path] No path found from {start} to {goal}")
-    return []
+            g[nxt] = g_next
+            heappush(heap, (g_next + h, h, next(seq), nxt))
+
+    if length is None:
+        return _no_path(start, goal)
+    return [cells[i] for i in canonical_path(gi, g, nbrs)]
+
+
+def canonical_path(goal: int, dist: Mapping[int, int], nbrs: Sequence[Sequence[int]]) -> List[int]:
+    """
+    Путь от старта (не включая) до goal по расстояниям от старта dist:
+    от goal назад, каждый раз — в первого соседа (порядок DIRECTIONS_8)
+    на шаг ближе к старту. Не зависит от порядка обхода поиска, поэтому
+    A* здесь и пакетный BFS BatchEngine выбирают один и тот же путь.
+    """
+    path = [goal]
+    cur = goal
+    for d in range(dist[goal] - 1, 0, -1):
+        cur = next(m for m in nbrs[cur] if dist.get(m) == d)
+        path.append(cur)
+    path.reverse()
+    return path
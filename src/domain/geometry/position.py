@@ -12,5 +12,6 @@ class Position:
         else:
             raise TypeError(f"manhattan: expected Position or object with .pos, got {type(other)}")
     
-    def in_bounds(self) -> bool:
-        return 0 <= self.x < BOARD_SIZE and 0 <= self.y < BOARD_SIZE
+    def in_bounds(self, size: int = BOARD_SIZE) -> bool:
+        """Клетка на доске size×size (у карты своя сторона — Board.size)."""
+        return 0 <= self.x < size and 0 <= self.y < size
@@ -0,0 +1,104 @@
+# src/domain/geometry/visibility.py
+
+from functools import lru_cache
+from typing import AbstractSet, Iterator, List, Optional, Tuple
+
+from .bitboard import CellSet, cell_positions
+from .position import Position
+
+# сколько таблиц видимости держим в памяти (ключ — раскладка карты)
+VISIBILITY_CACHE_SIZE = 64
+
+
+def line_cells(x0: int, y0: int, x1: int, y1: int) -> Iterator[Tuple[int, int]]:
+    """Брезенхем: промежуточные клетки отрезка (x0, y0) → (x1, y1), без концов."""
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x1 > x0 else -1
+    sy = 1 if y1 > y0 else -1
+    err = dx + dy
+    x, y = x0, y0
+    if x == x1 and y == y1:
+        return
+    while True:
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x += sx
+        if e2 <= dx:
+            err += dx
+            y += sy
+        if x == x1 and y == y1:
+            return
+        yield x, y
+
+
+class Visibility:
+    """
+    Таблица видимости статичной карты: для каждой клетки — битсет
+    (int, бит x * size + y) клеток, на которые есть линия обзора.
+
+    Линия обзора a↔b есть, если хотя бы один из брезенхемовских отрезков
+    a→b или b→a не проходит через препятствие (концы не считаются), —
+    так отношение симметрично. Строка клетки считается при первом запросе
+    (симметрия переиспользует уже готовые строки), дальше проверка — один
+    битовый тест.
+    """
+
+    __slots__ = ("_blocked", "_size", "_rows")
+
+    def __init__(self, obstacles: AbstractSet[Position]) -> None:
+        if not isinstance(obstacles, CellSet):
+            obstacles = CellSet.from_positions(obstacles)
+        self._blocked = obstacles.bits
+        self._size = obstacles.size
+        self._rows: List[Optional[int]] = [None] * (self._size * self._size)
+
+    def _clear(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        blocked, size = self._blocked, self._size
+        return not any(blocked >> (x * size + y) & 1 for x, y in line_cells(x0, y0, x1, y1))
+
+    def row(self, a: Position) -> int:
+        """Битсет клеток, видимых из a (a должна быть на доске)."""
+        size = self._size
+        i = a.x * size + a.y
+        bits = self._rows[i]
+        if bits is not None:
+            return bits
+        bits = 0
+        rows = self._rows
+        for x in range(size):
+            for y in range(size):
+                j = x * size + y
+                other = rows[j]
+                if other is not None:
+                    seen = other >> i & 1
+                else:
+                    seen = self._clear(a.x, a.y, x, y) or self._clear(x, y, a.x, a.y)
+                if seen:
+                    bits |= 1 << j
+        rows[i] = bits
+        return bits
+
+    def visible(self, a: Position, b: Position) -> bool:
+        size = self._size
+        if not (0 <= b.x < size and 0 <= b.y < size and a.in_bounds(size)):
+            return False
+        bits = self._rows[a.x * size + a.y]
+        if bits is None:
+            bits = self.row(a)
+        return bits >> (b.x * size + b.y) & 1 == 1
+
+    def visible_from(self, a: Position) -> List[Position]:
+        """Все клетки доски, видимые из a."""
+        size = self._size
+        bits = self.row(a) if a.in_bounds(size) else 0
+        return [p for p in cell_positions(size) if bits >> (p.x * size + p.y) & 1]
+
+
+@lru_cache(maxsize=VISIBILITY_CACHE_SIZE)
+def visibility(obstacles: AbstractSet[Position]) -> Visibility:
+    """
+    Таблица видимости на раскладку карты (Board.layout_key): все игры
+    одного сценария делят одну таблицу и её уже посчитанные строки.
+    """
+    return Visibility(obstacles)
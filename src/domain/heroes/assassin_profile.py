@@ -63,6 +63,5 @@ class AssassinProfile(CharacterProfile):
     def luck(self) -> int:
         return self._luck
 
-    @property
-    def abilities(self) -> Iterable[Ability]:
+    def build_abilities(self) -> Iterable[Ability]:
         return self._abilities
@@ -85,6 +85,5 @@ class BardProfile(CharacterProfile):
     def luck(self) -> int:
         return self._luck
 
-    @property
-    def abilities(self) -> Iterable[Ability]:
+    def build_abilities(self) -> Iterable[Ability]:
         return self._abilities
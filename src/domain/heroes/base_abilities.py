@@ -3,7 +3,7 @@
 from typing import FrozenSet
 from ..core.ability import Ability
 from ..core.effect import Effect
-from ..enums import EffectType, TargetType
+from ..enums import AbilityKind, EffectType, TargetType
 
 
 def move_to_ability(range: int = 1, cost: int = 1) -> Ability:
@@ -20,6 +20,7 @@ def move_to_ability(range: int = 1, cost: int = 1) -> Ability:
         aoe=0,
         bounces=0,
         bounce_mult=1.0,
+        kind=AbilityKind.MOVE,
     )
 
 def melee_attack(dmg: int = 3, cost: int = 2) -> Ability:
@@ -56,4 +57,5 @@ def sprint(extra_tiles: int = 2, cost: int = 2) -> Ability:
         aoe=0,
         bounces=0,
         bounce_mult=1.0,
+        kind=AbilityKind.MOVE,
     )
@@ -0,0 +1,24 @@
+# src/domain/heroes/interning.py
+
+from dataclasses import replace
+from typing import Dict
+
+from ..core.ability import Ability
+from ..core.effect import Effect
+
+# интернированные значения: равные Effect/Ability → один объект на процесс
+_ABILITIES: Dict[Ability, Ability] = {}
+_EFFECTS: Dict[Effect, Effect] = {}
+
+
+def intern_effect(effect: Effect) -> Effect:
+    return _EFFECTS.setdefault(effect, effect)
+
+
+def intern_ability(ability: Ability) -> Ability:
+    """Канонический экземпляр ability (с интернированными эффектами)."""
+    cached = _ABILITIES.get(ability)
+    if cached is None:
+        effects = frozenset(intern_effect(e) for e in ability.effects)
+        cached = _ABILITIES[ability] = replace(ability, effects=effects)
+    return cached
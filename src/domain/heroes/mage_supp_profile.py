@@ -126,8 +126,7 @@ class MageSuppProfile(CharacterProfile):
     def ap_regen(self) -> int:
         return self._ap_regen
 
-    @property
-    def abilities(self) -> Iterable[Ability]:
+    def build_abilities(self) -> Iterable[Ability]:
         return self._abilities
 
     @property
@@ -1,8 +1,11 @@
 # src/domain/heroes/profile.py
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from functools import cached_property
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Tuple
 from ..core.ability import Ability
+from .interning import intern_ability
 
 class CharacterProfile(ABC):
     """
@@ -34,10 +37,48 @@ class CharacterProfile(ABC):
         """luck value."""
         ...
 
-    @property
     @abstractmethod
-    def abilities(self) -> Iterable[Ability]:
-        """Base abilities available to this hero."""
+    def build_abilities(self) -> Iterable[Ability]:
+        """Base abilities available to this hero, as the subclass builds them."""
         ...
 
-    
+    @cached_property
+    def abilities(self) -> Tuple[Ability, ...]:
+        """
+        Base abilities in build_abilities order, interned: equal abilities of
+        any profiles (move_to, melee_attack…) are one shared object.
+        """
+        return tuple(intern_ability(ab) for ab in self.build_abilities())
+
+    # ─── precomputed lookups (профиль неизменяем — считаются один раз) ───
+
+    @cached_property
+    def abilities_by_name(self) -> Mapping[str, Ability]:
+        by_name = {}
+        for ab in self.abilities:
+            by_name.setdefault(ab.name, ab)
+        return MappingProxyType(by_name)
+
+    def __deepcopy__(self, memo) -> "CharacterProfile":
+        # профиль неизменяем и интернирован реестром — копии делят один объект
+        return self
+
+    def __reduce__(self):
+        # всё состояние профиля задаёт класс; кэши (mappingproxy) не пиклятся
+        # и в другом процессе пересчитаются сами
+        return (type(self), ())
+
+    def ability(self, name: str) -> Optional[Ability]:
+        return self.abilities_by_name.get(name)
+
+    @cached_property
+    def melee_ability(self) -> Optional[Ability]:
+        return self.ability("melee_attack")
+
+    @cached_property
+    def move_ability(self) -> Optional[Ability]:
+        return self.ability("move_to")
+
+    @cached_property
+    def has_melee(self) -> bool:
+        return self.melee_ability is not None
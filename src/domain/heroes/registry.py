@@ -0,0 +1,39 @@
+# src/domain/heroes/registry.py
+
+from typing import Dict, Type
+
+from ..enums import UnitRole
+from .profile import CharacterProfile
+from .swordsman_profile import SwordsmanProfile
+from .defender_profile import DefenderProfile
+from .archer_profile import ArcherProfile
+from .mage_dps_profile import MageDpsProfile
+from .mage_supp_profile import MageSuppProfile
+from .assassin_profile import AssassinProfile
+from .bard_profile import BardProfile
+
+# маппинг роли → класс профиля
+PROFILE_CLASSES: Dict[UnitRole, Type[CharacterProfile]] = {
+    UnitRole.SWORDSMAN: SwordsmanProfile,
+    UnitRole.SHIELD: DefenderProfile,
+    UnitRole.ARCHER: ArcherProfile,
+    UnitRole.MAGE_DPS: MageDpsProfile,
+    UnitRole.MAGE_SUPP: MageSuppProfile,
+    UnitRole.ASSASSIN: AssassinProfile,
+    UnitRole.BARD: BardProfile,
+}
+
+# один экземпляр профиля на роль (способности интернирует сам профиль)
+_PROFILES: Dict[UnitRole, CharacterProfile] = {}
+
+
+def get_profile(role: UnitRole) -> CharacterProfile:
+    """
+    Единственный экземпляр профиля роли. Профили неизменяемы, поэтому
+    все юниты одной роли делят один объект, а одинаковые способности
+    разных ролей (move_to, melee_attack…) — один Ability.
+    """
+    profile = _PROFILES.get(role)
+    if profile is None:
+        profile = _PROFILES[role] = PROFILE_CLASSES[role]()
+    return profile
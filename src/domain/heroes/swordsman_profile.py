@@ -1,6 +1,6 @@
 # src/domain/heroes/swordsman_profile.py
 
-from typing import Tuple
+from typing import Iterable, Tuple
 from ..core.ability import Ability
 from ..core.effect import Effect
 from ..enums import EffectType, TargetType
@@ -56,8 +56,7 @@ class SwordsmanProfile(CharacterProfile):
     def ap_regen(self) -> int:
         return self._ap_regen
 
-    @property
-    def abilities(self):
+    def build_abilities(self) -> Iterable[Ability]:
         return self._abilities
 
     @property
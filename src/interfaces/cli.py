@@ -1,16 +1,50 @@
 import argparse
+import random
 import sys
+from pathlib import Path
+
 from config.cli_config import cli_settings
 
+
 def main() -> None:
     parser = argparse.ArgumentParser(prog="turnshock")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["play", "simulate"],
+        default="play",
+        help="play — интерактивная игра, simulate — headless-прогон пачки игр"
+    )
     parser.add_argument(
         "--renderer",
         choices=["text", "pygame"],
         default="pygame",
         help="Выбор режима вывода: текстовый CLI или Pygame"
     )
+    sim = parser.add_argument_group("simulate")
+    sim.add_argument("--games", type=int, default=100, help="Сколько игр прогнать")
+    sim.add_argument("--scenario", default=cli_settings.scenario_name,
+                     help="Имя сценария (по умолчанию — из cli_start.json, иначе все)")
+    sim.add_argument("--max-ticks", type=int, default=None,
+                     help="Лимит тиков на игру (дальше — ничья)")
+    sim.add_argument("--workers", type=int, default=1,
+                     help="Число процессов (0 — все ядра, 1 — без пула; с --profile — только 1)")
+    sim.add_argument("--seed", type=int, default=None,
+                     help="Базовый seed пачки: i-я игра получает seed+i "
+                          "(не задан — случайный, печатается перед прогоном)")
+    sim.add_argument("--log-level", choices=["NONE", "BRIEF", "DETAILED", "FULL"],
+                     default="NONE", help="Уровень логов домена в headless-режиме")
+    sim.add_argument("--agent", choices=["nearest", "focus", "support"], default="nearest",
+                     help="Скриптовый агент обеих команд")
+    sim.add_argument("--profile", type=Path, default=None, metavar="JSON",
+                     help="Записать пофазный профиль тиков по сценариям в JSON (только с --workers 1)")
     args = parser.parse_args()
+    if args.profile and args.workers != 1:
+        parser.error("--profile работает только с --workers 1")
+
+    if args.command == "simulate":
+        simulate(args)
+        return
 
     if args.renderer == "pygame":
         from ui.pygame.app import PyGameApp
@@ -24,5 +58,57 @@ def main() -> None:
         print("Текстовый режим пока не реализован.")
         sys.exit(0)
 
+
+def simulate(args: argparse.Namespace) -> None:
+    """Headless-прогон: никакого pygame, интенты дают скриптовые агенты."""
+    from config.logger import RTS_Logger
+    RTS_Logger.set_global_level(args.log_level)
+
+    from agents.scripted import SCRIPTED_AGENTS
+    from application.game_generator import GeneratorConfig
+    from application.services.parallel_runner import run_parallel
+    from application.services.simulation_runner import DEFAULT_MAX_TICKS, run_simulations
+
+    name = args.scenario
+    cfg = GeneratorConfig(
+        scenarios_dir=Path(cli_settings.scenarios_dir),
+        mode=cli_settings.mode,
+        loop=True,
+        filter_fn=(lambda n: n == name) if name else None,
+    )
+    max_ticks = args.max_ticks or DEFAULT_MAX_TICKS
+    agent = SCRIPTED_AGENTS[args.agent]
+    # один базовый seed на пачку для любого числа воркеров: без --seed он
+    # случайный, но печатается — прогон можно повторить с --seed
+    base_seed = args.seed
+    if base_seed is None:
+        base_seed = random.SystemRandom().getrandbits(32)
+    print(f"base seed: {base_seed}")
+    if args.profile:
+        from domain.analytics.profiler import TickProfiler, profiling
+
+        with profiling(TickProfiler()) as prof:
+            report = run_simulations(
+                cfg, count=args.games, agent_factory=agent, max_ticks=max_ticks, base_seed=base_seed
+            )
+        prof.dump_json(args.profile)
+        print(f"profile written to {args.profile}")
+    elif args.workers == 1:
+        report = run_simulations(
+            cfg, count=args.games, agent_factory=agent, max_ticks=max_ticks, base_seed=base_seed
+        )
+    else:
+        report = run_parallel(
+            cfg,
+            count=args.games,
+            workers=args.workers or None,
+            agent_factory=agent,
+            max_ticks=max_ticks,
+            base_seed=base_seed,
+            log_level=args.log_level,
+        )
+    print(report.summary())
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -12,6 +12,7 @@ from config.logger import RTS_Logger
 from .screens.menu import MenuScreen
 from .screens.settings import SettingsScreen
 from .screens.game import GameScreen
+from .screens.base import BaseScreen
 from .constants import UI
 
 logger = RTS_Logger(__name__)
@@ -39,16 +40,23 @@ class PyGameApp:  # бывший PyGameRenderer
 
     # ── callbacks ────────────────────────────────────────────────────
     def _on_start(self) -> None:
+        if self._game is not None:
+            self._game.close()
         self._domain = DomainConnector()
-        state = self._domain.get_state()
+        # форк: живое состояние после старта принадлежит потоку симуляции
+        state = self._domain.get_state().fork()
         self._game = GameScreen(self._domain, state, self.width, self.height)
-        self._current = self._game
+        self._switch(self._game)
 
     def _goto_settings(self) -> None:
-        self._current = self._settings
+        self._switch(self._settings)
 
     def _goto_menu(self) -> None:
-        self._current = self._menu
+        self._switch(self._menu)
+
+    def _switch(self, screen: BaseScreen) -> None:
+        self._current = screen
+        screen.invalidate()
 
     def _apply_settings(self) -> None:
         # TODO: перечитать cli_settings, переинициализировать экраны
@@ -65,11 +73,19 @@ class PyGameApp:  # бывший PyGameRenderer
                 if event.type == pygame.QUIT:
                     self.running = False
                     break
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # окно перекрывали — грязных областей уже не знаем
+                    self._current.invalidate()
                 self._current.handle_event(event)
 
             self._current.update()
-            self._current.draw(self.screen)
-            pygame.display.flip()
+            dirty = self._current.draw(self.screen)
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
             self.clock.tick(UI.TARGET_FPS)
 
+        if self._game is not None:
+            self._game.close()
         pygame.quit()
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import pygame
 
-from ui.pygame.constants import UI
+from ui.pygame.constants import Colors, UI
 
 
 @lru_cache(maxsize=32)
@@ -34,3 +35,29 @@ def emoji_surface(
     """
     surf = font(size).render(char, True, color)
     return surf.convert_alpha()
+
+
+@lru_cache(maxsize=512)
+def text_surface(
+    fnt: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int]
+) -> pygame.Surface:
+    """
+    Рендер строки заданным шрифтом (подписи панелей, кнопок).
+    Кэшируется: одинаковый текст не рендерится заново каждый кадр.
+    Поверхность общая — не менять её (alpha и т.п.).
+    """
+    return fnt.render(text, True, color)
+
+
+@lru_cache(maxsize=64)
+def unit_disc(team: Optional[str], radius: int, alpha: int) -> pygame.Surface:
+    """
+    Полупрозрачный круг юнита; team=None — мёртвый (серый).
+    Кэш по (team, radius, alpha): кадр не создаёт новых Surface.
+    """
+    color = Colors.DEAD if team is None else Colors.TEAM_COLORS.get(team, Colors.TEXT)
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+    return surf
@@ -9,7 +9,7 @@ from typing import List, Optional, Sequence
 import pygame
 
 from domain.core.ability import Ability
-from ui.pygame.assets.assets import emoji_surface
+from ui.pygame.assets.assets import text_surface
 from ui.pygame.assets.icons import ability_icon
 from ui.pygame.constants import Colors
 
@@ -30,11 +30,14 @@ class AbilityBar:
         surface: "pygame.Surface",
         abilities: Sequence[Ability] | None,
         selected_idx: Optional[int],
-    ) -> None:
-        """Рисуем panel; abilities может быть None (ничего не выбрано)."""
+    ) -> Optional[pygame.Rect]:
+        """
+        Рисуем panel; abilities может быть None (ничего не выбрано).
+        Возвращает занятую панелью область (None — ничего не рисовали).
+        """
         self._btn_rects = []
         if not abilities:
-            return
+            return None
 
         menu_h = int(self.screen_h * 0.12)
         menu_top = self.screen_h - menu_h - 16
@@ -61,9 +64,11 @@ class AbilityBar:
             txt_x = rect.left + 6 + emoji_surf.get_width() + 4
             
 
-            ab_text = self.font.render(ability.name, True, Colors.TEXT)
+            ab_text = text_surface(self.font, ability.name, Colors.TEXT)
             surface.blit(ab_text, (txt_x, rect.centery - ab_text.get_height() // 2))
 
+        return self._btn_rects[0].unionall(self._btn_rects[1:])
+
     # возвращает индекс абилки, если клик попал
     def handle_event(self, event: "pygame.event.Event") -> Optional[int]:
         if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
@@ -1,22 +1,31 @@
 # relative path: src/ui/pygame/components/sim_controls.py
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 import pygame
 
+from application.services.sim_worker import MAX_SPEED
+from ui.pygame.assets.assets import text_surface
 from ui.pygame.constants import UI, Colors
 
 
+# самый короткий «обычный» интервал; быстрее — только max
+MIN_INTERVAL = 0.2
+
+
 @dataclass(slots=True)
 class SimControls:
-    """⏯  «медленнее / стоп / быстрее» + надпись с интервалом."""
+    """
+    ⏯  «медленнее / стоп / быстрее» + надпись с интервалом.
+    Только состояние кнопок: темп тиков держит SimulationWorker
+    (GameScreen передаёт ему tick_interval / paused каждый кадр).
+    За минимальным интервалом — режим max (tick_interval == MAX_SPEED).
+    """
 
     width: int
     tick_interval: float = 1.0
 
     _paused: bool = False
-    _last_tick: float = time.time()
     _slow: pygame.Rect = None
     _play: pygame.Rect = None
     _fast: pygame.Rect = None
@@ -31,23 +40,24 @@ class SimControls:
             return
         mx, my = event.pos
         if self._slow and self._slow.collidepoint(mx, my):
-            self.tick_interval = min(self.tick_interval + 0.5, 5.0)
+            if self.tick_interval <= MAX_SPEED:
+                self.tick_interval = MIN_INTERVAL
+            else:
+                self.tick_interval = min(self.tick_interval + 0.5, 5.0)
         elif self._fast and self._fast.collidepoint(mx, my):
-            self.tick_interval = max(self.tick_interval - 0.5, 0.2)
+            if self.tick_interval <= MIN_INTERVAL:
+                self.tick_interval = MAX_SPEED
+            else:
+                self.tick_interval = max(self.tick_interval - 0.5, MIN_INTERVAL)
         elif self._play and self._play.collidepoint(mx, my):
             self._paused = not self._paused
 
-    def ready_for_tick(self) -> bool:
-        now = time.time()
-        if self._paused:
-            self._last_tick = now
-            return False
-        if now - self._last_tick >= self.tick_interval:
-            self._last_tick = now
-            return True
-        return False
-
-    def draw(self, surface: pygame.Surface) -> None:
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Возвращает занятую кнопками и подписью область."""
         y = 8
         size = 32
         pad = 6
@@ -57,23 +67,25 @@ class SimControls:
         # «slow»
         self._slow = pygame.Rect(x0, y, size, size)
         pygame.draw.rect(surface, (100, 100, 200), self._slow, border_radius=4)
-        surface.blit(self._font.render("«", True, Colors.TEXT),
-                     self._font.render("«", True, Colors.TEXT).get_rect(center=self._slow.center))
+        glyph = text_surface(self._font, "«", Colors.TEXT)
+        surface.blit(glyph, glyph.get_rect(center=self._slow.center))
 
         # play/pause
         self._play = pygame.Rect(x0 + size + pad, y, size, size)
         color = (120, 60, 60) if self._paused else (40, 120, 40)
         pygame.draw.rect(surface, color, self._play, border_radius=4)
         lab = "▶" if self._paused else "⏸"
-        surface.blit(self._font.render(lab, True, Colors.TEXT),
-                     self._font.render(lab, True, Colors.TEXT).get_rect(center=self._play.center))
+        glyph = text_surface(self._font, lab, Colors.TEXT)
+        surface.blit(glyph, glyph.get_rect(center=self._play.center))
 
         # «fast»
         self._fast = pygame.Rect(x0 + 2 * (size + pad), y, size, size)
         pygame.draw.rect(surface, (100, 200, 100), self._fast, border_radius=4)
-        surface.blit(self._font.render("»", True, Colors.TEXT),
-                     self._font.render("»", True, Colors.TEXT).get_rect(center=self._fast.center))
+        glyph = text_surface(self._font, "»", Colors.TEXT)
+        surface.blit(glyph, glyph.get_rect(center=self._fast.center))
 
         # текстовый FPS / interval
-        txt = self._font.render(f"{self.tick_interval:.1f}s", True, Colors.TEXT)
-        surface.blit(txt, txt.get_rect(midleft=(self._fast.right + 12, y + size // 2)))
+        label = "max" if self.tick_interval <= MAX_SPEED else f"{self.tick_interval:.1f}s"
+        txt = text_surface(self._font, label, Colors.TEXT)
+        area = surface.blit(txt, txt.get_rect(midleft=(self._fast.right + 12, y + size // 2)))
+        return self._slow.union(area)
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import List, Optional
+
 import pygame
 
 
@@ -16,4 +18,11 @@ class BaseScreen(ABC):
     def update(self) -> None: ...
 
     @abstractmethod
-    def draw(self, surface: pygame.Surface) -> None: ...
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Рисует кадр. None — перерисовано всё окно (приложение делает flip),
+        список — изменились только эти области (display.update(rects)).
+        """
+
+    def invalidate(self) -> None:
+        """Следующий кадр — полная перерисовка (экран снова показан, окно открылось)."""
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
-from domain.engine.ability_utils import select_chain_targets
 import pygame
 
 from application.services.domain_connector import DomainConnector
+from application.services.sim_worker import SimulationWorker, Snapshot
 from domain.core.action import ActiveAction
 from domain.core.state import GameState
 from domain.enums import TargetType
@@ -25,11 +25,25 @@ from ui.pygame.systems import (
     AnimationManager,
     BoardRenderer,
     BoardView,
+    DirtyRects,
     EmojiBurst,
 )
 from ui.pygame.systems.animation import TextBurst
 from .base import BaseScreen
 
+# не дольше стольких секунд юнит едет между клетками
+MOVE_DURATION = 0.3
+
+# способность → эмодзи вспышки при завершении (строится один раз, не на кадр)
+ABILITY_FX: Dict[str, str] = {
+    "fireball":       "🔥",
+    "ice_shard":      "❄️",
+    "chain_lightning":"⚡",
+    "healing_wave":   "💧",
+    "arcane_barrier": "🛡️",
+    "chant_of_valor": "🎵",
+    "cleave":         "💥",
+}
 
 @dataclass(slots=True)
 class GameScreen(BaseScreen):
@@ -40,6 +54,13 @@ class GameScreen(BaseScreen):
     • клики по карте (юнит / точка)  
     • SimControls — пауза / скорость  
     • BoardView + Overlay + анимации
+
+    Тики идут в SimulationWorker (фоновый поток); экран только забирает
+    снимки и плавно двигает юнитов между ними, поэтому медленный тик
+    не роняет кадры.
+
+    Фон (заливка + пререндер доски) собирается один раз; кадр стирает
+    прошлую динамику фоном и отдаёт приложению только грязные области.
     """
 
     # — передаётся снаружи —
@@ -47,7 +68,7 @@ class GameScreen(BaseScreen):
     state: GameState
     width: int
     height: int
-    board_size: int = 13
+    board_size: Optional[int] = None      # None — сторона доски из state.board.size
 
     # — runtime —
     _anims: AnimationManager = field(init=False)
@@ -59,6 +80,12 @@ class GameScreen(BaseScreen):
     _font_big: pygame.font.Font = field(init=False)
     _font_small: pygame.font.Font = field(init=False)
     _info_panel: InfoPanel = field(init=False)
+    _sim: SimulationWorker = field(init=False)
+    _last_snapshot: float = field(init=False, default=0.0)
+    _background: Optional[pygame.Surface] = field(init=False, default=None)
+    _bg_layer: Optional[pygame.Surface] = field(init=False, default=None)
+    _dirty: DirtyRects = field(init=False, default_factory=DirtyRects)
+    _full_redraw: bool = field(init=False, default=True)
 
     _selected_unit: Optional[int] = None
     _selected_ability: Optional[int] = None
@@ -67,7 +94,7 @@ class GameScreen(BaseScreen):
     # ──────────────────────────────────────────────────────────────
     def __post_init__(self) -> None:
         self._anims = AnimationManager()
-        self._board_r = BoardRenderer(self.board_size, self.width, self.height)
+        self._board_r = BoardRenderer(self.board_size or self.state.board.size, self.width, self.height)
 
         self._font_big = pygame.font.Font(UI.FONT_PATH, 26)
         self._font_small = pygame.font.Font(UI.FONT_PATH, 18)
@@ -78,6 +105,14 @@ class GameScreen(BaseScreen):
         self._controls = SimControls(self.width)
         self._info_panel = InfoPanel(self.height, self._font_small)
 
+        # с этого момента domain принадлежит потоку воркера: экран рисует
+        # только форки, живой state воркер мутирует параллельно
+        if self.state is self.domain.state:
+            self.state = self.state.fork()
+        self._sim = SimulationWorker(self.domain, self._controls.tick_interval)
+        self._last_snapshot = time.perf_counter()
+        self._sim.start()
+
     # ───────────────────────── input ──────────────────────────────
     def handle_event(self, event: pygame.event.Event) -> None:
         # 0) скорость / пауза
@@ -167,66 +202,119 @@ class GameScreen(BaseScreen):
         target_pos,
         target_uid: Optional[int],
     ) -> None:
-        self._pending[caster.id] = ActiveAction(
+        action = ActiveAction(
             ability=ability,
             target=target_pos,
             target_unit_id=target_uid,
             ticks_remaining=0,
         )
+        # в _pending — для оверлея до ближайшего снимка
+        self._pending[caster.id] = action
+        self._sim.submit({caster.id: action})
 
     def _reset_selection(self) -> None:
         self._selected_unit = self._selected_ability = None
 
     # ───────────────────────── update/draw ─────────────────────────
     def update(self) -> None:
-        if self._controls.ready_for_tick():
-            self._advance_tick()
+        self._sim.set_pace(self._controls.tick_interval, self._controls.paused)
+        snaps = self._sim.poll()
+        if snaps:
+            self._apply_snapshots(snaps)
         self._anims.update()
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(Colors.BG)
+    def close(self) -> None:
+        """Останавливает поток симуляции (выход / новая игра)."""
+        self._sim.stop()
 
-        # доска + юниты
-        self._board_view.draw(surface, self.state)
+    def invalidate(self) -> None:
+        self._full_redraw = True
+
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        # слой статики пересобирается только при смене раскладки доски
+        layer = self._board_r.static_layer(self.state)
+        full = (
+            self._full_redraw
+            or layer is not self._bg_layer
+            or self._background.get_size() != surface.get_size()
+        )
+        dirty = self._dirty
+        if full:
+            self._build_background(surface, layer)
+            surface.blit(self._background, (0, 0))
+            dirty.reset()
+        else:
+            # стираем динамику прошлого кадра
+            dirty.restore(surface, self._background)
+
+        # юниты + анимации
+        dirty.extend(self._board_view.draw(surface, self.state))
 
         # пунктирные стрелки / эмодзи активного умения
-        self._overlay.draw(surface, self.state, self._pending)
+        dirty.extend(self._overlay.draw(surface, self.state, self._pending))
 
         # ability-bar
         unit = self.state.units.get(self._selected_unit)
-        self._ability_bar.draw(
+        dirty.add(self._ability_bar.draw(
             surface,
             unit.abilities if unit else None,
             self._selected_ability,
-        )
-        self._info_panel.draw(surface, unit)
+        ))
+        dirty.add(self._info_panel.draw(surface, unit))
 
         # контролы скорости (последними — рисуются поверх)
-        self._controls.draw(surface)
+        dirty.add(self._controls.draw(surface))
+
+        rects = dirty.flush()
+        if full:
+            self._full_redraw = False
+            return None
+        return rects
+
+    def _build_background(self, surface: pygame.Surface, layer: pygame.Surface) -> None:
+        bg = pygame.Surface(surface.get_size())
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        bg.fill(Colors.BG)
+        bg.blit(layer, (self._board_r.left, self._board_r.top))
+        self._background, self._bg_layer = bg, layer
 
     # ──────────────────────── тик симуляции ────────────────────────
-    def _advance_tick(self) -> None:
+    def _apply_snapshots(self, snaps: Sequence[Snapshot]) -> None:
+        latest = snaps[-1]
+        # интерполяция: юниты едут от текущей точки на экране к новой клетке
+        # за время между снимками (не дольше MOVE_DURATION)
+        span = latest.created - self._last_snapshot
+        duration = min(MOVE_DURATION, max(span, 1 / UI.TARGET_FPS))
+        self._last_snapshot = latest.created
+
         # 1) старые позиции → для анимации
         old_xy = {
-            u.id: self._board_r.cell_center(u.pos) for u in self.state.units.values()
+            u.id: self._anims.position(u.id) or self._board_r.cell_center(u.pos)
+            for u in self.state.units.values()
         }
+        # тик назад — domain начал новую игру, тянуть юнитов не нужно
+        new_game = latest.tick < self.state.tick
 
-        # 2) отправляем интенты в домен
-        self.domain.send_intents(self._pending)
-        self.state = self.domain.get_state()
+        # 2) новый снимок; интенты игрока ушли воркеру при выборе цели
+        self.state = latest.state
         self._pending.clear()
 
         # 3) анимируем перемещение
-        for u in self.state.units.values():
-            start = old_xy.get(u.id)
-            end = self._board_r.cell_center(u.pos)
-            if start and start != end:
-                # 1×1 полностью прозрачный спрайт (не видно, но нужен объект)
-                spr = pygame.Surface((1, 1), pygame.SRCALPHA)
-                self._board_view.animate_move(u.id, start, end, spr)
-
-        # 4) burst-эффекты
-        for u in self.state.units.values():
+        if not new_game:
+            for u in self.state.units.values():
+                start = old_xy.get(u.id)
+                end = self._board_r.cell_center(u.pos)
+                if start and start != end:
+                    # без спрайта: круг юнита рисует BoardView по позиции анимации
+                    self._board_view.animate_move(u.id, start, end, duration=duration)
+
+        # 4) вспышки завершённых действий — из каждого снимка, не только последнего
+        for snap in snaps:
+            self._spawn_bursts(snap.state)
+
+    def _spawn_bursts(self, state: GameState) -> None:
+        for u in state.units.values():
             act = u.completed_action
             if not act:                       # nothing finished
                 continue
@@ -237,25 +325,15 @@ class GameScreen(BaseScreen):
             cx, cy = self._board_r.cell_center(center)
 
             # ---------- FX-эмодзи / дымка / ноты --------------------
-            fx_map: dict[str, str] = {
-                "fireball":       "🔥",
-                "ice_shard":      "❄️",
-                "chain_lightning":"⚡",
-                "healing_wave":   "💧",
-                "arcane_barrier": "🛡️",
-                "chant_of_valor": "🎵",
-                "cleave":         "💥",
-            }
-
-            if name in fx_map:
-                emoji = fx_map[name]
+            emoji = ABILITY_FX.get(name)
+            if emoji is not None:
 
                 # клетки под AoE (вкл. центр)  ──────────────────────
-                if name == "chain_lightning":
-                    targets = select_chain_targets(center, self.state, max_targets=ab.bounces + 1)
-                    for t in targets:
-                        ex, ey = self._board_r.cell_center(t.pos)
-                        self._anims.add(EmojiBurst(emoji, (ex, ey), 0.6, self._font_big))
+                if ab.bounces:
+                    # те же цели, что задел движок (см. ActiveAction.hits)
+                    for uid in act.hits:
+                        ex, ey = self._board_r.cell_center(state.units[uid].pos)
+                        self._anims.spawn(EmojiBurst, emoji, (ex, ey), 0.6, self._font_big)
                 else:
                     radius = max(1, ab.aoe)
                     for dx in range(-radius, radius + 1):
@@ -264,15 +342,15 @@ class GameScreen(BaseScreen):
                             if max(abs(dx), abs(dy)) > ab.aoe:
                                 continue
                             p = type(center)(center.x + dx, center.y + dy)
-                            if not p.in_bounds():
+                            if not state.board.in_bounds(p):
                                 continue
                             ex, ey = self._board_r.cell_center(p)
-                            self._anims.add(
-                                EmojiBurst(emoji, (ex, ey), 0.6, self._font_big)
+                            self._anims.spawn(
+                                EmojiBurst, emoji, (ex, ey), 0.6, self._font_big
                             )
 
             # ---------- подпись способности (одна, без дубля) ------
             color = ability_fx_color(name)
-            self._anims.add(
-                TextBurst(name, (cx, cy - 32), 0.8, self._font_small, color)
+            self._anims.spawn(
+                TextBurst, name, (cx, cy - 32), 0.8, self._font_small, color
             )
@@ -3,6 +3,7 @@ from .animation import AnimationManager, LinearMove, EmojiBurst
 from .board import BoardRenderer
 from .board_view import BoardView
 from .action_overlay import ActionOverlay
+from .dirty import DirtyRects
 
 __all__ = [
     "AnimationManager",
@@ -11,4 +12,5 @@ __all__ = [
     "BoardRenderer",
     "BoardView",
     "ActionOverlay",
+    "DirtyRects",
 ]
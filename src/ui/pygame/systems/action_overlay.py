@@ -6,6 +6,7 @@
 from __future__ import annotations
 import math
 from dataclasses import dataclass
+from typing import List
 
 import pygame
 from domain.core.state import GameState
@@ -21,14 +22,19 @@ class ActionOverlay:
     font: pygame.font.Font
 
     # -----------------------------------------------------------------
-    def draw(self, surface: pygame.Surface, state: GameState, pending: dict[int, ActiveAction]) -> None:
+    def draw(self, surface: pygame.Surface, state: GameState, pending: dict[int, ActiveAction]) -> List[pygame.Rect]:
+        """Рисует стрелки всех действий; возвращает задетые области (dirty rects)."""
+        rects: List[pygame.Rect] = []
         for unit in state.units.values():
             action = pending.get(unit.id) or unit.current_action
             if action:
-                self._draw_for_action(surface, state, unit.id, action)
+                rects.extend(self._draw_for_action(surface, state, unit.id, action))
+        return rects
 
     # ― private ―------------------------------------------------------
-    def _draw_for_action(self, surface: pygame.Surface, state: GameState, uid: int, act: ActiveAction) -> None:
+    def _draw_for_action(
+        self, surface: pygame.Surface, state: GameState, uid: int, act: ActiveAction
+    ) -> tuple[pygame.Rect, pygame.Rect]:
         u = state.units[uid]
         start = self.board.cell_center(u.pos)
 
@@ -39,12 +45,12 @@ class ActionOverlay:
         )
         end = self.board.cell_center(tgt_pos)
 
-        self._dashed_arrow(surface, start, end)
+        arrow = self._dashed_arrow(surface, start, end)
 
         # emoji над юнитом
         emoji = ability_icon(act.ability.name, 24)
         rect = emoji.get_rect(midbottom=(start[0], start[1] - self.board.cell // 2 - 4))
-        surface.blit(emoji, rect)
+        return arrow, surface.blit(emoji, rect)
 
     # -----------------------------------------------------------------
     @staticmethod
@@ -55,13 +61,13 @@ class ActionOverlay:
         color: tuple[int, int, int] = Colors.TEXT,
         width: int = 3,
         dash_len: int = 14,
-    ) -> None:
+    ) -> pygame.Rect:
         x1, y1 = p1
         x2, y2 = p2
         dx, dy = x2 - x1, y2 - y1
         dist = math.hypot(dx, dy)
         if dist < 1:
-            return
+            return pygame.Rect(x1, y1, 0, 0)
         dashes = int(dist // dash_len)
         for i in range(dashes):
             s = i / dashes
@@ -78,4 +84,7 @@ class ActionOverlay:
         py = int(y2 - size * math.sin(angle - 0.3))
         qx = int(x2 - size * math.cos(angle + 0.3))
         qy = int(y2 - size * math.sin(angle + 0.3))
-        pygame.draw.polygon(surface, color, [(x2, y2), (px, py), (qx, qy)])
+        head = pygame.draw.polygon(surface, color, [(x2, y2), (px, py), (qx, qy)])
+        # рамка отрезка с запасом на толщину линии
+        bounds = pygame.Rect(min(x1, x2), min(y1, y2), abs(dx) + 1, abs(dy) + 1)
+        return bounds.inflate(width * 2, width * 2).union(head)
@@ -1,26 +1,45 @@
 # relative path: src/ui/pygame/systems/animation.py
 """
 Гибкая система анимаций:
-  • BaseAnimation  — протокол «update()->done + draw()»
+  • BaseAnimation  — протокол «update()->done + draw()->rect»
   • SpriteAnimation — интерполяция позиции/масштаба/альфы
   • EmojiBurst      — “взрыв” эмодзи на фикс. позиции
-  • AnimationManager — контейнер (update + draw всех)
+  • AnimationManager — контейнер (update + draw всех) с индексом
+                      перемещений по unit_id и пулом отработавших объектов
 """
 
 from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Protocol
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Type, TypeVar
 
 import pygame
 
 
+@lru_cache(maxsize=256)
+def fade_surface(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int]
+) -> pygame.Surface:
+    """
+    Общий Surface для растворяющихся надписей: все вспышки с одинаковым
+    текстом рисуют один и тот же Surface, выставляя свою alpha прямо перед
+    blit. Отдельный кэш — чтобы alpha не протекала в обычные иконки.
+    """
+    return font.render(text, True, color)
+
+
+# сколько отработавших объектов одного типа держим для переиспользования
+POOL_LIMIT = 256
+
+
 class BaseAnimation(Protocol):  # интерфейс для type-checking
     def update(self, now: float) -> bool: ...
-    def draw(self, surface: pygame.Surface) -> None: ...
+    def draw(self, surface: pygame.Surface) -> pygame.Rect: ...
 
 
 @dataclass(slots=True)
@@ -30,7 +49,7 @@ class SpriteAnimation(ABC):
     _x: float = field(init=False, default=0.0)
     _y: float = field(init=False, default=0.0)
 
-    sprite: pygame.Surface
+    sprite: Optional[pygame.Surface]      # None — только позиция (её читает BoardView)
     start_pos: tuple[float, float]
     end_pos: tuple[float, float]
     duration: float
@@ -49,9 +68,11 @@ class SpriteAnimation(ABC):
         self._y = self.start_pos[1] + (self.end_pos[1] - self.start_pos[1]) * p
         return p >= 1.0
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        if self.sprite is None:
+            return pygame.Rect(int(self._x), int(self._y), 0, 0)
         rect = self.sprite.get_rect(center=(self._x, self._y))
-        surface.blit(self.sprite, rect)
+        return surface.blit(self.sprite, rect)
 
 
 @dataclass(slots=True)
@@ -79,18 +100,17 @@ class EmojiBurst:
     _alpha: int = field(init=False, default=255)
 
     def __post_init__(self) -> None:
-        self._surf = self.font.render(self.emoji, True, self.color)
+        self._surf = fade_surface(self.font, self.emoji, self.color)
 
     def update(self, now: float) -> bool:
         t = (now - self._start_time) / self.duration
         self._alpha = int(255 * max(0.0, 1.0 - t))
         return t >= 1.0
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surf = self._surf.copy()
-        surf.set_alpha(self._alpha)
-        rect = surf.get_rect(center=self.center)
-        surface.blit(surf, rect)
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        # Surface общий (fade_surface) — alpha ставим перед каждым blit, без copy()
+        self._surf.set_alpha(self._alpha)
+        return surface.blit(self._surf, self._surf.get_rect(center=self.center))
 
 # ──────────────────────────────────────────────────────────────────
 #         ✨ Новый всплывающий цветной текст («Fireball!»)         │
@@ -111,34 +131,114 @@ class TextBurst:
     _alpha: int = field(init=False, default=255)
 
     def __post_init__(self) -> None:
-        self._surf = self.font.render(self.text, True, self.color)
+        self._surf = fade_surface(self.font, self.text, self.color)
 
     def update(self, now: float) -> bool:
         t = (now - self._start_time) / self.duration
         self._alpha = int(255 * max(0.0, 1.0 - t))
         return t >= 1.0
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surf = self._surf.copy()
-        surf.set_alpha(self._alpha)
-        rect = surf.get_rect(center=self.center)
-        surface.blit(surf, rect)
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        # Surface общий (fade_surface) — alpha ставим перед каждым blit, без copy()
+        self._surf.set_alpha(self._alpha)
+        return surface.blit(self._surf, self._surf.get_rect(center=self.center))
+
+
+A = TypeVar("A")
 
 
 class AnimationManager:
-    """Контейнер всех активных анимаций."""
+    """
+    Контейнер всех активных анимаций.
+
+    Анимации разложены по корзинам: перемещения юнитов — словарь
+    unit_id → LinearMove (позиция юнита за O(1), у юнита не больше одного
+    перемещения), остальное (вспышки, надписи) — список. Отработавшие
+    объекты уходят в пул по типу и переиспользуются в spawn/move.
+    """
 
     def __init__(self) -> None:
-        self._anims: Deque[BaseAnimation] = deque()
+        self._moves: Dict[int, LinearMove] = {}
+        self._fx: List[BaseAnimation] = []
+        self._pool: Dict[type, List[Any]] = {}
 
     # api ----------------------------------------------------------
     def add(self, anim: BaseAnimation) -> None:
-        self._anims.append(anim)
+        if isinstance(anim, LinearMove) and anim.unit_id >= 0:
+            prev = self._moves.get(anim.unit_id)
+            if prev is not None and prev is not anim:
+                self._release(prev)
+            self._moves[anim.unit_id] = anim
+        else:
+            self._fx.append(anim)
+
+    def spawn(self, cls: Type[A], *args: Any, **kwargs: Any) -> A:
+        """cls(*args, **kwargs), по возможности из пула, и сразу add()."""
+        anim = self._acquire(cls, *args, **kwargs)
+        self.add(anim)
+        return anim
+
+    def move(
+        self,
+        unit_id: int,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        duration: float,
+        sprite: Optional[pygame.Surface] = None,
+    ) -> LinearMove:
+        """Перемещение юнита; прежнее незаконченное перемещение заменяется."""
+        anim = self._acquire(LinearMove, sprite, start, end, duration)
+        anim.unit_id = unit_id
+        self.add(anim)
+        return anim
+
+    def move_of(self, unit_id: int) -> Optional[LinearMove]:
+        return self._moves.get(unit_id)
+
+    def position(self, unit_id: int) -> Optional[Tuple[int, int]]:
+        """Текущая (промежуточная) точка перемещения юнита; None — юнит стоит."""
+        anim = self._moves.get(unit_id)
+        if anim is None:
+            return None
+        return int(anim._x), int(anim._y)
 
     def update(self) -> None:
         now = time.time()
-        self._anims = deque(a for a in self._anims if not a.update(now))
-
-    def draw(self, surface: pygame.Surface) -> None:
-        for a in self._anims:
-            a.draw(surface)
+        moves = self._moves
+        done = [uid for uid, a in moves.items() if a.update(now)]
+        for uid in done:
+            self._release(moves.pop(uid))
+
+        # уплотняем список на месте, без новой коллекции на кадр
+        fx, alive = self._fx, 0
+        for a in fx:
+            if a.update(now):
+                self._release(a)
+            else:
+                fx[alive] = a
+                alive += 1
+        del fx[alive:]
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Рисует все анимации; возвращает задетые ими области (dirty rects)."""
+        rects = [a.draw(surface) for a in self._moves.values()]
+        rects.extend(a.draw(surface) for a in self._fx)
+        return rects
+
+    def __len__(self) -> int:
+        return len(self._moves) + len(self._fx)
+
+    # pool ---------------------------------------------------------
+    def _acquire(self, cls: Type[A], *args: Any, **kwargs: Any) -> A:
+        pool = self._pool.get(cls)
+        if pool:
+            anim = pool.pop()
+            # повторный __init__ dataclass'а сбрасывает все поля, включая время старта
+            cls.__init__(anim, *args, **kwargs)
+            return anim
+        return cls(*args, **kwargs)
+
+    def _release(self, anim: Any) -> None:
+        pool = self._pool.setdefault(type(anim), [])
+        if len(pool) < POOL_LIMIT:
+            pool.append(anim)
@@ -1,11 +1,15 @@
 # relative path: src/ui/pygame/systems/board.py
 """
 Рендер статической части поля: сетка, препятствия, зоны регена.
+
+Статика за партию не меняется, поэтому рисуется один раз в отдельный
+Surface (слой) на доску и разрешение; каждый кадр — только blit слоя.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
 import pygame
 from domain.core.state import GameState
@@ -24,10 +28,13 @@ class BoardRenderer:
     left:     int            = field(init=False)
     top:      int            = field(init=False)
     _rect:    pygame.Rect    = field(init=False)
+    # пререндер статики и раскладка, под которую он нарисован
+    _static:     Optional[pygame.Surface] = field(init=False, default=None)
+    _static_key: Optional[Tuple]          = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         field_h = int(self.screen_h * 0.8)
-        self.cell = field_h // self.board_size
+        self.cell = max(1, field_h // self.board_size)
         self.width = self.cell * self.board_size
         self.left = (self.screen_w - self.width) // 2
         self.top = int(self.screen_h * 0.05)
@@ -35,37 +42,45 @@ class BoardRenderer:
         self._rect = pygame.Rect(self.left, self.top, self.width, self.width)
 
     # -----------------------------------------------------------------
-    def draw_static(self, surface: pygame.Surface, state: GameState) -> None:
-        self._draw_grid(surface)
-        self._draw_zones(surface, state)
-        self._draw_obstacles(surface, state)
+    def draw_static(self, surface: pygame.Surface, state: GameState) -> pygame.Rect:
+        """Blit закэшированного слоя статики; возвращает занятый им прямоугольник."""
+        return surface.blit(self.static_layer(state), (self.left, self.top))
+
+    def static_layer(self, state: GameState) -> pygame.Surface:
+        """
+        Слой сетка + зоны + препятствия. Перерисовывается, только если
+        сменилась раскладка доски (препятствия / реген-зоны).
+        """
+        board = state.board
+        key = (board.obstacles, board.regen_zone)
+        if self._static is None or self._static_key != key:
+            # +1 px — правая/нижняя линия сетки
+            layer = pygame.Surface((self.width + 1, self.width + 1))
+            layer.fill(Colors.BG)
+            self._draw_grid(layer)
+            self._draw_zones(layer, state)
+            self._draw_obstacles(layer, state)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            self._static, self._static_key = layer, key
+        return self._static
 
     # ― private ―------------------------------------------------------
+    # рисуют в слой: начало координат — левый верхний угол доски
     def _draw_grid(self, surface: pygame.Surface) -> None:
         for i in range(self.board_size + 1):
-            x = self.left + i * self.cell
-            pygame.draw.line(surface, Colors.GRID, (x, self.top), (x, self.top + self.width))
-            y = self.top + i * self.cell
-            pygame.draw.line(surface, Colors.GRID, (self.left, y), (self.left + self.width, y))
+            x = y = i * self.cell
+            pygame.draw.line(surface, Colors.GRID, (x, 0), (x, self.width))
+            pygame.draw.line(surface, Colors.GRID, (0, y), (self.width, y))
 
     def _draw_obstacles(self, surface: pygame.Surface, state: GameState) -> None:
         for pos in state.board.obstacles:
-            rect = pygame.Rect(
-                self.left + pos.x * self.cell,
-                self.top + pos.y * self.cell,
-                self.cell,
-                self.cell,
-            )
+            rect = pygame.Rect(pos.x * self.cell, pos.y * self.cell, self.cell, self.cell)
             pygame.draw.rect(surface, Colors.OBSTACLE, rect)
 
     def _draw_zones(self, surface: pygame.Surface, state: GameState) -> None:
         for pos in state.board.regen_zone:
-            rect = pygame.Rect(
-                self.left + pos.x * self.cell,
-                self.top + pos.y * self.cell,
-                self.cell,
-                self.cell,
-            )
+            rect = pygame.Rect(pos.x * self.cell, pos.y * self.cell, self.cell, self.cell)
             pygame.draw.rect(surface, Colors.REGEN_ZONE, rect, width=4)
 
     # helpers ---------------------------------------------------------
@@ -0,0 +1,52 @@
+# relative path: src/ui/pygame/systems/dirty.py
+"""
+Учёт «грязных» прямоугольников кадра.
+
+Динамика (юниты, стрелки, анимации, панели) каждый кадр рисуется поверх
+готового фона; чтобы не перерисовывать и не отправлять на экран всё окно,
+запоминаем, что рисовали. Следующий кадр сначала стирает прошлые области
+фоном, а на экран уходят старые + новые области (display.update(rects)).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+import pygame
+
+# больше прямоугольников — дешевле отдать один общий
+MAX_DIRTY_RECTS = 64
+
+
+@dataclass(slots=True)
+class DirtyRects:
+    _prev: List[pygame.Rect] = field(default_factory=list)
+    _cur: List[pygame.Rect] = field(default_factory=list)
+
+    # -----------------------------------------------------------------
+    def add(self, rect: Optional[pygame.Rect]) -> None:
+        if rect is not None and rect.width > 0 and rect.height > 0:
+            self._cur.append(rect)
+
+    def extend(self, rects: Iterable[Optional[pygame.Rect]]) -> None:
+        for r in rects:
+            self.add(r)
+
+    def restore(self, surface: pygame.Surface, background: pygame.Surface) -> None:
+        """Стирает нарисованное в прошлом кадре: копирует фон в его области."""
+        for r in self._prev:
+            surface.blit(background, r, r)
+
+    def flush(self) -> List[pygame.Rect]:
+        """Области для display.update; текущий кадр становится «прошлым»."""
+        rects = self._prev + self._cur
+        self._prev, self._cur = self._cur, []
+        if len(rects) > MAX_DIRTY_RECTS:
+            return [rects[0].unionall(rects[1:])]
+        return rects
+
+    def reset(self) -> None:
+        """Полная перерисовка: прошлые области больше не нужны."""
+        self._prev.clear()
+        self._cur.clear()
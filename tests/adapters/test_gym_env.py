@@ -0,0 +1,125 @@
+# tests/adapters/test_gym_env.py
+
+import time
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from adapters.gym_env import NO_OP, PLANE_ALLY, PLANE_ENEMY, TurnshockVecEnv, nearest_enemy_orders
+from agents.base import StateView
+from agents.scripted import FocusFireAgent, NearestEnemyAgent
+from application.game_generator import GeneratorConfig
+from domain.engine.vectorized import TEAM_CODES
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+
+
+def _env(num_envs=6, **kwargs):
+    return TurnshockVecEnv(num_envs, GeneratorConfig(SCENARIOS_DIR, loop=True), seed=5, **kwargs)
+
+
+def test_observation_planes_match_units():
+    env = _env()
+    obs = env.reset()
+    for g, state in enumerate(env.engine.states):
+        alive = [u for u in state.units.values() if u.is_alive()]
+        assert obs["planes"][g, PLANE_ALLY].sum() == sum(u.team == "A" for u in alive)
+        assert obs["planes"][g, PLANE_ENEMY].sum() == sum(u.team == "B" for u in alive)
+        # маска способностей — только у своих юнитов
+        enemy_slots = [i for i, uid in enumerate(env.engine.unit_ids[g]) if state.units[uid].team == "B"]
+        assert not obs["ability_mask"][g, enemy_slots].any()
+
+
+def test_finished_games_report_outcome_and_auto_reset():
+    env = _env(max_ticks=400)
+    env.reset()
+    actions = np.full((env.num_envs, env.max_units, 2), NO_OP)
+    finished = 0
+    for _ in range(400):
+        _, rewards, dones, infos = env.step(actions)
+        assert rewards.shape == dones.shape == (env.num_envs,)
+        for g in np.flatnonzero(dones):
+            finished += 1
+            info = infos[g]
+            assert "terminal_observation" in info
+            # исход входит в награду последнего шага
+            if info["winner"] == "A":
+                assert rewards[g] > 0
+            elif info["winner"] == "B":
+                assert rewards[g] < 0
+        if finished >= env.num_envs:
+            break
+    assert finished
+    assert env.engine.running.all()
+
+
+def test_actions_map_to_profile_abilities():
+    env = _env(num_envs=1)
+    env.reset()
+    state = env.engine.states[0]
+    slot = next(i for i, uid in enumerate(env.engine.unit_ids[0]) if state.units[uid].team == "A")
+    unit = state.units[env.engine.unit_ids[0][slot]]
+    enemy = next(u for u in state.units.values() if u.team == "B")
+    attack = next(i for i, ab in enumerate(unit.abilities) if ab.name != "move_to")
+
+    actions = np.full((1, env.max_units, 2), NO_OP)
+    actions[0, slot] = (attack, enemy.pos.x * env.board_size + enemy.pos.y)
+    orders = env._decode(actions)
+    assert env.engine.abilities.items[orders.ability[0, slot]] is tuple(unit.abilities)[attack]
+    assert env.engine.unit_ids[0][orders.target_slot[0, slot]] == enemy.id
+    # остальные слоты (и юниты соперника) без приказов
+    orders.ability[0, slot] = -1
+    assert (orders.ability == -1).all()
+
+
+def test_array_opponent_matches_nearest_enemy_agent():
+    env = _env(num_envs=8, team="B")
+    env.reset()
+    actions = np.full((env.num_envs, env.max_units, 2), NO_OP)
+    agent = NearestEnemyAgent("A")
+    for _ in range(30):
+        expected = env.engine.orders(agent.act_batch([StateView(s) for s in env.engine.states]))
+        actual = env._decode(actions)
+        nearest_enemy_orders(env.engine, TEAM_CODES["A"], env._strongest, actual)
+        assert (actual.ability == expected.ability).all()
+        given = expected.ability != -1
+        for col in ("target_x", "target_y", "target_slot"):
+            assert (getattr(actual, col)[given] == getattr(expected, col)[given]).all()
+        env.step(actions)
+
+
+def test_scripted_opponent_without_array_version_still_plays():
+    env = _env(num_envs=4, opponent=FocusFireAgent, max_ticks=200)
+    env.reset()
+    assert env._array_opponent is None
+    actions = np.full((env.num_envs, env.max_units, 2), NO_OP)
+    outcomes = []
+    for _ in range(200):
+        _, _, dones, infos = env.step(actions)
+        outcomes += [infos[g]["winner"] for g in np.flatnonzero(dones)]
+    # команда без приказов проигрывает сопернику
+    assert outcomes and set(outcomes) == {"B"}
+
+
+# порог пропускной способности среды: шагов среды в секунду (K × шагов / время)
+# на team_brawl при K=1024 и NO_OP-действиях (игры короткие, авто-сброс
+# частый). Замер — около 20 тыс./с на одном ядре; порог с запасом на шумную машину
+BENCH_SCENARIO = "team_brawl"
+BENCH_ENVS = 1024
+BENCH_STEPS = 20
+BENCH_MIN_STEPS_PER_SEC = 8000
+
+
+def test_env_throughput():
+    cfg = GeneratorConfig(SCENARIOS_DIR, filter_fn=lambda name: name == BENCH_SCENARIO)
+    env = TurnshockVecEnv(BENCH_ENVS, cfg, seed=5)
+    actions = np.full((env.num_envs, env.max_units, 2), NO_OP)
+    env.step(actions)
+    started = time.perf_counter()
+    for _ in range(BENCH_STEPS):
+        env.step(actions)
+    rate = BENCH_ENVS * BENCH_STEPS / (time.perf_counter() - started)
+    assert rate >= BENCH_MIN_STEPS_PER_SEC, f"only {rate:.0f} env steps/s"
@@ -0,0 +1,123 @@
+# tests/agents/test_scripted.py
+
+from pathlib import Path
+
+import pytest
+
+from agents.base import Agent, StateView, batch_intents
+from agents.scripted import SCRIPTED_AGENTS, FocusFireAgent, SupportPriorityAgent
+from application.game_generator import GeneratorConfig
+from application.services.simulation_runner import run_simulations
+from config.config_loader import HeroConfig
+from domain.engine.event_loop import event_tick
+from domain.enums import TargetType, UnitRole
+from domain.factory.game_factory import build_new_game
+from domain.heroes.mage_supp_profile import MageSuppProfile
+from domain.heroes.registry import get_profile
+from domain.geometry.position import Position
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+
+
+def _state(heroes_a, heroes_b):
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role=r, pos=p) for r, p in heroes_a],
+            "B": [HeroConfig(role=r, pos=p) for r, p in heroes_b],
+        },
+        obstacles=set(),
+        regen_zone=set(),
+    )
+
+
+@pytest.mark.parametrize("name", sorted(SCRIPTED_AGENTS))
+def test_scripted_agents_finish_games(name):
+    assert isinstance(SCRIPTED_AGENTS[name]("A"), Agent)
+    cfg = GeneratorConfig(scenarios_dir=SCENARIOS_DIR, loop=True)
+    report = run_simulations(cfg, count=3, agent_factory=SCRIPTED_AGENTS[name], max_ticks=500, base_seed=3)
+    assert report.games == 3 and report.unfinished == 0
+
+
+def test_focus_fire_picks_one_weakest_target():
+    state = _state(
+        [("SWORDSMAN", (0, 0)), ("ARCHER", (0, 4))],
+        [("ARCHER", (8, 0)), ("SWORDSMAN", (8, 8))],
+    )
+    weak = state.get_unit_at(Position(8, 8))
+    weak.hp = 1
+    intents = FocusFireAgent("A").act(StateView(state))
+    assert len(intents) == 2
+    assert {a.target_unit_id for a in intents.values()} == {weak.id}
+
+
+def test_support_heals_most_wounded_ally():
+    state = _state(
+        [("MAGE_SUPP", (0, 0)), ("SWORDSMAN", (1, 1)), ("ARCHER", (2, 0))],
+        [("ARCHER", (10, 10))],
+    )
+    healer = state.get_unit_at(Position(0, 0))
+    hurt = state.get_unit_at(Position(1, 1))
+    hurt.hp = 5
+
+    intents = batch_intents([SupportPriorityAgent("A")], [StateView(state)])[0]
+    assert intents[healer.id].target_unit_id == hurt.id
+    assert intents[healer.id].ability.name == "healing_wave"
+
+
+def _heal_once(state, agent, healer, ally):
+    """Ранит ally, ждёт первого лечения и долечивает до полного HP."""
+    ally.hp = 1
+    view = StateView(state)
+    for _ in range(10):
+        if ally.hp > 1:
+            break
+        state, _, _ = event_tick(state, agent.act(view))
+    assert ally.hp > 1
+    ally.hp = ally.profile.max_hp
+    # после каста в очереди — повтор лечения по союзнику
+    assert healer.current_action.target_unit_id == ally.id
+    assert not healer.current_action.started
+    return state
+
+
+def test_support_stops_healing_a_healthy_ally():
+    state = _state(
+        [("MAGE_SUPP", (0, 0)), ("SWORDSMAN", (1, 1))],
+        [("ARCHER", (10, 10))],
+    )
+    healer = state.get_unit_at(Position(0, 0))
+    ally = state.get_unit_at(Position(1, 1))
+    agent = SupportPriorityAgent("A")
+    state = _heal_once(state, agent, healer, ally)
+
+    # у MAGE_SUPP нет атак — повтор лечения снимается ходом на месте
+    intents = agent.act(StateView(state))
+    assert intents[healer.id].target_unit_id is None
+    state, _, _ = event_tick(state, intents)
+    assert healer.current_action.ability.target is TargetType.POINT
+    assert healer.pos == Position(0, 0)
+
+
+class _BattleMedicProfile(MageSuppProfile):
+    """Саппорт с атакой — свой экземпляр, общий профиль MAGE_SUPP не трогаем."""
+
+    def build_abilities(self):
+        return (*super().build_abilities(), get_profile(UnitRole.ARCHER).ability("arrow_shot"))
+
+
+def test_support_with_attack_retargets_enemy_once_ally_is_healed():
+    state = _state(
+        [("MAGE_SUPP", (0, 0)), ("SWORDSMAN", (1, 1))],
+        [("ARCHER", (10, 10))],
+    )
+    healer = state.get_unit_at(Position(0, 0))
+    ally = state.get_unit_at(Position(1, 1))
+    enemy = state.get_unit_at(Position(10, 10))
+    healer.profile = _BattleMedicProfile()
+    agent = SupportPriorityAgent("A")
+    state = _heal_once(state, agent, healer, ally)
+
+    intents = agent.act(StateView(state))
+    assert intents[healer.id].ability.name == "arrow_shot"
+    assert intents[healer.id].target_unit_id == enemy.id
@@ -53,3 +53,50 @@ def test_generate_infinite(cfg_seq_loop):
         # проверяем, что state имеет нужные поля
         assert hasattr(state, "units")
         assert hasattr(state, "board")
+
+def test_scenario_template_is_cached_until_files_change(tmp_path):
+    import os
+    from application.game_generator import load_scenario
+
+    d = tmp_path / "duel"
+    d.mkdir()
+    (d / "map.json").write_text('{"obstacles":[[5,5]],"regen_zone":[]}')
+    (d / "heroes.json").write_text('{"A":[{"role":"SWORDSMAN","pos":[0,0]}],"B":[{"role":"ARCHER","pos":[9,9]}]}')
+
+    template = load_scenario(d)
+    assert load_scenario(d) is template
+
+    # игры — независимые клоны с общей картой и общими профилями
+    g1, g2 = template.instantiate(), template.instantiate()
+    g1.units[1].hp = 1
+    assert g2.units[1].hp == g2.units[1].profile.max_hp
+    assert g1.board is g2.board
+    assert g1.units[2].profile is g2.units[2].profile
+    assert g1.scenario == "duel"
+
+    (d / "map.json").write_text('{"obstacles":[],"regen_zone":[]}')
+    st = (d / "map.json").stat()
+    os.utime(d / "map.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    fresh = load_scenario(d)
+    assert fresh is not template
+    assert fresh.board.obstacles == set()
+
+
+def test_scenario_board_size_comes_from_map(tmp_path):
+    from application.game_generator import load_scenario
+    from domain.geometry.pathfinding import find_path
+
+    d = tmp_path / "big"
+    d.mkdir()
+    (d / "map.json").write_text('{"size":64,"obstacles":[[40,40]],"regen_zone":[[63,0]]}')
+    (d / "heroes.json").write_text('{"A":[{"role":"SWORDSMAN","pos":[0,0]}],"B":[{"role":"ARCHER","pos":[63,63]}]}')
+
+    state = load_scenario(d).instantiate()
+    assert state.board.size == 64
+    assert state.board.in_bounds(Position(63, 63)) and not Position(63, 63).in_bounds()
+    path = find_path(Position(0, 0), Position(63, 63), state)
+    assert len(path) == 64 and Position(40, 40) not in path
+
+    (d / "heroes.json").write_text('{"A":[{"role":"SWORDSMAN","pos":[64,0]}],"B":[]}')
+    with pytest.raises(ValueError):
+        load_scenario(d)
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from application.game_generator import GeneratorConfig, generate_games, load_scenario
+from application.services.replay import Replay, Replayer, read_varint, write_varint
+from application.services.simulation_runner import run_game
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+
+
+def _snapshot(state):
+    return state.tick, [(u.id, u.hp, u.ap, u.pos, tuple(u.effects)) for u in state.units.values()]
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**63 - 1])
+def test_varint_roundtrip(value):
+    out = bytearray()
+    write_varint(out, value)
+    assert read_varint(bytes(out), 0) == (value, len(out))
+
+
+def test_replay_rebuilds_game_and_seeks_from_keyframes():
+    cfg = GeneratorConfig(SCENARIOS_DIR, loop=True)
+    state = next(generate_games(cfg, count=1))
+    template = load_scenario(SCENARIOS_DIR / state.scenario)
+    result = run_game(template.instantiate(seed=7), max_ticks=200, record=True)
+
+    replay = Replay.from_bytes(result.replay)
+    assert replay.to_bytes() == result.replay
+    assert len(replay.ticks) == result.ticks
+
+    replayer = Replayer.from_scenarios(replay, SCENARIOS_DIR, keyframe_interval=8)
+    played = [_snapshot(s) for s in replayer.play()]
+    final = replayer.state_at(replay.end_tick)
+    assert _snapshot(final) == played[-1]
+    assert final.is_game_over() == result.finished
+
+    # перемотка назад идёт от ключевого кадра и даёт то же состояние
+    mid = replay.start_tick + result.ticks // 2
+    assert _snapshot(replayer.state_at(mid)) == played[mid - replay.start_tick - 1]
+
+    with pytest.raises(ValueError):
+        Replay.from_bytes(result.replay[:-1])
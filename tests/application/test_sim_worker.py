@@ -0,0 +1,36 @@
+import time
+
+from application.services.domain_connector import DomainConnector
+from application.services.sim_worker import MAX_SPEED, SimulationWorker
+
+
+def _wait_snapshots(worker, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snaps = worker.poll()
+        if snaps:
+            return snaps
+        time.sleep(0.01)
+    raise AssertionError("no snapshots from worker")
+
+
+def test_worker_publishes_forked_snapshots_and_pauses():
+    domain = DomainConnector()
+    worker = SimulationWorker(domain, interval=MAX_SPEED, sample_interval=0.01)
+    worker.start()
+    try:
+        snaps = _wait_snapshots(worker)
+        assert all(s.ticks_run >= 1 for s in snaps)
+        # снимок — не живое состояние воркера
+        assert snaps[-1].state is not domain.state
+
+        worker.set_pace(1.0, paused=True)
+        assert worker.wait_idle(5.0)
+        worker.poll()
+        tick = domain.state.tick
+        # ещё один полный круг на паузе — ни тиков, ни снимков
+        assert worker.wait_idle(5.0)
+        assert worker.poll() == []
+        assert domain.state.tick == tick
+    finally:
+        worker.stop()
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+from application.game_generator import GeneratorConfig
+from application.services.simulation_runner import run_simulations
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+
+
+def test_headless_batch_plays_games_to_completion():
+    cfg = GeneratorConfig(scenarios_dir=SCENARIOS_DIR, mode="sequential", loop=True)
+    report = run_simulations(cfg, count=4, max_ticks=500)
+
+    assert report.games == 4
+    assert report.ticks > 0
+    assert sum(report.wins.values()) == 4
+    assert report.ticks_per_sec > 0
+
+
+def test_parallel_run_matches_serial_run_for_same_seed():
+    from application.services.parallel_runner import run_parallel
+
+    cfg = GeneratorConfig(scenarios_dir=SCENARIOS_DIR, mode="sequential", loop=True)
+    serial = run_simulations(cfg, count=6, max_ticks=500, base_seed=42)
+    parallel = run_parallel(cfg, count=6, workers=2, max_ticks=500, base_seed=42)
+
+    assert parallel.games == serial.games == 6
+    assert parallel.ticks == serial.ticks
+    assert parallel.wins == serial.wins
+    assert parallel.stats.get_stats() == serial.stats.get_stats()
+
+
+def test_profiler_attributes_time_to_phases_per_scenario():
+    from domain.analytics.profiler import TickProfiler, profiling
+
+    cfg = GeneratorConfig(scenarios_dir=SCENARIOS_DIR, mode="sequential", loop=True)
+    with profiling(TickProfiler()) as prof:
+        report = run_simulations(cfg, count=2, max_ticks=200, base_seed=1)
+
+    summary = prof.summary()
+    assert sum(s["ticks"] for s in summary.values()) == report.ticks
+    stacks = {f["stack"] for s in summary.values() for f in s["frames"]}
+    for phase in ("ageing", "zones", "ap_regen", "intents", "stun", "execute"):
+        assert f"tick;{phase}" in stacks
+    assert "tick;execute;apply_ability" in stacks
+
+
+def test_profiler_stack_survives_failing_phase(monkeypatch):
+    import pytest
+
+    from application.game_generator import generate_games
+    from domain.analytics.profiler import TickProfiler, profiling
+    from domain.engine import event_loop
+    from domain.errors import DomainError
+
+    cfg = GeneratorConfig(scenarios_dir=SCENARIOS_DIR, mode="sequential", loop=True)
+    state = next(generate_games(cfg, count=1))
+
+    def boom(state, intents):
+        raise DomainError("boom")
+
+    with profiling(TickProfiler()) as prof:
+        with monkeypatch.context() as m:
+            m.setattr(event_loop, "execute_actions", boom)
+            with pytest.raises(DomainError):
+                event_loop.event_tick(state, {})
+        assert prof.depth == 0
+        event_loop.event_tick(state, {})
+
+    stacks = {f["stack"] for s in prof.summary().values() for f in s["frames"]}
+    # следующий тик пишется с корня, а не внутрь незакрытого "tick;execute"
+    assert not any(s.startswith("tick;execute;tick") for s in stacks)
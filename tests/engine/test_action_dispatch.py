@@ -0,0 +1,54 @@
+# tests/engine/test_action_dispatch.py
+
+from dataclasses import replace
+
+import pytest
+
+from config.config_loader import HeroConfig
+from domain.core import unit as unit_mod
+from domain.enums import AbilityKind
+from domain.factory.game_factory import build_new_game
+from domain.geometry.position import Position
+
+
+def _state():
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role="SWORDSMAN", pos=(0, 0))],
+            "B": [HeroConfig(role="ARCHER", pos=(12, 12))],
+        },
+        obstacles=set(),
+        regen_zone=set(),
+    )
+
+
+def test_every_kind_has_handler_and_movement_is_tagged():
+    assert set(unit_mod.ACTION_HANDLERS) == set(AbilityKind)
+    state = _state()
+    for u in state.units.values():
+        for ab in u.abilities:
+            expected = AbilityKind.MOVE if ab.name in ("move_to", "sprint") else AbilityKind.CAST
+            assert ab.kind is expected, ab.name
+
+
+def test_dispatch_goes_through_registry(monkeypatch):
+    state = _state()
+    unit = state.units[1]
+    move = unit.profile.move_ability
+    calls = []
+
+    def spy(u, act, tgt_pos, st):
+        calls.append((u.id, act.ability.name, tgt_pos))
+        return None
+
+    monkeypatch.setitem(unit_mod.ACTION_HANDLERS, AbilityKind.MOVE, spy)
+    unit.start_action(move, Position(3, 3), state)
+    assert unit.advance_action(state) is None
+    assert calls == [(1, move.name, Position(3, 3))]
+    assert unit.pos == Position(0, 0)
+
+    # переименование способности не меняет её поведение
+    renamed = replace(move, name="dash")
+    unit.start_action(renamed, Position(2, 2), state)
+    unit.advance_action(state)
+    assert calls[-1] == (1, "dash", Position(2, 2))
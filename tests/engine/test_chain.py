@@ -0,0 +1,50 @@
+# tests/engine/test_chain.py
+
+from config.config_loader import HeroConfig
+from domain.core.rng import GameRng
+from domain.engine.ability_utils import chain_targets
+from domain.engine.applier import apply_ability
+from domain.factory.game_factory import build_new_game
+from domain.geometry.position import Position
+
+
+def _state():
+    # маг A бьёт молнией по (6, 6); рядом враги на 2 и 4 клетки,
+    # союзник мага на 1 клетке — по нему прыжок идти не должен
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role="MAGE_DPS", pos=(4, 6)), HeroConfig(role="SWORDSMAN", pos=(7, 6))],
+            "B": [
+                HeroConfig(role="SWORDSMAN", pos=(6, 6)),
+                HeroConfig(role="SWORDSMAN", pos=(8, 8)),
+                HeroConfig(role="SWORDSMAN", pos=(11, 10)),
+                HeroConfig(role="SWORDSMAN", pos=(0, 0)),
+            ],
+        },
+        obstacles=set(),
+        regen_zone=set(),
+    )
+
+
+def test_chain_hops_to_nearest_unhit_enemies_within_radius():
+    state = _state()
+    mage = state.get_unit_at(Position(4, 6))
+    bolt = mage.profile.ability("chain_lightning")
+    chain = chain_targets(state, bolt, Position(6, 6))
+    assert [u.pos for u in chain] == [Position(6, 6), Position(8, 8), Position(11, 10)]
+    assert chain_targets(state, bolt, Position(2, 2)) == []
+
+
+def test_bounce_damage_decays_by_bounce_mult():
+    state = _state()
+    state.rng = GameRng(7)
+    mage = state.get_unit_at(Position(4, 6))
+    bolt = mage.profile.ability("chain_lightning")
+    ally = state.get_unit_at(Position(7, 6))
+    far = state.get_unit_at(Position(0, 0))
+
+    hits = apply_ability(state, mage, bolt, Position(6, 6))
+    lost = [u.profile.max_hp - u.hp for u in hits]
+    assert len(hits) == 1 + bolt.bounces
+    assert lost[0] > lost[1] > lost[2] > 0
+    assert ally.hp == ally.profile.max_hp and far.hp == far.profile.max_hp
@@ -0,0 +1,41 @@
+# tests/engine/test_effects.py
+
+from domain.core.effect import ActiveEffects, Effect
+from domain.enums import EffectType
+
+
+def test_totals_follow_add_consume_and_expiry():
+    effects = ActiveEffects()
+    effects.add(Effect(EffectType.BUFF, 3, 1))
+    effects.add(Effect(EffectType.BUFF, 2, 3))
+    effects.add(Effect(EffectType.SHIELD, 10, 2))
+    assert effects.total(EffectType.BUFF) == 5
+
+    effects.tick()
+    assert effects.total(EffectType.BUFF) == 2
+    assert list(effects) == [Effect(EffectType.BUFF, 2, 2), Effect(EffectType.SHIELD, 10, 1)]
+
+    shield = effects.consume(EffectType.SHIELD)
+    assert shield == Effect(EffectType.SHIELD, 10, 1)
+    assert not effects.has(EffectType.SHIELD)
+    assert effects.total(EffectType.SHIELD) == 0
+
+    effects.tick()
+    effects.tick()
+    assert len(effects) == 0
+    assert effects.total(EffectType.BUFF) == 0
+
+
+def test_tick_matches_duration_countdown():
+    # поведение как у прежнего списка: duration-1, эффекты с duration<=0 выпадают
+    effects = ActiveEffects([Effect(EffectType.STUN, 2, 2), Effect(EffectType.SLOW_AP, 1, 0)])
+    effects.tick()
+    assert list(effects) == [Effect(EffectType.STUN, 2, 1)]
+    effects.tick()
+    assert not effects.has(EffectType.STUN)
+
+
+def test_rows_report_remaining_duration_in_order():
+    effects = ActiveEffects([Effect(EffectType.SHIELD, 10, 3), Effect(EffectType.BUFF, 1, 2)])
+    effects.tick()
+    assert effects.rows() == [(EffectType.SHIELD, 10, 2), (EffectType.BUFF, 1, 1)]
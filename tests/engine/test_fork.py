@@ -0,0 +1,47 @@
+# tests/engine/test_fork.py
+
+from pathlib import Path
+
+from agents.base import StateView
+from agents.scripted import NearestEnemyAgent
+from application.game_generator import GeneratorConfig, generate_games
+from domain.core.rng import GameRng
+from domain.engine.event_loop import event_tick
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+
+
+def _intents(state):
+    out = {}
+    for agent in (NearestEnemyAgent("A"), NearestEnemyAgent("B")):
+        out.update(agent.act(StateView(state)))
+    return out
+
+
+def _snapshot(state):
+    return state.tick, [(u.id, u.hp, u.ap, u.pos, tuple(u.effects)) for u in state.units.values()]
+
+
+def _play(state, ticks):
+    for _ in range(ticks):
+        state, _, over = event_tick(state, _intents(state))
+        if over:
+            break
+    return state
+
+
+def test_fork_does_not_touch_original_and_replays_identically():
+    cfg = GeneratorConfig(SCENARIOS_DIR, loop=True)
+    for i, state in enumerate(generate_games(cfg, count=4)):
+        state.rng = GameRng(100 + i)
+        state = _play(state, 5)
+        before = _snapshot(state)
+
+        fork = _play(state.fork(), 40)
+        assert _snapshot(state) == before
+        assert fork.board is state.board
+        assert all(fork.units[uid].profile is u.profile for uid, u in state.units.items())
+
+        # тот же rng и те же интенты — форк повторяет оригинал
+        assert _snapshot(_play(state, 40)) == _snapshot(fork)
@@ -0,0 +1,161 @@
+# tests/engine/test_vectorized.py
+
+import copy
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from agents.base import StateView, batch_intents
+from agents.scripted import NearestEnemyAgent
+from application.game_generator import GeneratorConfig, generate_games, load_scenario
+from config.cli_config import cli_settings
+from config.config_loader import HeroConfig
+from config.logger import RTS_Logger
+from domain.core.rng import GameRng
+from domain.engine.event_loop import event_tick
+from domain.engine.vectorized import BatchEngine
+from domain.factory.game_factory import build_new_game
+from domain.geometry.pathfinding import find_path
+from domain.geometry.position import Position
+
+ROOT = Path(__file__).resolve().parents[2]
+SCENARIOS_DIR = ROOT / "configs"
+MAX_TICKS = 300
+
+
+AGENTS = (NearestEnemyAgent("A"), NearestEnemyAgent("B"))
+
+
+def _intents(state):
+    return batch_intents(AGENTS, [StateView(state)])[0]
+
+
+def _action(act):
+    if act is None:
+        return None
+    path = tuple(act.path) if act.path is not None else None
+    return (act.ability.name, act.target, act.target_unit_id, act.ticks_remaining, act.started, path, act.hits)
+
+
+def _snapshot(state):
+    return [
+        (u.id, u.hp, u.ap, u.pos, tuple(u.effects), _action(u.current_action), _action(u.completed_action))
+        for u in state.units.values()
+    ]
+
+
+def _state(obstacles, heroes_a, heroes_b):
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role="SWORDSMAN", pos=p) for p in heroes_a],
+            "B": [HeroConfig(role="ARCHER", pos=p) for p in heroes_b],
+        },
+        obstacles={Position(*p) for p in obstacles},
+        regen_zone=set(),
+    )
+
+
+def _stats(state):
+    return {uid: s.by_ability for uid, s in state.stats.units.items()}
+
+
+def test_batch_engine_matches_object_engine_for_same_seed():
+    cfg = GeneratorConfig(SCENARIOS_DIR, loop=True)
+    states = list(generate_games(cfg, count=12))
+    for i, s in enumerate(states):
+        s.rng = GameRng(1000 + i)
+    reference = copy.deepcopy(states)
+    batched = copy.deepcopy(states)
+
+    expected = []
+    for state in reference:
+        trace = []
+        for _ in range(MAX_TICKS):
+            state, executed, over = event_tick(state, _intents(state))
+            trace.append((executed, _snapshot(state)))
+            if over:
+                break
+        expected.append(trace)
+
+    engine = BatchEngine(batched)
+    actual = [[] for _ in batched]
+    for _ in range(MAX_TICKS):
+        if not engine.running.any():
+            break
+        live = engine.running.copy()
+        intents = batch_intents(AGENTS, [StateView(s) for s in engine.states])
+        executed, _ = engine.step([i if live[g] else {} for g, i in enumerate(intents)])
+        for g in np.flatnonzero(live):
+            flags = dict(zip(engine.unit_ids[g], executed[g].tolist()))
+            actual[g].append((flags, _snapshot(engine.states[g])))
+
+    assert actual == expected
+    assert [_stats(s) for s in engine.states] == [_stats(s) for s in reference]
+    assert not engine.running.any()
+
+
+def test_batched_bfs_picks_the_same_path_as_find_path():
+    # случайные стены и юниты; путь пакетного BFS — тот же канонический, что и у A*
+    rnd = random.Random(7)
+    states, goals = [], []
+    for _ in range(40):
+        cells = [(x, y) for x in range(13) for y in range(13)]
+        rnd.shuffle(cells)
+        states.append(_state(obstacles=cells[4:40], heroes_a=cells[:2], heroes_b=cells[2:4]))
+        goals.append(Position(*cells[rnd.randrange(4, len(cells))]))
+    engine = BatchEngine(states)
+    games = np.arange(len(states))
+    engine._find_paths(games, 0, np.array([p.x for p in goals]), np.array([p.y for p in goals]))
+
+    for g, (state, goal) in enumerate(zip(states, goals)):
+        unit = next(iter(state.units.values()))
+        length = engine.path_len[g, 0]
+        actual = [Position(*divmod(int(c), 13)) for c in engine.path[g, 0, :length]]
+        assert actual == find_path(unit.pos, goal, state)
+        assert actual == find_path(unit.pos, goal, state, moving_goal=True)
+
+
+# порог ускорения BatchEngine над event_tick на батче epic_battle (замер —
+# около ×10 на первых 10 тиках 256 игр; порог с запасом на шумную машину)
+BENCH_GAMES = 256
+BENCH_TICKS = 10
+BENCH_MIN_SPEEDUP = 4.0
+
+
+@pytest.fixture
+def quiet_logs():
+    # логи объектного движка в замер не входят — как в tools/bench_batch.py
+    previous = RTS_Logger._global_level
+    RTS_Logger.set_global_level("NONE")
+    yield
+    RTS_Logger.set_global_level(previous or cli_settings.log_level)
+    RTS_Logger._global_level = previous
+
+
+def test_batch_engine_is_faster_than_event_tick(quiet_logs):
+    template = load_scenario(SCENARIOS_DIR / "epic_battle")
+    reference = [template.instantiate(seed=g) for g in range(BENCH_GAMES)]
+    engine = BatchEngine([template.instantiate(seed=g) for g in range(BENCH_GAMES)])
+    views = [StateView(s) for s in engine.states]
+
+    object_time = batch_time = 0.0
+    for _ in range(BENCH_TICKS):
+        intents = batch_intents(AGENTS, [StateView(s) for s in reference])
+        started = time.perf_counter()
+        for state, game_intents in zip(reference, intents):
+            event_tick(state, game_intents)
+        object_time += time.perf_counter() - started
+
+        engine.states
+        orders = engine.orders(batch_intents(AGENTS, views))
+        started = time.perf_counter()
+        engine.step(orders)
+        batch_time += time.perf_counter() - started
+
+    assert [_snapshot(s) for s in engine.states] == [_snapshot(s) for s in reference]
+    speedup = object_time / batch_time
+    assert speedup >= BENCH_MIN_SPEEDUP, f"BatchEngine only x{speedup:.2f} over event_tick"
@@ -0,0 +1,42 @@
+# tests/geometry/test_bitboard.py
+
+import pytest
+
+from domain.constants import BOARD_SIZE
+from domain.core.board import Board
+from domain.geometry.bitboard import CellSet, cell_index, cell_positions, neighbours8
+from domain.geometry.position import Position
+
+
+def test_cellset_behaves_like_a_set_of_positions():
+    cells = {Position(0, 0), Position(4, 7), Position(12, 12)}
+    bb = CellSet.from_positions(cells)
+
+    assert bb == cells and cells == bb
+    assert hash(bb) == hash(frozenset(cells))
+    assert len(bb) == 3 and set(bb) == cells
+    assert Position(4, 7) in bb and Position(4, 8) not in bb
+    assert Position(-1, 0) not in bb and (4, 7) not in bb
+    assert bb.has(cell_index(Position(12, 12)))
+    assert bb - {Position(0, 0)} == {Position(4, 7), Position(12, 12)}
+
+    with pytest.raises(ValueError):
+        CellSet.from_positions([Position(BOARD_SIZE, 0)])
+
+
+def test_board_converts_position_sets():
+    board = Board(obstacles={Position(1, 1)}, regen_zone=[Position(2, 2)])
+    assert isinstance(board.obstacles, CellSet) and isinstance(board.regen_zone, CellSet)
+    assert board.is_blocked(Position(1, 1)) and not board.is_blocked(Position(2, 2))
+    assert board.layout_key() == frozenset({Position(1, 1)})
+
+
+def test_neighbour_table_stays_on_board():
+    nbrs = neighbours8()
+    cells = cell_positions()
+    assert len(nbrs[cell_index(Position(0, 0))]) == 3
+    assert len(nbrs[cell_index(Position(6, 0))]) == 5
+    centre = Position(6, 6)
+    assert {cells[i] for i in nbrs[cell_index(centre)]} == {
+        Position(6 + dx, 6 + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)
+    }
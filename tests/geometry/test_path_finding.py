@@ -0,0 +1,97 @@
+# tests/geometry/test_path_finding.py
+
+from config.config_loader import HeroConfig
+from domain.factory.game_factory import build_new_game
+from domain.geometry.bitboard import cell_index
+from domain.geometry import pathfinding
+from domain.geometry.pathfinding import (
+    UNREACHABLE,
+    blocked_mask,
+    find_path,
+    flow_field,
+    flow_field_cache_clear,
+    flow_field_cache_info,
+)
+from domain.geometry.position import Position
+
+
+def _state(obstacles=(), heroes_a=(), heroes_b=()):
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role="SWORDSMAN", pos=p) for p in heroes_a],
+            "B": [HeroConfig(role="ARCHER", pos=p) for p in heroes_b],
+        },
+        obstacles={Position(*p) for p in obstacles},
+        regen_zone=set(),
+    )
+
+
+def test_path_is_chebyshev_shortest_on_empty_board():
+    state = _state()
+    start, goal = Position(0, 0), Position(6, 3)
+    path = find_path(start, goal, state)
+    assert len(path) == start.distance(goal)
+    assert path[-1] == goal
+
+
+def test_path_goes_around_wall_and_units():
+    # стена по x=2 с проходом только через y=4, в проходе стоит юнит
+    wall = [(2, y) for y in range(0, 13) if y not in (4, 8)]
+    state = _state(obstacles=wall, heroes_a=[(0, 0)], heroes_b=[(2, 4)])
+    path = find_path(Position(0, 0), Position(4, 0), state)
+
+    assert path and path[-1] == Position(4, 0)
+    assert Position(2, 4) not in path
+    assert Position(2, 8) in path
+    assert all(p not in state.board.obstacles for p in path)
+
+
+def test_goal_cell_may_be_occupied():
+    state = _state(heroes_a=[(0, 0)], heroes_b=[(3, 0)])
+    assert find_path(Position(0, 0), Position(3, 0), state)[-1] == Position(3, 0)
+
+
+def test_unreachable_goal_returns_empty():
+    ring = [(x, y) for x in range(4, 7) for y in range(4, 7) if (x, y) != (5, 5)]
+    state = _state(obstacles=ring)
+    assert find_path(Position(0, 0), Position(5, 5), state) == []
+
+
+def test_flow_field_is_cached_per_layout():
+    state = _state(obstacles=[(1, 1)])
+    key = state.board.layout_key()
+    first = flow_field(key, Position(5, 5))
+    assert flow_field(frozenset({Position(1, 1)}), Position(5, 5)) is first
+    assert first[cell_index(Position(5, 5))] == 0
+    assert first[cell_index(Position(1, 1))] == UNREACHABLE
+    assert first[cell_index(Position(0, 0))] == 6   # диагональ через (1, 1) закрыта
+
+
+def test_moving_goal_uses_plain_astar_without_flow_field():
+    wall = [(2, y) for y in range(0, 13) if y not in (4, 8)]
+    state = _state(obstacles=wall, heroes_a=[(0, 0)], heroes_b=[(2, 4)])
+    flow_field_cache_clear()
+
+    moving = find_path(Position(0, 0), Position(4, 0), state, moving_goal=True)
+    assert flow_field_cache_info().misses == 0
+    static = find_path(Position(0, 0), Position(4, 0), state)
+    assert len(moving) == len(static)
+    assert moving[-1] == Position(4, 0) and Position(2, 8) in moving
+
+
+def test_blocked_mask_marks_obstacles_by_cell_index():
+    state = _state(obstacles=[(1, 1), (3, 0)])
+    mask = blocked_mask(state.board.layout_key())
+    assert [i for i, b in enumerate(mask) if b] == [cell_index(Position(1, 1)), cell_index(Position(3, 0))]
+
+
+def test_flow_field_cache_is_bounded_by_bytes(monkeypatch):
+    key = _state().board.layout_key()
+    field_bytes = len(flow_field(key, Position(0, 0))) * 4
+    monkeypatch.setattr(pathfinding._flow_fields, "budget", 3 * field_bytes)
+    flow_field_cache_clear()
+
+    for y in range(5):
+        flow_field(key, Position(0, y))
+    info = flow_field_cache_info()
+    assert info.fields == 3 and info.nbytes == 3 * field_bytes
@@ -0,0 +1,74 @@
+# tests/geometry/test_spatial.py
+
+from config.config_loader import HeroConfig
+from domain.core.effect import Effect
+from domain.enums import EffectType
+from domain.factory.game_factory import build_new_game
+from domain.geometry.position import Position
+
+HEROES_A = [(0, 0), (3, 4), (5, 5), (12, 12)]
+HEROES_B = [(4, 4), (6, 2), (9, 9), (1, 11)]
+
+
+def _state():
+    return build_new_game(
+        hero_setup={
+            "A": [HeroConfig(role="SWORDSMAN", pos=p) for p in HEROES_A],
+            "B": [HeroConfig(role="ARCHER", pos=p) for p in HEROES_B],
+        },
+        obstacles=set(),
+        regen_zone=set(),
+    )
+
+
+def _brute(state, center, radius, team=None):
+    return [
+        u.id for u in sorted(state.units.values(), key=lambda u: u.id)
+        if u.is_alive() and center.distance(u.pos) <= radius and team in (None, u.team)
+    ]
+
+
+def test_radius_queries_match_full_scan_after_moves_and_deaths():
+    state = _state()
+    a0 = next(u for u in state.units.values() if u.pos == Position(0, 0))
+    state.move_unit(a0, Position(7, 7))
+    b0 = next(u for u in state.units.values() if u.pos == Position(9, 9))
+    b0.hp = 0
+    state.vacate(b0)
+
+    for center in (Position(0, 0), Position(5, 5), Position(12, 0), Position(8, 8)):
+        for radius in (0, 1, 3, 6, 13):
+            for team in (None, "A", "B"):
+                got = [u.id for u in state.units_in_radius(center, radius, team)]
+                assert got == _brute(state, center, radius, team)
+
+
+def test_nearest_units_orders_by_distance_then_id():
+    state = _state()
+    center = Position(4, 4)
+    got = state.nearest_units(center, k=3, radius=5, include_center=False)
+    assert [u.pos for u in got] == [Position(3, 4), Position(5, 5), Position(6, 2)]
+
+
+def test_incremental_nearest_matches_full_sort():
+    state = _state()
+    for center in (Position(0, 0), Position(4, 4), Position(12, 12), Position(7, 1)):
+        for k in (1, 2, 5, 8):
+            for radius in (0, 2, 5, 13):
+                for exclude in ((), {3, 6}):
+                    ranked = sorted(
+                        (u for u in state.units.values()
+                         if center.distance(u.pos) <= radius and u.id not in exclude),
+                        key=lambda u: (center.distance(u.pos), u.id),
+                    )
+                    got = state.nearest_units(center, k, radius, exclude=exclude)
+                    assert [u.id for u in got] == [u.id for u in ranked[:k]]
+
+
+def test_taunt_aura_covers_cells_within_radius():
+    state = _state()
+    taunter = state.get_unit_at(Position(3, 4))
+    taunter.add_effect(Effect(EffectType.TAUNT, 2, 3))
+    auras = state.taunt_auras()
+    assert auras[Position(5, 6)] == [taunter]
+    assert Position(6, 4) not in auras
@@ -0,0 +1,46 @@
+# tests/geometry/test_visibility.py
+
+import random
+
+from domain.constants import BOARD_SIZE
+from domain.core.board import Board
+from domain.geometry.position import Position
+from domain.geometry.visibility import line_cells, visibility
+
+
+def _cells():
+    return [Position(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+
+
+def test_line_cells_excludes_endpoints_and_is_contiguous():
+    assert list(line_cells(2, 2, 2, 2)) == []
+    assert list(line_cells(0, 0, 1, 1)) == []
+    assert list(line_cells(0, 0, 4, 2)) == [(1, 1), (2, 1), (3, 2)]
+    assert list(line_cells(3, 0, 0, 0)) == [(2, 0), (1, 0)]
+
+
+def test_diagonals_and_straight_lines_are_blocked():
+    board = Board(obstacles={Position(3, 3), Position(6, 5)})
+    assert not board.has_los(Position(0, 0), Position(5, 5))
+    assert not board.has_los(Position(6, 0), Position(6, 12))
+    assert board.has_los(Position(0, 0), Position(3, 3))      # стену видно
+    assert board.has_los(Position(0, 1), Position(12, 1))
+    assert board.is_line_blocked(Position(5, 5), Position(1, 1))
+    assert not board.has_los(Position(0, 0), Position(-1, 0))
+
+
+def test_table_is_symmetric_and_matches_direct_bresenham():
+    rnd = random.Random(3)
+    cells = _cells()
+    obstacles = frozenset(rnd.sample(cells, 30))
+    vis = visibility(obstacles)
+    assert visibility(obstacles) is vis
+
+    def clear(a, b):
+        return not any(Position(x, y) in obstacles for x, y in line_cells(a.x, a.y, b.x, b.y))
+
+    for a in rnd.sample(cells, 25):
+        for b in cells:
+            expected = clear(a, b) or clear(b, a)
+            assert vis.visible(a, b) is expected
+            assert vis.visible(b, a) is expected
@@ -0,0 +1,53 @@
+# tests/heroes/test_registry.py
+
+import pickle
+
+from config.config_loader import HeroConfig
+from domain.enums import UnitRole
+from domain.factory.unit_factory import create_heroes_for_setup
+from domain.heroes.registry import get_profile
+from domain.heroes.swordsman_profile import SwordsmanProfile
+
+
+def test_units_of_a_role_share_one_profile():
+    units = create_heroes_for_setup({
+        "A": [HeroConfig(role="ARCHER", pos=(0, 0)), HeroConfig(role="ARCHER", pos=(1, 0))],
+        "B": [HeroConfig(role="ARCHER", pos=(5, 5))],
+    })
+    assert units[0].profile is units[1].profile is units[2].profile is get_profile(UnitRole.ARCHER)
+
+
+def test_equal_abilities_are_interned_across_roles():
+    sword = get_profile(UnitRole.SWORDSMAN)
+    shield = get_profile(UnitRole.SHIELD)
+    # обе роли двигаются одинаковым move_to(range=1, cost=1)
+    assert sword.move_ability is shield.move_ability
+    assert sword.move_ability is sword.ability("move_to")
+
+
+def test_precomputed_lookups():
+    archer = get_profile(UnitRole.ARCHER)
+    sword = get_profile(UnitRole.SWORDSMAN)
+    assert not archer.has_melee and archer.melee_ability is None
+    assert sword.has_melee and sword.melee_ability.name == "melee_attack"
+    assert set(archer.abilities_by_name) == {ab.name for ab in archer.abilities}
+
+
+def test_profiles_intern_their_own_abilities():
+    # интернирует сам профиль, а не реестр: и отдельный экземпляр, и профиль,
+    # собирающий способности по-своему, получают общие Ability
+    class Scout(SwordsmanProfile):
+        def build_abilities(self):
+            return [ab for ab in super().build_abilities() if ab.name == "move_to"]
+
+    sword = get_profile(UnitRole.SWORDSMAN)
+    assert SwordsmanProfile().abilities == sword.abilities
+    assert all(a is b for a, b in zip(SwordsmanProfile().abilities, sword.abilities))
+    assert Scout().move_ability is sword.move_ability
+
+
+def test_profile_pickles_after_lookups_are_cached():
+    sword = get_profile(UnitRole.SWORDSMAN)
+    assert sword.melee_ability is not None  # abilities_by_name закэширован
+    clone = pickle.loads(pickle.dumps(sword))
+    assert type(clone) is SwordsmanProfile and clone.abilities == sword.abilities
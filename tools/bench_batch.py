@@ -0,0 +1,140 @@
+# tools/bench_batch.py
+"""
+Бенчмарк BatchEngine против event_tick: одни и те же игры сценария, один и
+тот же seed, --games игр по --ticks тиков.
+
+Интенты строятся скриптовыми агентами для обоих путей одинаково и в замер не
+входят — сравнивается только движок (сборка объектов BatchEngine.states для
+агентов — тоже вне замера). Печатает игро-тиков в секунду для
+event_tick (по игре за раз) и BatchEngine.step (весь батч за раз), ускорение
+и совпадение финальных состояний. Каждый путь прогоняется --repeat раз,
+берётся лучший — так меньше шума от соседних процессов.
+
+    python tools/bench_batch.py --scenario epic_battle --games 256 --ticks 20
+    python tools/bench_batch.py --json bench_batch.json   # для сравнения между коммитами
+    python tools/bench_batch.py --min-speedup 5           # код выхода 1, если медленнее
+
+Требует numpy (extra "fast").
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from agents.base import StateView, batch_intents  # noqa: E402
+from agents.scripted import NearestEnemyAgent  # noqa: E402
+from application.game_generator import load_scenario  # noqa: E402
+from config.logger import RTS_Logger  # noqa: E402
+from domain.core.state import GameState  # noqa: E402
+from domain.engine.event_loop import event_tick  # noqa: E402
+from domain.engine.vectorized import BatchEngine  # noqa: E402
+
+AGENTS = (NearestEnemyAgent("A"), NearestEnemyAgent("B"))
+
+
+def _snapshot(state: GameState) -> List[Any]:
+    return [(u.id, u.hp, u.ap, u.pos, tuple(u.effects)) for u in state.units.values()]
+
+
+def _games(scenario: str, games: int, seed: int) -> List[GameState]:
+    template = load_scenario(ROOT / "configs" / scenario)
+    return [template.instantiate(seed=seed + g) for g in range(games)]
+
+
+def _object_run(scenario: str, games: int, ticks: int, seed: int) -> Tuple[float, int, List[Any]]:
+    states = _games(scenario, games, seed)
+    elapsed, game_ticks = 0.0, 0
+    for state in states:
+        view = StateView(state)
+        for _ in range(ticks):
+            intents = batch_intents(AGENTS, [view])[0]
+            started = time.perf_counter()
+            state, _, over = event_tick(state, intents)
+            elapsed += time.perf_counter() - started
+            game_ticks += 1
+            if over:
+                break
+    return elapsed, game_ticks, [_snapshot(s) for s in states]
+
+
+def _batch_run(scenario: str, games: int, ticks: int, seed: int) -> Tuple[float, int, List[Any]]:
+    engine = BatchEngine(_games(scenario, games, seed))
+    views = [StateView(s) for s in engine.states]
+    elapsed, game_ticks = 0.0, 0
+    for _ in range(ticks):
+        if not engine.running.any():
+            break
+        live = engine.running.copy()
+        engine.states  # собрать объекты из столбцов для агентов — вне замера
+        intents = batch_intents(AGENTS, views)
+        started = time.perf_counter()
+        engine.step([i if live[g] else {} for g, i in enumerate(intents)])
+        elapsed += time.perf_counter() - started
+        game_ticks += int(live.sum())
+    return elapsed, game_ticks, [_snapshot(s) for s in engine.states]
+
+
+def run_case(scenario: str, games: int, ticks: int, seed: int = 0, repeat: int = 3) -> Dict[str, Any]:
+    """Прогоны обоих движков; время — только вызовы event_tick / step, лучший из repeat."""
+    obj_rate = batch_rate = 0.0
+    same = True
+    for _ in range(repeat):
+        obj_time, obj_ticks, expected = _object_run(scenario, games, ticks, seed)
+        batch_time, batch_ticks, actual = _batch_run(scenario, games, ticks, seed)
+        obj_rate = max(obj_rate, obj_ticks / obj_time)
+        batch_rate = max(batch_rate, batch_ticks / batch_time)
+        same = same and expected == actual
+    return {
+        "scenario": scenario,
+        "games": games,
+        "ticks": ticks,
+        "event_tick_per_s": round(obj_rate),
+        "batch_per_s": round(batch_rate),
+        "speedup": round(batch_rate / obj_rate, 2),
+        "same_result": same,
+    }
+
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    cols = ("scenario", "games", "ticks", "event_tick_per_s", "batch_per_s", "speedup", "same_result")
+    print("  ".join(f"{c:>16}" for c in cols))
+    for row in rows:
+        print("  ".join(f"{row[c]!s:>16}" for c in cols))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="+", default=["epic_battle"],
+                        help="Папки сценариев в configs/")
+    parser.add_argument("--games", type=int, default=256, help="Игр в батче")
+    parser.add_argument("--ticks", type=int, default=20, help="Тиков на игру")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Прогонов на путь (берётся лучший)")
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH",
+                        help="Сохранить строки отчёта в JSON")
+    parser.add_argument("--min-speedup", type=float, default=None, metavar="X",
+                        help="Порог ускорения: ниже него (или при расхождении результатов) — код выхода 1")
+    args = parser.parse_args()
+    RTS_Logger.set_global_level("NONE")
+
+    rows = [run_case(name, args.games, args.ticks, args.seed, args.repeat) for name in args.scenario]
+    _print_table(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"written to {args.json}")
+    if args.min_speedup is not None:
+        failed = [r for r in rows if r["speedup"] < args.min_speedup or not r["same_result"]]
+        for row in failed:
+            print(f"FAIL {row['scenario']}: x{row['speedup']} (min x{args.min_speedup}), same_result={row['same_result']}")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
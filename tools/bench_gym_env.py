@@ -0,0 +1,87 @@
+# tools/bench_gym_env.py
+"""
+Бенчмарк TurnshockVecEnv: шагов среды в секунду (--envs игр × шагов / время)
+на сценарии --scenario. Действия обучаемой команды — NO_OP (соперник
+NearestEnemyAgent считается векторно), поэтому замер — весь env.step:
+разбор действий, соперник, BatchEngine.step, награды, наблюдения и
+авто-сброс законченных игр. Берётся лучший из --repeat прогонов.
+
+    python tools/bench_gym_env.py --envs 256 1024 --steps 50
+    python tools/bench_gym_env.py --scenario swordsman_vs_archer --min-rate 20000
+
+Требует numpy (extra "fast").
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from adapters.gym_env import NO_OP, TurnshockVecEnv  # noqa: E402
+from application.game_generator import GeneratorConfig  # noqa: E402
+from config.logger import RTS_Logger  # noqa: E402
+
+
+def run_case(scenario: str, envs: int, steps: int, seed: int = 0, repeat: int = 3) -> Dict[str, Any]:
+    """steps шагов среды из envs игр; лучший из repeat прогонов."""
+    cfg = GeneratorConfig(ROOT / "configs", filter_fn=lambda name: name == scenario)
+    rate = 0.0
+    for _ in range(repeat):
+        env = TurnshockVecEnv(envs, cfg, seed=seed)
+        env.reset()
+        actions = np.full((envs, env.max_units, 2), NO_OP)
+        started = time.perf_counter()
+        for _ in range(steps):
+            env.step(actions)
+        rate = max(rate, envs * steps / (time.perf_counter() - started))
+    return {"scenario": scenario, "envs": envs, "steps": steps, "env_steps_per_s": round(rate)}
+
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    cols = ("scenario", "envs", "steps", "env_steps_per_s")
+    print("  ".join(f"{c:>20}" for c in cols))
+    for row in rows:
+        print("  ".join(f"{row[c]!s:>20}" for c in cols))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", nargs="+", default=["epic_battle"],
+                        help="Папки сценариев в configs/")
+    parser.add_argument("--envs", type=int, nargs="+", default=[256], help="Игр в среде")
+    parser.add_argument("--steps", type=int, default=50, help="Шагов среды на прогон")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Прогонов на случай (берётся лучший)")
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH",
+                        help="Сохранить строки отчёта в JSON")
+    parser.add_argument("--min-rate", type=float, default=None, metavar="N",
+                        help="Порог шагов среды в секунду: ниже него — код выхода 1")
+    args = parser.parse_args()
+    RTS_Logger.set_global_level("NONE")
+
+    rows = [
+        run_case(name, envs, args.steps, args.seed, args.repeat)
+        for name in args.scenario
+        for envs in args.envs
+    ]
+    _print_table(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"written to {args.json}")
+    if args.min_rate is not None:
+        failed = [r for r in rows if r["env_steps_per_s"] < args.min_rate]
+        for row in failed:
+            print(f"FAIL {row['scenario']} x{row['envs']}: {row['env_steps_per_s']} env steps/s (min {args.min_rate:.0f})")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# tools/bench_scaling.py
+"""
+Бенчмарк масштабирования тика: как растёт цена event_tick с размером доски
+и числом юнитов.
+
+Для каждой пары (сторона доски, юнитов на команду) собирается синтетический
+сценарий — команды у противоположных краёв, случайные препятствия, — и
+прогоняется --ticks тиков скриптовыми агентами под TickProfiler. В таблице:
+мс на тик — всего, по фазам intents/execute и отдельно в find_path, — плюс
+число вызовов find_path и построенных flow field на тик.
+
+    python tools/bench_scaling.py --sizes 13 32 64 128 --units 4 16 32 --ticks 30
+    python tools/bench_scaling.py --json bench.json   # для сравнения между коммитами
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from agents.base import StateView  # noqa: E402
+from agents.scripted import NearestEnemyAgent  # noqa: E402
+from config.config_loader import HeroConfig  # noqa: E402
+from config.logger import RTS_Logger  # noqa: E402
+from domain.analytics.profiler import TickProfiler, profiling  # noqa: E402
+from domain.engine.event_loop import event_tick  # noqa: E402
+from domain.enums import UnitRole  # noqa: E402
+from domain.factory.game_factory import ScenarioTemplate, compile_scenario  # noqa: E402
+from domain.geometry.pathfinding import flow_field_cache_clear, flow_field_cache_info  # noqa: E402
+from domain.geometry.position import Position  # noqa: E402
+
+DEFAULT_SIZES = (13, 32, 64, 128)
+DEFAULT_UNITS = (4, 16, 32)
+OBSTACLE_DENSITY = 0.08
+# столбцы у краёв, где стоят команды, — без препятствий
+SPAWN_MARGIN = 2
+
+
+def synthetic_scenario(size: int, per_team: int, seed: int = 0) -> ScenarioTemplate:
+    """Команды по per_team юнитов у левого и правого края, препятствия — OBSTACLE_DENSITY клеток."""
+    rnd = random.Random(seed)
+    roles = [r.name for r in UnitRole]
+    cols = -(-per_team // size)
+    if cols + SPAWN_MARGIN > size // 2:
+        raise ValueError(f"{per_team} units per team do not fit a {size}x{size} board")
+
+    hero_setup: Dict[str, List[HeroConfig]] = {"A": [], "B": []}
+    for i in range(per_team):
+        x, y = divmod(i, size)
+        role = roles[i % len(roles)]
+        hero_setup["A"].append(HeroConfig(role=role, pos=(x, y)))
+        hero_setup["B"].append(HeroConfig(role=role, pos=(size - 1 - x, size - 1 - y)))
+
+    free = [
+        Position(x, y)
+        for x in range(cols + SPAWN_MARGIN, size - cols - SPAWN_MARGIN)
+        for y in range(size)
+    ]
+    obstacles = set(rnd.sample(free, int(len(free) * OBSTACLE_DENSITY)))
+    return compile_scenario(
+        hero_setup=hero_setup,
+        obstacles=obstacles,
+        regen_zone=set(),
+        seed=seed,
+        name=f"{size}x{size}/{per_team}v{per_team}",
+        size=size,
+    )
+
+
+def _frame_ms(frames: List[Dict[str, Any]], leaf: str) -> float:
+    return sum(f["total_ms"] for f in frames if f["stack"].split(";")[-1] == leaf)
+
+
+def _frame_calls(frames: List[Dict[str, Any]], leaf: str) -> int:
+    return sum(f["calls"] for f in frames if f["stack"].split(";")[-1] == leaf)
+
+
+def run_case(size: int, per_team: int, ticks: int, seed: int = 0) -> Dict[str, Any]:
+    """Один прогон; возвращает строку отчёта (всё «на тик» — среднее по прогону)."""
+    template = synthetic_scenario(size, per_team, seed)
+    state = template.instantiate()
+    agents = (NearestEnemyAgent("A"), NearestEnemyAgent("B"))
+    view = StateView(state)
+    # каждый прогон — с холодным кэшем flow field, чтобы строки были сравнимы
+    flow_field_cache_clear()
+
+    started = time.perf_counter()
+    with profiling(TickProfiler()) as prof:
+        prof.scenario = template.name
+        for _ in range(ticks):
+            intents = {}
+            for agent in agents:
+                intents.update(agent.act(view))
+            state, _, over = event_tick(state, intents)
+            if over:
+                break
+    wall = time.perf_counter() - started
+
+    report = prof.summary()[template.name]
+    frames, n = report["frames"], max(report["ticks"], 1)
+    tick_ms = _frame_ms(frames, "tick")
+    return {
+        "size": size,
+        "units": per_team,
+        "ticks": report["ticks"],
+        "wall_s": round(wall, 3),
+        "tick_ms": round(tick_ms / n, 3),
+        "intents_ms": round(_frame_ms(frames, "intents") / n, 3),
+        "execute_ms": round(_frame_ms(frames, "execute") / n, 3),
+        "find_path_ms": round(_frame_ms(frames, "find_path") / n, 3),
+        "find_path_calls": round(_frame_calls(frames, "find_path") / n, 2),
+        "flow_fields": round(flow_field_cache_info().misses / n, 2),
+    }
+
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    cols = ("size", "units", "ticks", "tick_ms", "intents_ms", "execute_ms",
+            "find_path_ms", "find_path_calls", "flow_fields")
+    print("  ".join(f"{c:>15}" for c in cols))
+    for row in rows:
+        print("  ".join(f"{row[c]:>15}" for c in cols))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Стороны досок")
+    parser.add_argument("--units", type=int, nargs="+", default=list(DEFAULT_UNITS),
+                        help="Юнитов на команду")
+    parser.add_argument("--ticks", type=int, default=30, help="Тиков на прогон")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH",
+                        help="Сохранить строки отчёта в JSON")
+    args = parser.parse_args()
+    RTS_Logger.set_global_level("NONE")
+
+    rows = []
+    for size in args.sizes:
+        for per_team in args.units:
+            try:
+                rows.append(run_case(size, per_team, args.ticks, args.seed))
+            except ValueError as e:
+                print(f"skip {size}x{size}/{per_team}: {e}", file=sys.stderr)
+    _print_table(rows)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()